@@ -25,7 +25,7 @@ async def create_education(
     """Create education entry."""
     data = education_data.copy()
     data["user_id"] = current_user["user_id"]
-    result = supabase.table("education").insert(data).execute()
+    result = await supabase.table("education").insert(data).execute()
     return result.data[0] if result.data else None
 
 
@@ -37,7 +37,7 @@ async def list_education(
     supabase=Depends(get_supabase_client),
 ):
     """List all education entries."""
-    result = (
+    result = await (
         supabase.table("education")
         .select("*")
         .eq("user_id", current_user["user_id"])
@@ -55,7 +55,7 @@ async def get_education(
     supabase=Depends(get_supabase_client),
 ):
     """Get education entry."""
-    result = (
+    result = await (
         supabase.table("education")
         .select("*")
         .eq("id", str(education_id))
@@ -77,7 +77,7 @@ async def update_education(
     supabase=Depends(get_supabase_client),
 ):
     """Update education entry."""
-    result = (
+    result = await (
         supabase.table("education")
         .update(education_data)
         .eq("id", str(education_id))
@@ -98,7 +98,7 @@ async def delete_education(
     supabase=Depends(get_supabase_client),
 ):
     """Delete education entry."""
-    result = (
+    result = await (
         supabase.table("education")
         .delete()
         .eq("id", str(education_id))
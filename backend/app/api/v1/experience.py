@@ -9,6 +9,7 @@ from slowapi.util import get_remote_address
 
 from app.auth.dependencies import get_current_user
 from app.core.db import get_supabase_client
+from app.core.worker import enqueue_embedding
 
 router = APIRouter()
 limiter = Limiter(key_func=get_remote_address)
@@ -25,7 +26,7 @@ async def create_experience(
     """Create experience entry."""
     data = experience_data.copy()
     data["user_id"] = current_user["user_id"]
-    result = supabase.table("experience").insert(data).execute()
+    result = await supabase.table("experience").insert(data).execute()
     return result.data[0] if result.data else None
 
 
@@ -37,7 +38,7 @@ async def list_experience(
     supabase=Depends(get_supabase_client),
 ):
     """List all experience entries."""
-    result = (
+    result = await (
         supabase.table("experience")
         .select("*")
         .eq("user_id", current_user["user_id"])
@@ -56,7 +57,7 @@ async def get_experience(
     supabase=Depends(get_supabase_client),
 ):
     """Get experience entry."""
-    result = (
+    result = await (
         supabase.table("experience")
         .select("*")
         .eq("id", str(experience_id))
@@ -78,7 +79,7 @@ async def update_experience(
     supabase=Depends(get_supabase_client),
 ):
     """Update experience entry."""
-    result = (
+    result = await (
         supabase.table("experience")
         .update(experience_data)
         .eq("id", str(experience_id))
@@ -99,7 +100,7 @@ async def delete_experience(
     supabase=Depends(get_supabase_client),
 ):
     """Delete experience entry."""
-    result = (
+    result = await (
         supabase.table("experience")
         .delete()
         .eq("id", str(experience_id))
@@ -109,3 +110,70 @@ async def delete_experience(
     if not result.data:
         raise HTTPException(status_code=404, detail="Experience not found")
 
+
+@router.post("/{experience_id}/bullets", status_code=status.HTTP_201_CREATED)
+@limiter.limit("100/minute")
+async def create_experience_bullet(
+    request: Request,
+    experience_id: UUID,
+    bullet_data: dict,
+    current_user: dict = Depends(get_current_user),
+    supabase=Depends(get_supabase_client),
+):
+    """Create an experience bullet and enqueue its embedding."""
+    data = bullet_data.copy()
+    data["experience_id"] = str(experience_id)
+    data["user_id"] = current_user["user_id"]
+    result = await supabase.table("experience_bullet").insert(data).execute()
+    if not result.data:
+        return None
+    enqueue_embedding("experience_bullet", result.data[0]["id"])
+    return result.data[0]
+
+
+@router.put("/{experience_id}/bullets/{bullet_id}")
+@limiter.limit("100/minute")
+async def update_experience_bullet(
+    request: Request,
+    experience_id: UUID,
+    bullet_id: UUID,
+    bullet_data: dict,
+    current_user: dict = Depends(get_current_user),
+    supabase=Depends(get_supabase_client),
+):
+    """Update an experience bullet, re-embedding it when its text changes."""
+    result = await (
+        supabase.table("experience_bullet")
+        .update(bullet_data)
+        .eq("id", str(bullet_id))
+        .eq("experience_id", str(experience_id))
+        .eq("user_id", current_user["user_id"])
+        .execute()
+    )
+    if not result.data:
+        raise HTTPException(status_code=404, detail="Experience bullet not found")
+    if "bullet" in bullet_data:
+        enqueue_embedding("experience_bullet", bullet_id)
+    return result.data[0]
+
+
+@router.delete("/{experience_id}/bullets/{bullet_id}", status_code=status.HTTP_204_NO_CONTENT)
+@limiter.limit("100/minute")
+async def delete_experience_bullet(
+    request: Request,
+    experience_id: UUID,
+    bullet_id: UUID,
+    current_user: dict = Depends(get_current_user),
+    supabase=Depends(get_supabase_client),
+):
+    """Delete an experience bullet."""
+    result = await (
+        supabase.table("experience_bullet")
+        .delete()
+        .eq("id", str(bullet_id))
+        .eq("experience_id", str(experience_id))
+        .eq("user_id", current_user["user_id"])
+        .execute()
+    )
+    if not result.data:
+        raise HTTPException(status_code=404, detail="Experience bullet not found")
@@ -3,19 +3,13 @@
 from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
 from app.auth.dependencies import get_current_user
 from app.core.db import get_supabase_client
-
-# Import embedding task (optional - worker may not be available)
-try:
-    from worker.app.tasks.embeddings import generate_embedding_for_jd
-except ImportError:
-    # Fallback for when worker is not installed
-    generate_embedding_for_jd = None
+from app.core.worker import enqueue_embedding
 
 router = APIRouter()
 limiter = Limiter(key_func=get_remote_address)
@@ -26,19 +20,17 @@ limiter = Limiter(key_func=get_remote_address)
 async def create_job_description(
     request: Request,
     jd_data: dict,
-    background_tasks: BackgroundTasks,
     current_user: dict = Depends(get_current_user),
     supabase=Depends(get_supabase_client),
 ):
     """Create job description and enqueue embedding generation."""
     data = jd_data.copy()
     data["user_id"] = current_user["user_id"]
-    result = supabase.table("job_description").insert(data).execute()
+    result = await supabase.table("job_description").insert(data).execute()
     if result.data:
         jd_id = result.data[0]["id"]
-        # Enqueue embedding generation (if worker is available)
-        if generate_embedding_for_jd is not None:
-            background_tasks.add_task(generate_embedding_for_jd, str(jd_id))
+        # Enqueue embedding generation on the worker (if available)
+        enqueue_embedding("job_description", jd_id)
         return result.data[0]
     return None
 
@@ -51,7 +43,7 @@ async def list_job_descriptions(
     supabase=Depends(get_supabase_client),
 ):
     """List all job descriptions."""
-    result = (
+    result = await (
         supabase.table("job_description")
         .select("*")
         .eq("user_id", current_user["user_id"])
@@ -70,7 +62,7 @@ async def get_job_description(
     supabase=Depends(get_supabase_client),
 ):
     """Get job description."""
-    result = (
+    result = await (
         supabase.table("job_description")
         .select("*")
         .eq("id", str(jd_id))
@@ -9,6 +9,7 @@ from slowapi.util import get_remote_address
 
 from app.auth.dependencies import get_current_user
 from app.core.db import get_supabase_client
+from app.core.worker import enqueue_embedding
 
 router = APIRouter()
 limiter = Limiter(key_func=get_remote_address)
@@ -25,7 +26,7 @@ async def create_project(
     """Create project entry."""
     data = project_data.copy()
     data["user_id"] = current_user["user_id"]
-    result = supabase.table("project").insert(data).execute()
+    result = await supabase.table("project").insert(data).execute()
     return result.data[0] if result.data else None
 
 
@@ -37,7 +38,7 @@ async def list_projects(
     supabase=Depends(get_supabase_client),
 ):
     """List all projects."""
-    result = (
+    result = await (
         supabase.table("project")
         .select("*")
         .eq("user_id", current_user["user_id"])
@@ -55,7 +56,7 @@ async def get_project(
     supabase=Depends(get_supabase_client),
 ):
     """Get project entry."""
-    result = (
+    result = await (
         supabase.table("project")
         .select("*")
         .eq("id", str(project_id))
@@ -77,7 +78,7 @@ async def update_project(
     supabase=Depends(get_supabase_client),
 ):
     """Update project entry."""
-    result = (
+    result = await (
         supabase.table("project")
         .update(project_data)
         .eq("id", str(project_id))
@@ -98,7 +99,7 @@ async def delete_project(
     supabase=Depends(get_supabase_client),
 ):
     """Delete project entry."""
-    result = (
+    result = await (
         supabase.table("project")
         .delete()
         .eq("id", str(project_id))
@@ -108,3 +109,70 @@ async def delete_project(
     if not result.data:
         raise HTTPException(status_code=404, detail="Project not found")
 
+
+@router.post("/{project_id}/bullets", status_code=status.HTTP_201_CREATED)
+@limiter.limit("100/minute")
+async def create_project_bullet(
+    request: Request,
+    project_id: UUID,
+    bullet_data: dict,
+    current_user: dict = Depends(get_current_user),
+    supabase=Depends(get_supabase_client),
+):
+    """Create a project bullet and enqueue its embedding."""
+    data = bullet_data.copy()
+    data["project_id"] = str(project_id)
+    data["user_id"] = current_user["user_id"]
+    result = await supabase.table("project_bullet").insert(data).execute()
+    if not result.data:
+        return None
+    enqueue_embedding("project_bullet", result.data[0]["id"])
+    return result.data[0]
+
+
+@router.put("/{project_id}/bullets/{bullet_id}")
+@limiter.limit("100/minute")
+async def update_project_bullet(
+    request: Request,
+    project_id: UUID,
+    bullet_id: UUID,
+    bullet_data: dict,
+    current_user: dict = Depends(get_current_user),
+    supabase=Depends(get_supabase_client),
+):
+    """Update a project bullet, re-embedding it when its text changes."""
+    result = await (
+        supabase.table("project_bullet")
+        .update(bullet_data)
+        .eq("id", str(bullet_id))
+        .eq("project_id", str(project_id))
+        .eq("user_id", current_user["user_id"])
+        .execute()
+    )
+    if not result.data:
+        raise HTTPException(status_code=404, detail="Project bullet not found")
+    if "bullet" in bullet_data:
+        enqueue_embedding("project_bullet", bullet_id)
+    return result.data[0]
+
+
+@router.delete("/{project_id}/bullets/{bullet_id}", status_code=status.HTTP_204_NO_CONTENT)
+@limiter.limit("100/minute")
+async def delete_project_bullet(
+    request: Request,
+    project_id: UUID,
+    bullet_id: UUID,
+    current_user: dict = Depends(get_current_user),
+    supabase=Depends(get_supabase_client),
+):
+    """Delete a project bullet."""
+    result = await (
+        supabase.table("project_bullet")
+        .delete()
+        .eq("id", str(bullet_id))
+        .eq("project_id", str(project_id))
+        .eq("user_id", current_user["user_id"])
+        .execute()
+    )
+    if not result.data:
+        raise HTTPException(status_code=404, detail="Project bullet not found")
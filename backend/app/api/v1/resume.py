@@ -1,35 +1,126 @@
 """Resume generation endpoints."""
 
+import asyncio
+import base64
+import binascii
 import json
-from typing import List
-from uuid import UUID
+import time
+from collections import Counter
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Tuple
+from uuid import UUID, uuid4
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from limits import parse
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
-from app.auth.dependencies import get_current_user
+from app.auth.dependencies import get_current_user, get_stream_user
+from app.auth.stream_token import create_stream_token
 from app.core.config import settings
 from app.core.db import get_supabase_client
+from app.core.redis import get_redis_client
 from app.services.profile import ProfileService
+from shared.app.constants import RESUME_EVENTS_CHANNEL, GenerationStatus
 from shared.app.schemas.resume_request import (
+    ResumeBatchGenerateRequest,
+    ResumeBatchGenerateResponse,
+    ResumeBatchItem,
+    ResumeBatchStatusResponse,
     ResumeGenerateRequest,
     ResumeGenerateResponse,
+    ResumeListResponse,
+    ResumeStatus,
+    ResumeStatusEvent,
 )
 
 # Import Celery app (will be available at runtime)
 try:
+    from celery import group
+
     from worker.app.celery_app import celery_app
 except ImportError:
     # Fallback for when worker is not installed
     celery_app = None
 
+GENERATE_RESUME_TASK = "worker.app.tasks.generate_resume.generate_resume"
+TERMINAL_STATUSES = {GenerationStatus.DONE, GenerationStatus.FAILED}
+
+# Large JSONB/text columns of generated_resume, only selected on request (?fields=)
+RESUME_HEAVY_COLUMNS = (
+    "profile_snapshot",
+    "jd_snapshot",
+    "ai_output_json",
+    "ai_warnings",
+    "token_usage",
+)
+RESUME_STATUS_COLUMNS = tuple(
+    name for name in ResumeStatus.model_fields if name not in RESUME_HEAVY_COLUMNS
+)
+
 router = APIRouter()
 limiter = Limiter(key_func=get_remote_address)
 
+# Single and batch generation draw from one hourly budget, charged per resume
+GENERATE_RATE_LIMIT = f"{settings.RATE_LIMIT_GENERATE_PER_HOUR}/hour"
+GENERATE_RATE_LIMIT_SCOPE = "generate"
+
+
+def _charge_generate_limit(request: Request, count: int) -> None:
+    """
+    Charge ``count`` generations against the caller's hourly generation budget.
+
+    Raises:
+        HTTPException: 429 if fewer than ``count`` generations remain
+    """
+    if not limiter.enabled:
+        return
+    item = parse(GENERATE_RATE_LIMIT)
+    identifiers = (get_remote_address(request), GENERATE_RATE_LIMIT_SCOPE)
+    if not limiter.limiter.test(item, *identifiers, cost=count) or not limiter.limiter.hit(
+        item, *identifiers, cost=count
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=f"Rate limit exceeded: {GENERATE_RATE_LIMIT}",
+        )
+
+
+async def _get_template_id(supabase, template_name: str) -> str:
+    """Resolve a template name to its ID."""
+    template_result = await (
+        supabase.table("resume_template")
+        .select("id")
+        .eq("name", template_name)
+        .execute()
+    )
+    if not template_result.data:
+        raise HTTPException(status_code=404, detail="Template not found")
+    return str(template_result.data[0]["id"])
+
+
+def _aggregate_status(statuses: List[str]) -> str:
+    """
+    Combine per-resume statuses into a batch status.
+
+    Returns QUEUED until work starts, RUNNING while any resume is unfinished,
+    then DONE, FAILED, or PARTIAL when only some resumes failed.
+    """
+    pending = {GenerationStatus.QUEUED.value, GenerationStatus.RUNNING.value}
+    if all(s == GenerationStatus.QUEUED.value for s in statuses):
+        return GenerationStatus.QUEUED.value
+    if any(s in pending for s in statuses):
+        return GenerationStatus.RUNNING.value
+    if all(s == GenerationStatus.DONE.value for s in statuses):
+        return GenerationStatus.DONE.value
+    if all(s == GenerationStatus.FAILED.value for s in statuses):
+        return GenerationStatus.FAILED.value
+    return "PARTIAL"
+
 
 @router.post("/generate", response_model=ResumeGenerateResponse)
-@limiter.limit(f"{settings.RATE_LIMIT_GENERATE_PER_HOUR}/hour")
+@limiter.shared_limit(GENERATE_RATE_LIMIT, scope=GENERATE_RATE_LIMIT_SCOPE)
 async def generate_resume(
     request: Request,
     generate_request: ResumeGenerateRequest,
@@ -43,10 +134,12 @@ async def generate_resume(
     """
     user_id = current_user["user_id"]
 
-    # Get profile and all related data
+    # Snapshot profile and all related data in one query
     profile_service = ProfileService(supabase, user_id)
-    profile = await profile_service.get_profile(UUID(generate_request.profile_id))
-    if not profile:
+    profile_snapshot = await profile_service.get_profile_snapshot(
+        UUID(generate_request.profile_id)
+    )
+    if not profile_snapshot:
         raise HTTPException(status_code=404, detail="Profile not found")
 
     # Get job description
@@ -54,9 +147,9 @@ async def generate_resume(
     jd_id = generate_request.job_description_id
 
     if jd_id:
-        jd_result = (
+        jd_result = await (
             supabase.table("job_description")
-            .select("*")
+            .select("raw_text")
             .eq("id", str(jd_id))
             .eq("user_id", user_id)
             .execute()
@@ -70,55 +163,17 @@ async def generate_resume(
             status_code=400, detail="Job description text or ID required"
         )
 
-    # Get template
-    template_result = (
-        supabase.table("resume_template")
-        .select("*")
-        .eq("name", generate_request.template_id)
-        .execute()
-    )
-    if not template_result.data:
-        raise HTTPException(status_code=404, detail="Template not found")
-    template_id = template_result.data[0]["id"]
-
-    # Snapshot profile data (get all related entities)
-    profile_snapshot = {
-        "profile": profile.dict(),
-        "education": (
-            supabase.table("education")
-            .select("*, education_highlight(*)")
-            .eq("profile_id", generate_request.profile_id)
-            .execute()
-        ).data,
-        "experience": (
-            supabase.table("experience")
-            .select("*, experience_bullet(*)")
-            .eq("profile_id", generate_request.profile_id)
-            .execute()
-        ).data,
-        "projects": (
-            supabase.table("project")
-            .select("*, project_bullet(*), project_link(*), project_tech(*)")
-            .eq("profile_id", generate_request.profile_id)
-            .execute()
-        ).data,
-        "skills": (
-            supabase.table("skill_category")
-            .select("*, skill_item(*)")
-            .eq("profile_id", generate_request.profile_id)
-            .execute()
-        ).data,
-    }
+    template_id = await _get_template_id(supabase, generate_request.template_id)
 
     # Create generated_resume record
-    gen_resume_result = (
+    gen_resume_result = await (
         supabase.table("generated_resume")
         .insert(
             {
                 "user_id": user_id,
                 "profile_id": generate_request.profile_id,
                 "job_description_id": str(jd_id) if jd_id else None,
-                "template_id": str(template_id),
+                "template_id": template_id,
                 "status": "QUEUED",
                 "page_count": generate_request.page_count,
                 "include_projects": generate_request.include_projects,
@@ -140,8 +195,9 @@ async def generate_resume(
     # Enqueue Celery task
     if celery_app:
         celery_app.send_task(
-            "worker.app.tasks.generate_resume.generate_resume",
+            GENERATE_RESUME_TASK,
             args=[str(generated_resume_id)],
+            kwargs={"bypass_ai_cache": generate_request.bypass_cache},
         )
     else:
         # Fallback: could use Redis directly or raise error
@@ -156,25 +212,334 @@ async def generate_resume(
     )
 
 
-@router.get("/{resume_id}")
+@router.post("/generate/batch", response_model=ResumeBatchGenerateResponse)
+async def generate_resume_batch(
+    request: Request,
+    batch_request: ResumeBatchGenerateRequest,
+    current_user: dict = Depends(get_current_user),
+    supabase=Depends(get_supabase_client),
+):
+    """
+    Generate one resume per job description from a single profile.
+
+    The profile is snapshotted once, all generated_resume rows are created
+    with one bulk insert, and the generation tasks are dispatched as a Celery
+    group. Poll GET /resumes/batches/{batch_id} for aggregated status; it
+    reads the rows, so it is accurate in every worker mode. The group's own
+    result is not: with WORKER_ASYNC_MODE each task returns once its
+    generation is scheduled, so the group completes before any resume is done.
+    Every job description counts against the hourly generation limit.
+    """
+    user_id = current_user["user_id"]
+
+    jd_ids = [str(jd_id) for jd_id in batch_request.job_description_ids]
+    jd_count = len(jd_ids) + len(batch_request.job_description_texts)
+    if not jd_count:
+        raise HTTPException(
+            status_code=400, detail="Job description texts or IDs required"
+        )
+    if jd_count > settings.GENERATE_BATCH_MAX_SIZE:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {settings.GENERATE_BATCH_MAX_SIZE} job descriptions per batch",
+        )
+    if not all(text.strip() for text in batch_request.job_description_texts):
+        raise HTTPException(status_code=400, detail="Job description text cannot be empty")
+    # Before any row is inserted or the limit charged, so nothing is left QUEUED forever
+    if not celery_app:
+        raise HTTPException(status_code=500, detail="Worker not available")
+
+    profile_service = ProfileService(supabase, user_id)
+    profile_snapshot = await profile_service.get_profile_snapshot(
+        UUID(batch_request.profile_id)
+    )
+    if not profile_snapshot:
+        raise HTTPException(status_code=404, detail="Profile not found")
+
+    # (job_description_id, jd_snapshot) per resume, in request order
+    jobs = []
+    if jd_ids:
+        jd_result = await (
+            supabase.table("job_description")
+            .select("id, raw_text")
+            .in_("id", jd_ids)
+            .eq("user_id", user_id)
+            .execute()
+        )
+        jd_texts = {str(row["id"]): row["raw_text"] for row in jd_result.data or []}
+        missing = [jd_id for jd_id in jd_ids if jd_id not in jd_texts]
+        if missing:
+            raise HTTPException(
+                status_code=404, detail=f"Job description not found: {missing[0]}"
+            )
+        jobs.extend((jd_id, jd_texts[jd_id]) for jd_id in jd_ids)
+    jobs.extend((None, text) for text in batch_request.job_description_texts)
+
+    template_id = await _get_template_id(supabase, batch_request.template_id)
+    profile_snapshot_json = json.dumps(profile_snapshot)
+
+    _charge_generate_limit(request, len(jobs))
+
+    batch_id = str(uuid4())
+    gen_resume_result = await (
+        supabase.table("generated_resume")
+        .insert(
+            [
+                {
+                    "user_id": user_id,
+                    "profile_id": batch_request.profile_id,
+                    "job_description_id": jd_id,
+                    "template_id": template_id,
+                    "status": "QUEUED",
+                    "page_count": batch_request.page_count,
+                    "include_projects": batch_request.include_projects,
+                    "include_skills": batch_request.include_skills,
+                    "profile_snapshot": profile_snapshot_json,
+                    "jd_snapshot": jd_text,
+                    "batch_id": batch_id,
+                }
+                for jd_id, jd_text in jobs
+            ]
+        )
+        .execute()
+    )
+
+    if not gen_resume_result.data or len(gen_resume_result.data) != len(jobs):
+        raise HTTPException(
+            status_code=500, detail="Failed to create resume generation records"
+        )
+
+    generated_resume_ids = [str(row["id"]) for row in gen_resume_result.data]
+
+    group(
+        [
+            celery_app.signature(
+                GENERATE_RESUME_TASK,
+                args=[generated_resume_id],
+                kwargs={"bypass_ai_cache": batch_request.bypass_cache},
+            )
+            for generated_resume_id in generated_resume_ids
+        ]
+    ).apply_async()
+
+    return ResumeBatchGenerateResponse(
+        batch_id=batch_id,
+        generated_resume_ids=generated_resume_ids,
+        status="QUEUED",
+        message=f"{len(generated_resume_ids)} resume generations queued",
+    )
+
+
+@router.get("/batches/{batch_id}", response_model=ResumeBatchStatusResponse)
+@limiter.limit("100/minute")
+async def get_batch_status(
+    request: Request,
+    batch_id: UUID,
+    current_user: dict = Depends(get_current_user),
+    supabase=Depends(get_supabase_client),
+):
+    """Get aggregated status of a batch of resume generations."""
+    result = await (
+        supabase.table("generated_resume")
+        .select("id, job_description_id, status, failure_reason")
+        .eq("batch_id", str(batch_id))
+        .eq("user_id", current_user["user_id"])
+        .order("created_at")
+        .execute()
+    )
+    if not result.data:
+        raise HTTPException(status_code=404, detail="Batch not found")
+
+    statuses = [row["status"] for row in result.data]
+    return ResumeBatchStatusResponse(
+        batch_id=str(batch_id),
+        status=_aggregate_status(statuses),
+        counts=dict(Counter(statuses)),
+        resumes=[
+            ResumeBatchItem(
+                generated_resume_id=str(row["id"]),
+                job_description_id=(
+                    str(row["job_description_id"]) if row.get("job_description_id") else None
+                ),
+                status=row["status"],
+                failure_reason=row.get("failure_reason"),
+            )
+            for row in result.data
+        ],
+    )
+
+
+def _resume_columns(fields: Optional[str]) -> str:
+    """
+    Columns to select: the status projection plus requested heavy columns.
+
+    Raises:
+        HTTPException: 400 if a requested field is not a heavy column
+    """
+    requested = {name.strip() for name in (fields or "").split(",") if name.strip()}
+    unknown = requested.difference(RESUME_HEAVY_COLUMNS)
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}. "
+            f"Allowed: {', '.join(RESUME_HEAVY_COLUMNS)}",
+        )
+    heavy = [name for name in RESUME_HEAVY_COLUMNS if name in requested]
+    return ", ".join(RESUME_STATUS_COLUMNS + tuple(heavy))
+
+
+def _encode_cursor(row: dict) -> str:
+    """Opaque cursor pointing after ``row`` in (created_at, id) order."""
+    raw = json.dumps([row["created_at"], str(row["id"])])
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> Tuple[str, str]:
+    """
+    Decode and validate a list cursor into (created_at, id).
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    try:
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return datetime.fromisoformat(created_at).isoformat(), str(UUID(row_id))
+    except (ValueError, TypeError, binascii.Error):
+        raise HTTPException(status_code=400, detail="Invalid cursor") from None
+
+
+def _sse(event: ResumeStatusEvent) -> str:
+    """Format a status event as a Server-Sent Events message."""
+    return f"event: status\ndata: {event.model_dump_json()}\n\n"
+
+
+async def _status_event_stream(pubsub, initial: ResumeStatusEvent) -> AsyncIterator[str]:
+    """Yield the current status, then published events until the resume finishes."""
+    try:
+        yield _sse(initial)
+        if initial.status in TERMINAL_STATUSES:
+            return
+
+        deadline = time.monotonic() + settings.RESUME_EVENTS_MAX_SECONDS
+        while time.monotonic() < deadline:
+            message = await pubsub.get_message(
+                ignore_subscribe_messages=True, timeout=settings.RESUME_EVENTS_HEARTBEAT_SECONDS
+            )
+            if message is None:
+                # Comment line; keeps proxies from closing an idle stream
+                yield ": keep-alive\n\n"
+                continue
+
+            event = ResumeStatusEvent.model_validate_json(message["data"])
+            yield _sse(event)
+            if event.status in TERMINAL_STATUSES:
+                return
+    finally:
+        await pubsub.aclose()
+
+
+@router.post("/{resume_id}/events/token")
+@limiter.limit("100/minute")
+async def create_resume_events_token(
+    request: Request,
+    resume_id: UUID,
+    current_user: dict = Depends(get_current_user),
+    supabase=Depends(get_supabase_client),
+):
+    """
+    Issue a short-lived token for ``GET /resumes/{resume_id}/events``.
+
+    Browsers open the stream with ``EventSource``, which cannot send an
+    ``Authorization`` header; the token goes in its ``?token=`` instead.
+    """
+    result = await (
+        supabase.table("generated_resume")
+        .select("id")
+        .eq("id", str(resume_id))
+        .eq("user_id", current_user["user_id"])
+        .execute()
+    )
+    if not result.data:
+        raise HTTPException(status_code=404, detail="Resume not found")
+
+    return {
+        "token": create_stream_token(current_user["user_id"], str(resume_id)),
+        "expires_in": settings.EVENT_STREAM_TOKEN_TTL_SECONDS,
+    }
+
+
+@router.get("/{resume_id}/events")
+@limiter.limit("100/minute")
+async def stream_resume_status(
+    request: Request,
+    resume_id: UUID,
+    current_user: dict = Depends(get_stream_user),
+    supabase=Depends(get_supabase_client),
+):
+    """
+    Stream generation status as Server-Sent Events.
+
+    Sends the current status, then every stage update published by the
+    worker, and closes once the resume is DONE or FAILED (or after
+    ``RESUME_EVENTS_MAX_SECONDS``; clients reconnect). Replaces polling
+    ``GET /resumes/{resume_id}``: one narrow query per stream instead of a
+    full-row read per poll.
+
+    Authenticated by ``?token=`` from ``POST /resumes/{resume_id}/events/token``
+    (for ``EventSource``) or by a Bearer token.
+    """
+    pubsub = get_redis_client().pubsub()
+    try:
+        # Subscribe before reading the status so no update is missed in between
+        await pubsub.subscribe(RESUME_EVENTS_CHANNEL.format(generated_resume_id=str(resume_id)))
+        result = await (
+            supabase.table("generated_resume")
+            .select("status, failure_reason")
+            .eq("id", str(resume_id))
+            .eq("user_id", current_user["user_id"])
+            .execute()
+        )
+        if not result.data:
+            raise HTTPException(status_code=404, detail="Resume not found")
+    except BaseException:
+        await pubsub.aclose()
+        raise
+
+    row = result.data[0]
+    initial = ResumeStatusEvent(
+        generated_resume_id=str(resume_id),
+        status=row["status"],
+        failure_reason=row.get("failure_reason"),
+    )
+    return StreamingResponse(
+        _status_event_stream(pubsub, initial),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/{resume_id}", response_model=ResumeStatus, response_model_exclude_unset=True)
 @limiter.limit("100/minute")
 async def get_resume_status(
     request: Request,
     resume_id: UUID,
+    fields: Optional[str] = Query(
+        None, description="Comma-separated heavy columns to include, e.g. ai_output_json"
+    ),
     current_user: dict = Depends(get_current_user),
     supabase=Depends(get_supabase_client),
 ):
-    """Get resume generation status."""
-    result = (
+    """Get resume generation status (heavy columns only with ``?fields=``)."""
+    result = await (
         supabase.table("generated_resume")
-        .select("*")
+        .select(_resume_columns(fields))
         .eq("id", str(resume_id))
         .eq("user_id", current_user["user_id"])
         .execute()
     )
     if not result.data:
         raise HTTPException(status_code=404, detail="Resume not found")
-    return result.data[0]
+    return ResumeStatus(**result.data[0])
 
 
 @router.get("/{resume_id}/files", response_model=List[dict])
@@ -187,9 +552,9 @@ async def get_resume_files(
 ):
     """Get generated files with presigned download URLs."""
     # Verify resume ownership
-    resume_result = (
+    resume_result = await (
         supabase.table("generated_resume")
-        .select("*")
+        .select("id")
         .eq("id", str(resume_id))
         .eq("user_id", current_user["user_id"])
         .execute()
@@ -198,7 +563,7 @@ async def get_resume_files(
         raise HTTPException(status_code=404, detail="Resume not found")
 
     # Get files
-    files_result = (
+    files_result = await (
         supabase.table("generated_file")
         .select("*")
         .eq("generated_resume_id", str(resume_id))
@@ -207,33 +572,53 @@ async def get_resume_files(
 
     files = files_result.data or []
 
-    # Generate presigned URLs
-    for file in files:
-        storage_key = file["storage_key"]
-        # Generate presigned URL (valid for 1 hour)
-        url_result = (
-            supabase.storage.from_("generated-resumes")
-            .create_signed_url(storage_key, 3600)
-        )
+    # Generate presigned URLs (valid for 1 hour) concurrently
+    bucket = supabase.storage.from_("generated-resumes")
+    url_results = await asyncio.gather(
+        *(bucket.create_signed_url(file["storage_key"], 3600) for file in files)
+    )
+    for file, url_result in zip(files, url_results):
         file["download_url"] = url_result.get("signedURL")
 
     return files
 
 
-@router.get("", response_model=List[dict])
+@router.get("", response_model=ResumeListResponse, response_model_exclude_unset=True)
 @limiter.limit("100/minute")
 async def list_resumes(
     request: Request,
+    limit: int = Query(20, ge=1, le=100, description="Resumes per page"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    fields: Optional[str] = Query(
+        None, description="Comma-separated heavy columns to include, e.g. ai_output_json"
+    ),
     current_user: dict = Depends(get_current_user),
     supabase=Depends(get_supabase_client),
 ):
-    """List user's generated resumes."""
-    result = (
+    """
+    List user's generated resumes, newest first.
+
+    Pages are keyset-paginated on (created_at, id), so every page costs the
+    same no matter how deep it is.
+    """
+    query = (
         supabase.table("generated_resume")
-        .select("*")
+        .select(_resume_columns(fields))
         .eq("user_id", current_user["user_id"])
-        .order("created_at", desc=True)
-        .execute()
     )
-    return result.data or []
+    if cursor:
+        created_at, row_id = _decode_cursor(cursor)
+        query = query.or_(
+            f'created_at.lt."{created_at}",'
+            f'and(created_at.eq."{created_at}",id.lt.{row_id})'
+        )
+    result = await (
+        query.order("created_at", desc=True).order("id", desc=True).limit(limit + 1).execute()
+    )
+
+    rows = result.data or []
+    return ResumeListResponse(
+        items=[ResumeStatus(**row) for row in rows[:limit]],
+        next_cursor=_encode_cursor(rows[limit - 1]) if len(rows) > limit else None,
+    )
 
@@ -25,7 +25,7 @@ async def create_skill_category(
     """Create skill category."""
     data = category_data.copy()
     data["user_id"] = current_user["user_id"]
-    result = supabase.table("skill_category").insert(data).execute()
+    result = await supabase.table("skill_category").insert(data).execute()
     return result.data[0] if result.data else None
 
 
@@ -37,7 +37,7 @@ async def list_skill_categories(
     supabase=Depends(get_supabase_client),
 ):
     """List all skill categories."""
-    result = (
+    result = await (
         supabase.table("skill_category")
         .select("*, skill_item(*)")
         .eq("user_id", current_user["user_id"])
@@ -56,7 +56,7 @@ async def delete_skill_category(
     supabase=Depends(get_supabase_client),
 ):
     """Delete skill category."""
-    result = (
+    result = await (
         supabase.table("skill_category")
         .delete()
         .eq("id", str(category_id))
@@ -2,6 +2,7 @@
 
 from .cognito import verify_cognito_token
 from .dependencies import get_current_user
+from .token_cache import VerifiedTokenCache
 
-__all__ = ["verify_cognito_token", "get_current_user"]
+__all__ = ["verify_cognito_token", "get_current_user", "VerifiedTokenCache"]
 
@@ -1,10 +1,13 @@
 """AWS Cognito JWT validation."""
 
+import asyncio
 import json
+import time
 from typing import Dict, Optional
 
 import httpx
-from jose import JWTError, jwt
+from jose import JWTError, jwk, jwt
+from jose.backends.base import Key
 from jose.utils import base64url_decode
 
 from app.core.config import settings
@@ -27,6 +30,80 @@ async def fetch_jwks() -> Dict:
         return response.json()
 
 
+def parse_jwks(jwks: Dict) -> Dict[str, Key]:
+    """Construct public key objects for every RS256 key in a JWKS document."""
+    keys: Dict[str, Key] = {}
+    for key in jwks.get("keys", []):
+        kid = key.get("kid")
+        if not kid:
+            continue
+        keys[kid] = jwk.construct(key, algorithm=key.get("alg", "RS256"))
+    return keys
+
+
+class JWKSCache:
+    """
+    In-process cache of Cognito signing keys.
+
+    Keys are parsed once per refresh and kept until the TTL expires. A token
+    carrying an unknown kid (e.g. after Cognito rotates its keys) triggers an
+    early refresh, throttled by ``min_refresh_interval`` so that forged kids
+    cannot force a JWKS fetch on every request. Concurrent refreshes are
+    collapsed into a single fetch.
+    """
+
+    def __init__(self, ttl_seconds: float, min_refresh_interval: float):
+        """Initialize an empty cache."""
+        self.ttl_seconds = ttl_seconds
+        self.min_refresh_interval = min_refresh_interval
+        self._keys: Dict[str, Key] = {}
+        self._expires_at = 0.0
+        self._refreshed_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    def _is_fresh(self, now: float) -> bool:
+        return now < self._expires_at
+
+    async def get_key(self, kid: str) -> Optional[Key]:
+        """Get the public key for a kid, refreshing the JWKS if needed."""
+        key = self._keys.get(kid)
+        if key is not None and self._is_fresh(time.monotonic()):
+            return key
+
+        async with self._lock:
+            # Another coroutine may have refreshed while we waited on the lock
+            now = time.monotonic()
+            key = self._keys.get(kid)
+            if key is not None and self._is_fresh(now):
+                return key
+
+            recently_refreshed = (
+                self._refreshed_at is not None
+                and now - self._refreshed_at < self.min_refresh_interval
+            )
+            if self._is_fresh(now) and recently_refreshed:
+                # Unknown kid but keys were just fetched; don't hammer Cognito
+                return None
+
+            self._keys = parse_jwks(await fetch_jwks())
+            self._refreshed_at = now
+            self._expires_at = now + self.ttl_seconds
+
+        return self._keys.get(kid)
+
+    def clear(self) -> None:
+        """Drop all cached keys."""
+        self._keys = {}
+        self._expires_at = 0.0
+        self._refreshed_at = None
+
+
+jwks_cache = JWKSCache(
+    ttl_seconds=settings.COGNITO_JWKS_CACHE_TTL_SECONDS,
+    min_refresh_interval=settings.COGNITO_JWKS_MIN_REFRESH_SECONDS,
+)
+
+
 def get_kid_from_token(token: str) -> Optional[str]:
     """Extract kid (key ID) from JWT header."""
     try:
@@ -36,14 +113,6 @@ def get_kid_from_token(token: str) -> Optional[str]:
         return None
 
 
-def get_public_key(jwks: Dict, kid: str) -> Optional[str]:
-    """Get public key from JWKS by kid."""
-    for key in jwks.get("keys", []):
-        if key.get("kid") == kid:
-            return key
-    return None
-
-
 async def verify_cognito_token(token: str) -> Dict:
     """
     Verify and decode Cognito JWT token.
@@ -66,16 +135,13 @@ async def verify_cognito_token(token: str) -> Dict:
         }
 
     try:
-        # Fetch JWKS
-        jwks = await fetch_jwks()
-
         # Get kid from token
         kid = get_kid_from_token(token)
         if not kid:
             raise CognitoTokenError("Token missing kid in header")
 
-        # Get public key
-        public_key = get_public_key(jwks, kid)
+        # Get public key (cached JWKS)
+        public_key = await jwks_cache.get_key(kid)
         if not public_key:
             raise CognitoTokenError(f"Public key not found for kid: {kid}")
 
@@ -1,13 +1,19 @@
 """FastAPI dependencies for authentication."""
 
-from typing import Annotated, Dict
+from typing import Annotated, Dict, Optional
+from uuid import UUID
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from app.auth.cognito import CognitoTokenError, verify_cognito_token
+from app.auth.stream_token import StreamTokenError, verify_stream_token
+from app.auth.token_cache import VerifiedTokenCache
+from app.core.config import settings
 
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
+token_cache = VerifiedTokenCache(max_size=settings.AUTH_TOKEN_CACHE_SIZE)
 
 
 async def get_current_user(
@@ -25,7 +31,10 @@ async def get_current_user(
     token = credentials.credentials
 
     try:
-        decoded = await verify_cognito_token(token)
+        decoded = token_cache.get(token)
+        if decoded is None:
+            decoded = await verify_cognito_token(token)
+            token_cache.set(token, decoded)
         user_id = decoded.get("sub")
         if not user_id:
             raise HTTPException(
@@ -45,3 +54,34 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         ) from e
 
+
+async def get_stream_user(
+    resume_id: UUID,
+    credentials: Annotated[Optional[HTTPAuthorizationCredentials], Depends(optional_security)],
+    token: Optional[str] = Query(None, description="Token from POST /resumes/{id}/events/token"),
+) -> Dict[str, str]:
+    """
+    Get the user opening a resume status stream.
+
+    Accepts a stream token in the query string (browsers' ``EventSource``
+    cannot set headers) or, for other clients, a regular Bearer token.
+
+    Raises:
+        HTTPException: If neither credential is present and valid
+    """
+    if token is not None:
+        try:
+            return {"user_id": verify_stream_token(token, str(resume_id))}
+        except StreamTokenError as e:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail=f"Invalid stream token: {e}",
+            ) from e
+
+    if credentials is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return await get_current_user(credentials)
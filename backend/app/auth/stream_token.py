@@ -0,0 +1,50 @@
+"""Short-lived tokens for opening resume status streams."""
+
+import time
+
+from jose import JWTError, jwt
+
+from app.core.config import settings
+
+ALGORITHM = "HS256"
+
+
+class StreamTokenError(Exception):
+    """Raised when a stream token is invalid, expired or for another resume."""
+
+
+def create_stream_token(user_id: str, resume_id: str) -> str:
+    """
+    Sign a token that opens the status stream of one resume.
+
+    A browser ``EventSource`` cannot send an ``Authorization`` header, so the
+    stream accepts this token as a query parameter instead. It is bound to a
+    single resume and expires after ``EVENT_STREAM_TOKEN_TTL_SECONDS``, which
+    keeps a token leaked through access logs close to useless.
+    """
+    claims = {
+        "sub": user_id,
+        "resume_id": resume_id,
+        "exp": int(time.time()) + settings.EVENT_STREAM_TOKEN_TTL_SECONDS,
+    }
+    return jwt.encode(claims, settings.EVENT_STREAM_TOKEN_SECRET, algorithm=ALGORITHM)
+
+
+def verify_stream_token(token: str, resume_id: str) -> str:
+    """
+    Verify a stream token for ``resume_id``.
+
+    Returns:
+        The user id the token was issued to
+
+    Raises:
+        StreamTokenError: If the signature, expiry or resume id does not match
+    """
+    try:
+        claims = jwt.decode(token, settings.EVENT_STREAM_TOKEN_SECRET, algorithms=[ALGORITHM])
+    except JWTError as e:
+        raise StreamTokenError(str(e)) from e
+
+    if claims.get("resume_id") != resume_id or not claims.get("sub"):
+        raise StreamTokenError("Token is not valid for this resume")
+    return claims["sub"]
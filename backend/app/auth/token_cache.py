@@ -0,0 +1,82 @@
+"""Cache of verified access tokens."""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+
+class VerifiedTokenCache:
+    """
+    Bounded LRU cache of decoded token claims.
+
+    Entries are keyed on the SHA-256 of the raw token (never the token itself)
+    and live until the token's ``exp`` claim, so a cached token can never
+    outlive its own validity.
+    """
+
+    def __init__(self, max_size: int):
+        """Initialize an empty cache holding at most ``max_size`` tokens."""
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @staticmethod
+    def _key(token: str) -> str:
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def get(self, token: str) -> Optional[Dict]:
+        """Get cached claims for a token, or None if absent or expired."""
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, claims = entry
+        if time.time() >= expires_at:
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return claims
+
+    def set(self, token: str, claims: Dict) -> None:
+        """Cache claims for a verified token until its exp claim."""
+        if self.max_size <= 0:
+            return
+        exp = claims.get("exp")
+        if not isinstance(exp, (int, float)) or exp <= time.time():
+            return
+
+        key = self._key(token)
+        self._entries[key] = (float(exp), claims)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all cached tokens and reset counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Get cache size and hit/miss/eviction counters."""
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
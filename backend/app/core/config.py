@@ -1,6 +1,7 @@
 """Application configuration."""
 
 import os
+import secrets
 from pathlib import Path
 from typing import List
 
@@ -31,6 +32,9 @@ class Settings(BaseSettings):
     COGNITO_REGION: str = "us-east-1"
     COGNITO_JWKS_URL: str = ""
     DEV_AUTH_BYPASS: bool = False
+    COGNITO_JWKS_CACHE_TTL_SECONDS: int = 3600
+    COGNITO_JWKS_MIN_REFRESH_SECONDS: int = 30
+    AUTH_TOKEN_CACHE_SIZE: int = 10000
 
     # CORS
     CORS_ORIGINS: List[str] = ["http://localhost:3000"]
@@ -43,6 +47,19 @@ class Settings(BaseSettings):
     # Rate limiting
     RATE_LIMIT_PER_MINUTE: int = 100
     RATE_LIMIT_GENERATE_PER_HOUR: int = 10
+    GENERATE_BATCH_MAX_SIZE: int = 10
+
+    # Redis (status event streams)
+    REDIS_URL: str = "redis://localhost:6379/0"
+    RESUME_EVENTS_HEARTBEAT_SECONDS: float = 15.0
+    RESUME_EVENTS_MAX_SECONDS: int = 600
+    # Signs the short-lived query tokens EventSource uses to open a stream.
+    # Generated per process when unset; set it when running more than one.
+    EVENT_STREAM_TOKEN_SECRET: str = ""
+    EVENT_STREAM_TOKEN_TTL_SECONDS: int = 60
+
+    # Vector search
+    VECTOR_SEARCH_EF_SEARCH: int = 40
 
     model_config = SettingsConfigDict(
         extra="ignore",  # Ignore extra fields from .env (used by worker/frontend)
@@ -61,6 +78,9 @@ if not settings.COGNITO_JWKS_URL and settings.COGNITO_USER_POOL_ID:
         f"{settings.COGNITO_USER_POOL_ID}/.well-known/jwks.json"
     )
 
+if not settings.EVENT_STREAM_TOKEN_SECRET:
+    settings.EVENT_STREAM_TOKEN_SECRET = secrets.token_urlsafe(32)
+
 # Validate production settings
 if settings.ENVIRONMENT == "production" and settings.DEV_AUTH_BYPASS:
     raise ValueError("DEV_AUTH_BYPASS cannot be True in production")
@@ -1,26 +1,34 @@
 """Database connection and session management."""
 
-from typing import Generator
+import asyncio
 
-from supabase import Client, create_client
+from supabase import AsyncClient, acreate_client
 
 from app.core.config import settings
 
-# Global Supabase client
-_supabase_client: Client | None = None
+# Global Supabase client (one per process, shared by all requests)
+_supabase_client: AsyncClient | None = None
+_supabase_client_lock = asyncio.Lock()
 
 
-def get_supabase_client() -> Client:
-    """Get or create Supabase client."""
+async def get_supabase_client() -> AsyncClient:
+    """
+    Get or create the async Supabase client.
+
+    Queries are awaited (``await query.execute()``), so PostgREST round trips
+    no longer block the event loop and one worker can serve many requests
+    concurrently over the client's pooled HTTP connections.
+    """
     global _supabase_client
     if _supabase_client is None:
-        _supabase_client = create_client(
-            settings.SUPABASE_URL, settings.SUPABASE_SERVICE_KEY
-        )
+        async with _supabase_client_lock:
+            if _supabase_client is None:
+                _supabase_client = await acreate_client(
+                    settings.SUPABASE_URL, settings.SUPABASE_SERVICE_KEY
+                )
     return _supabase_client
 
 
-def get_supabase_anon_client() -> Client:
+async def get_supabase_anon_client() -> AsyncClient:
     """Get Supabase client with anon key (for client-side operations)."""
-    return create_client(settings.SUPABASE_URL, settings.SUPABASE_ANON_KEY)
-
+    return await acreate_client(settings.SUPABASE_URL, settings.SUPABASE_ANON_KEY)
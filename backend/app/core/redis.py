@@ -0,0 +1,15 @@
+"""Shared async Redis client."""
+
+import redis.asyncio as redis
+
+from app.core.config import settings
+
+_redis_client: redis.Redis | None = None
+
+
+def get_redis_client() -> redis.Redis:
+    """Get the async Redis client used for status event streams."""
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = redis.Redis.from_url(settings.REDIS_URL)
+    return _redis_client
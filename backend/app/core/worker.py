@@ -0,0 +1,26 @@
+"""Enqueueing worker tasks from the API through the Celery broker."""
+
+# Import Celery app (will be available at runtime)
+try:
+    from worker.app.celery_app import celery_app
+except ImportError:
+    # Fallback for when worker is not installed
+    celery_app = None
+
+ENQUEUE_EMBEDDING_TASK = "worker.app.tasks.embeddings.enqueue_row_embedding"
+
+
+def enqueue_embedding(table: str, row_id: str) -> bool:
+    """
+    Ask the worker to (re-)embed a row's text.
+
+    The task only marks the row pending; the worker coalesces pending rows
+    and embeds them in batches.
+
+    Returns:
+        False if no worker is available
+    """
+    if celery_app is None:
+        return False
+    celery_app.send_task(ENQUEUE_EMBEDDING_TASK, args=[table, str(row_id)])
+    return True
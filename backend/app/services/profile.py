@@ -1,24 +1,40 @@
 """Profile service for CRUD operations."""
 
-from typing import List, Optional
-from uuid import UUID
+from collections import defaultdict
+from typing import Iterable, List, Optional
+from uuid import UUID, uuid4
 
-from supabase import Client
+from supabase import AsyncClient
 
 from shared.app.schemas.profile import (
     ContactCreate,
     ContactResponse,
+    ContactUpdate,
     ProfileCreate,
     ProfileResponse,
     ProfileUpdate,
 )
-from shared.app.utils.encryption import decrypt_contact, encrypt_contact
+from shared.app.utils.encryption import (
+    decode_encrypted_columns,
+    decrypt_contacts,
+    encode_bytea,
+    encrypt_contacts,
+)
+
+# Whole profile graph for generation snapshots, embedded via foreign keys
+PROFILE_SNAPSHOT_SELECT = (
+    "*, profile_contact(*), "
+    "education(*, education_highlight(*)), "
+    "experience(*, experience_bullet(*)), "
+    "project(*, project_bullet(*), project_link(*), project_tech(*)), "
+    "skill_category(*, skill_item(*))"
+)
 
 
 class ProfileService:
     """Service for profile operations."""
 
-    def __init__(self, supabase: Client, user_id: str):
+    def __init__(self, supabase: AsyncClient, user_id: str):
         """Initialize service with Supabase client and user ID."""
         self.supabase = supabase
         self.user_id = user_id
@@ -26,7 +42,7 @@ class ProfileService:
     async def create_profile(self, data: ProfileCreate) -> ProfileResponse:
         """Create a new profile."""
         # Insert profile
-        profile_result = (
+        profile_result = await (
             self.supabase.table("profile")
             .insert(
                 {
@@ -43,37 +59,124 @@ class ProfileService:
         if not profile_result.data:
             raise ValueError("Failed to create profile")
 
-        profile_id = profile_result.data[0]["id"]
+        profile_data = profile_result.data[0]
 
-        # Insert contacts with encryption
-        contacts = []
-        for contact in data.contacts:
-            ciphertext, nonce, auth_tag, key_version = encrypt_contact(contact.value)
-            contact_result = (
+        # Insert all contacts, encrypted in one pass, with a single request
+        contacts_data = []
+        if data.contacts:
+            contact_result = await (
                 self.supabase.table("profile_contact")
-                .insert(
-                    {
-                        "profile_id": profile_id,
-                        "user_id": self.user_id,
-                        "contact_kind": contact.contact_kind,
-                        "label": contact.label,
-                        "ciphertext": ciphertext.hex(),
-                        "nonce": nonce.hex(),
-                        "auth_tag": auth_tag.hex(),
-                        "key_version": key_version,
-                    }
-                )
+                .insert(self._encrypt_contact_rows(profile_data["id"], data.contacts))
                 .execute()
             )
-            if contact_result.data:
-                contacts.append(contact_result.data[0])
+            contacts_data = contact_result.data or []
+
+        return self._build_profile_response(profile_data, contacts_data)
+
+    def _encrypt_contact_rows(
+        self,
+        profile_id: str,
+        contacts: List[ContactCreate],
+        contact_ids: Optional[Iterable[str]] = None,
+    ) -> List[dict]:
+        """
+        Build profile_contact rows for a bulk write, encrypting all values at once.
+
+        Rows get an ``id`` only when ``contact_ids`` is given (for upserts).
+        """
+        encrypted = encrypt_contacts(contact.value for contact in contacts)
+        id_columns = (
+            [{"id": contact_id} for contact_id in contact_ids]
+            if contact_ids is not None
+            else [{}] * len(contacts)
+        )
+        return [
+            {
+                **id_column,
+                "profile_id": str(profile_id),
+                "user_id": self.user_id,
+                "contact_kind": contact.contact_kind,
+                "label": contact.label,
+                "ciphertext": encode_bytea(ciphertext),
+                "nonce": encode_bytea(nonce),
+                "auth_tag": encode_bytea(auth_tag),
+                "key_version": key_version,
+            }
+            for contact, id_column, (ciphertext, nonce, auth_tag, key_version) in zip(
+                contacts, id_columns, encrypted
+            )
+        ]
+
+    def _build_profile_responses(
+        self, profiles_data: List[dict], contacts_data: List[dict]
+    ) -> List[ProfileResponse]:
+        """Build profile responses, decrypting all of their contacts in one pass."""
+        records = []
+        for contact_data in contacts_data:
+            try:
+                records.append(
+                    (
+                        contact_data,
+                        (
+                            *decode_encrypted_columns(
+                                contact_data["ciphertext"],
+                                contact_data["nonce"],
+                                contact_data["auth_tag"],
+                            ),
+                            contact_data["key_version"],
+                        ),
+                    )
+                )
+            except Exception:
+                # Skip invalid contacts
+                continue
 
-        # Fetch complete profile
-        return await self.get_profile(profile_id)
+        try:
+            values = decrypt_contacts(record for _, record in records)
+        except ValueError:
+            values = [None] * len(records)
+
+        contacts_by_profile = defaultdict(list)
+        for (contact_data, _), value in zip(records, values):
+            if value is None:
+                # Skip contacts that fail to decrypt
+                continue
+            try:
+                contacts_by_profile[str(contact_data["profile_id"])].append(
+                    ContactResponse(
+                        id=contact_data["id"],
+                        contact_kind=contact_data["contact_kind"],
+                        label=contact_data.get("label"),
+                        value=value,
+                    )
+                )
+            except Exception:
+                continue
+
+        return [
+            ProfileResponse(
+                id=profile_data["id"],
+                user_id=profile_data["user_id"],
+                name=profile_data["name"],
+                headline=profile_data.get("headline"),
+                summary=profile_data.get("summary"),
+                location=profile_data.get("location"),
+                contacts=contacts_by_profile[str(profile_data["id"])],
+                created_at=profile_data["created_at"],
+                updated_at=profile_data["updated_at"],
+            )
+            for profile_data in profiles_data
+        ]
+
+    def _build_profile_response(
+        self, profile_data: dict, contacts_data: List[dict]
+    ) -> ProfileResponse:
+        """Build a profile response, decrypting its contacts."""
+        return self._build_profile_responses([profile_data], contacts_data)[0]
 
     async def get_profile(self, profile_id: UUID) -> Optional[ProfileResponse]:
         """Get a profile by ID."""
-        result = (
+        result = await (
             self.supabase.table("profile")
             .select("*")
             .eq("id", str(profile_id))
@@ -87,7 +190,7 @@ class ProfileService:
         profile_data = result.data[0]
 
         # Get contacts and decrypt
-        contacts_result = (
+        contacts_result = await (
             self.supabase.table("profile_contact")
             .select("*")
             .eq("profile_id", str(profile_id))
@@ -95,60 +198,97 @@ class ProfileService:
             .execute()
         )
 
-        contacts = []
-        for contact_data in contacts_result.data:
-            try:
-                ciphertext = bytes.fromhex(contact_data["ciphertext"])
-                nonce = bytes.fromhex(contact_data["nonce"])
-                auth_tag = bytes.fromhex(contact_data["auth_tag"])
-                value = decrypt_contact(
-                    ciphertext, nonce, auth_tag, contact_data["key_version"]
-                )
-                contacts.append(
-                    ContactResponse(
-                        id=contact_data["id"],
-                        contact_kind=contact_data["contact_kind"],
-                        label=contact_data.get("label"),
-                        value=value,
-                    )
-                )
-            except Exception:
-                # Skip invalid contacts
-                continue
+        return self._build_profile_response(profile_data, contacts_result.data)
+
+    async def get_profile_snapshot(self, profile_id: UUID) -> Optional[dict]:
+        """
+        Get a profile and all related entities in one round trip.
+
+        Uses a single nested PostgREST select over the profile's foreign-key
+        relationships instead of one query per table.
 
-        return ProfileResponse(
-            id=profile_data["id"],
-            user_id=profile_data["user_id"],
-            name=profile_data["name"],
-            headline=profile_data.get("headline"),
-            summary=profile_data.get("summary"),
-            location=profile_data.get("location"),
-            contacts=contacts,
-            created_at=profile_data["created_at"],
-            updated_at=profile_data["updated_at"],
+        Args:
+            profile_id: Profile ID
+
+        Returns:
+            Snapshot with ``profile`` (contacts decrypted), ``education``,
+            ``experience``, ``projects`` and ``skills``, or None if the
+            profile does not exist
+        """
+        result = await (
+            self.supabase.table("profile")
+            .select(PROFILE_SNAPSHOT_SELECT)
+            .eq("id", str(profile_id))
+            .eq("user_id", self.user_id)
+            .execute()
         )
 
+        if not result.data:
+            return None
+
+        profile_data = result.data[0]
+        contacts_data = profile_data.pop("profile_contact", None) or []
+        profile = self._build_profile_response(profile_data, contacts_data)
+
+        return {
+            "profile": profile.model_dump(mode="json"),
+            "education": profile_data.get("education") or [],
+            "experience": profile_data.get("experience") or [],
+            "projects": profile_data.get("project") or [],
+            "skills": profile_data.get("skill_category") or [],
+        }
+
     async def list_profiles(self) -> List[ProfileResponse]:
-        """List all profiles for the user."""
-        result = (
+        """
+        List all profiles for the user.
+
+        Profiles and their contacts are fetched with two queries regardless
+        of how many profiles the user has.
+        """
+        result = await (
             self.supabase.table("profile")
             .select("*")
             .eq("user_id", self.user_id)
             .execute()
         )
 
-        profiles = []
-        for profile_data in result.data:
-            profile = await self.get_profile(profile_data["id"])
-            if profile:
-                profiles.append(profile)
+        if not result.data:
+            return []
 
-        return profiles
+        contacts_result = await (
+            self.supabase.table("profile_contact")
+            .select("*")
+            .in_("profile_id", [str(profile_data["id"]) for profile_data in result.data])
+            .eq("user_id", self.user_id)
+            .execute()
+        )
+
+        return self._build_profile_responses(result.data, contacts_result.data or [])
 
     async def update_profile(
         self, profile_id: UUID, data: ProfileUpdate
     ) -> Optional[ProfileResponse]:
-        """Update a profile."""
+        """
+        Update a profile.
+
+        The profile and its contacts are read with one nested select; the
+        response is built from that read and the rows returned by the writes,
+        so nothing is fetched again afterwards. Contacts, when given, replace
+        the stored ones (see ``_sync_contacts``).
+        """
+        result = await (
+            self.supabase.table("profile")
+            .select("*, profile_contact(*)")
+            .eq("id", str(profile_id))
+            .eq("user_id", self.user_id)
+            .execute()
+        )
+        if not result.data:
+            return None
+
+        profile_data = result.data[0]
+        contacts_data = profile_data.pop("profile_contact", None) or []
+
         update_data = {}
         if data.name is not None:
             update_data["name"] = data.name
@@ -160,40 +300,92 @@ class ProfileService:
             update_data["location"] = data.location
 
         if update_data:
-            self.supabase.table("profile").update(update_data).eq(
-                "id", str(profile_id)
-            ).eq("user_id", self.user_id).execute()
+            update_result = await (
+                self.supabase.table("profile")
+                .update(update_data)
+                .eq("id", str(profile_id))
+                .eq("user_id", self.user_id)
+                .execute()
+            )
+            if update_result.data:
+                profile_data = update_result.data[0]
 
-        # Update contacts if provided
         if data.contacts is not None:
-            # Delete existing contacts
-            self.supabase.table("profile_contact").delete().eq(
-                "profile_id", str(profile_id)
-            ).eq("user_id", self.user_id).execute()
-
-            # Insert new contacts
-            for contact in data.contacts:
-                ciphertext, nonce, auth_tag, key_version = encrypt_contact(
-                    contact.value
+            contacts_data = await self._sync_contacts(profile_data, contacts_data, data.contacts)
+
+        return self._build_profile_response(profile_data, contacts_data)
+
+    async def _sync_contacts(
+        self, profile_data: dict, stored_rows: List[dict], contacts: List[ContactUpdate]
+    ) -> List[dict]:
+        """
+        Make the profile's contacts match ``contacts``, writing only the difference.
+
+        A contact matches a stored one by ``id`` or, without a known id, by
+        identical kind, label and value. Matched contacts that are unchanged
+        are left alone, new or changed ones are written with one upsert, and
+        stored contacts that were not matched are deleted with one request.
+
+        Returns:
+            profile_contact rows in the order of ``contacts``
+        """
+        profile_id = str(profile_data["id"])
+        stored = {
+            str(contact.id): contact
+            for contact in self._build_profile_response(profile_data, stored_rows).contacts
+        }
+        rows_by_id = {str(row["id"]): row for row in stored_rows}
+
+        ordered_ids = []
+        changed_ids = []
+        changed = []
+        for contact in contacts:
+            fields = (contact.contact_kind, contact.label, contact.value)
+            match = stored.pop(str(contact.id), None) if contact.id is not None else None
+            if match is None:
+                match = next(
+                    (
+                        candidate
+                        for candidate in stored.values()
+                        if (candidate.contact_kind, candidate.label, candidate.value) == fields
+                    ),
+                    None,
                 )
-                self.supabase.table("profile_contact").insert(
-                    {
-                        "profile_id": str(profile_id),
-                        "user_id": self.user_id,
-                        "contact_kind": contact.contact_kind,
-                        "label": contact.label,
-                        "ciphertext": ciphertext.hex(),
-                        "nonce": nonce.hex(),
-                        "auth_tag": auth_tag.hex(),
-                        "key_version": key_version,
-                    }
-                ).execute()
-
-        return await self.get_profile(profile_id)
+                if match is not None:
+                    del stored[str(match.id)]
+
+            if match is not None and (match.contact_kind, match.label, match.value) == fields:
+                ordered_ids.append(str(match.id))
+                continue
+            contact_id = str(match.id) if match is not None else str(uuid4())
+            ordered_ids.append(contact_id)
+            changed_ids.append(contact_id)
+            changed.append(contact)
+
+        if changed:
+            upsert_result = await (
+                self.supabase.table("profile_contact")
+                .upsert(self._encrypt_contact_rows(profile_id, changed, changed_ids))
+                .execute()
+            )
+            rows_by_id.update((str(row["id"]), row) for row in upsert_result.data or [])
+
+        kept_ids = set(ordered_ids)
+        removed_ids = [contact_id for contact_id in rows_by_id if contact_id not in kept_ids]
+        if removed_ids:
+            await (
+                self.supabase.table("profile_contact")
+                .delete()
+                .in_("id", removed_ids)
+                .eq("user_id", self.user_id)
+                .execute()
+            )
+
+        return [rows_by_id[contact_id] for contact_id in ordered_ids if contact_id in rows_by_id]
 
     async def delete_profile(self, profile_id: UUID) -> bool:
         """Delete a profile."""
-        result = (
+        result = await (
             self.supabase.table("profile")
             .delete()
             .eq("id", str(profile_id))
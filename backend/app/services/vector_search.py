@@ -1,18 +1,42 @@
 """Vector search service using pgvector."""
 
-from typing import List
+from typing import List, Optional
 
-from supabase import Client
+from supabase import AsyncClient
+
+from app.core.config import settings
 
 
 class VectorSearchService:
-    """Service for vector similarity search."""
+    """
+    Service for vector similarity search.
+
+    Searches go through the ``match_*`` SQL functions, which take the query
+    vector as a bound parameter, compute each distance once and order by it
+    so the HNSW index can serve the LIMIT.
+    """
 
-    def __init__(self, supabase: Client):
-        """Initialize service with Supabase client."""
+    def __init__(self, supabase: AsyncClient, ef_search: Optional[int] = None):
+        """Initialize service with Supabase client and HNSW ef_search."""
         self.supabase = supabase
+        self.ef_search = ef_search if ef_search is not None else settings.VECTOR_SEARCH_EF_SEARCH
+
+    async def _match(
+        self, function: str, embedding: List[float], user_id: str, limit: int
+    ) -> List[dict]:
+        """Call a ``match_*`` function and return its rows."""
+        result = await self.supabase.rpc(
+            function,
+            {
+                "p_user_id": user_id,
+                "p_query": list(embedding),
+                "p_limit": limit,
+                "p_ef_search": self.ef_search,
+            },
+        ).execute()
+        return result.data if result.data else []
 
-    def find_relevant_experiences(
+    async def find_relevant_experiences(
         self, job_description_embedding: List[float], user_id: str, limit: int = 10
     ) -> List[dict]:
         """
@@ -26,25 +50,11 @@ class VectorSearchService:
         Returns:
             List of relevant experience bullets with similarity scores
         """
-        # Use raw SQL for pgvector similarity search
-        query = f"""
-        SELECT 
-            eb.*,
-            e.company,
-            e.role,
-            1 - (eb.embedding <=> '{job_description_embedding}'::vector) as similarity
-        FROM experience_bullet eb
-        JOIN experience e ON e.id = eb.experience_id
-        WHERE eb.user_id = '{user_id}'
-          AND eb.embedding IS NOT NULL
-        ORDER BY eb.embedding <=> '{job_description_embedding}'::vector
-        LIMIT {limit}
-        """
-
-        result = self.supabase.rpc("exec_sql", {"query": query}).execute()
-        return result.data if result.data else []
+        return await self._match(
+            "match_experience_bullets", job_description_embedding, user_id, limit
+        )
 
-    def find_relevant_projects(
+    async def find_relevant_projects(
         self, job_description_embedding: List[float], user_id: str, limit: int = 5
     ) -> List[dict]:
         """
@@ -58,23 +68,9 @@ class VectorSearchService:
         Returns:
             List of relevant project bullets with similarity scores
         """
-        query = f"""
-        SELECT 
-            pb.*,
-            p.name as project_name,
-            1 - (pb.embedding <=> '{job_description_embedding}'::vector) as similarity
-        FROM project_bullet pb
-        JOIN project p ON p.id = pb.project_id
-        WHERE pb.user_id = '{user_id}'
-          AND pb.embedding IS NOT NULL
-        ORDER BY pb.embedding <=> '{job_description_embedding}'::vector
-        LIMIT {limit}
-        """
-
-        result = self.supabase.rpc("exec_sql", {"query": query}).execute()
-        return result.data if result.data else []
+        return await self._match("match_project_bullets", job_description_embedding, user_id, limit)
 
-    def find_similar_job_descriptions(
+    async def find_similar_job_descriptions(
         self, jd_embedding: List[float], user_id: str, limit: int = 5
     ) -> List[dict]:
         """
@@ -88,17 +84,4 @@ class VectorSearchService:
         Returns:
             List of similar job descriptions with similarity scores
         """
-        query = f"""
-        SELECT 
-            *,
-            1 - (embedding <=> '{jd_embedding}'::vector) as similarity
-        FROM job_description
-        WHERE user_id = '{user_id}'
-          AND embedding IS NOT NULL
-        ORDER BY embedding <=> '{jd_embedding}'::vector
-        LIMIT {limit}
-        """
-
-        result = self.supabase.rpc("exec_sql", {"query": query}).execute()
-        return result.data if result.data else []
-
+        return await self._match("match_job_descriptions", jd_embedding, user_id, limit)
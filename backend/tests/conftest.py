@@ -1,28 +1,89 @@
 """Pytest fixtures and configuration."""
 
 import os
-from unittest.mock import MagicMock
+from collections import defaultdict
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from fastapi.testclient import TestClient
 
 from app.main import create_app
+from shared.app.utils.encryption import encode_bytea, encrypt_contact, reset_keyring
 
+# Query builder methods that return the builder, so calls can be chained
+QUERY_METHODS = (
+    "table",
+    "select",
+    "insert",
+    "upsert",
+    "update",
+    "delete",
+    "eq",
+    "in_",
+    "or_",
+    "order",
+    "limit",
+    "rpc",
+)
 
-@pytest.fixture
-def mock_supabase():
-    """Mock Supabase client."""
+
+def _query_mock():
+    """Chainable async query mock whose ``execute()`` returns no rows."""
     mock = MagicMock()
-    mock.table.return_value = mock
-    mock.select.return_value = mock
-    mock.insert.return_value = mock
-    mock.update.return_value = mock
-    mock.delete.return_value = mock
-    mock.eq.return_value = mock
-    mock.execute.return_value = MagicMock(data=[])
+    for method in QUERY_METHODS:
+        getattr(mock, method).return_value = mock
+    mock.execute = AsyncMock(return_value=MagicMock(data=[]))
     return mock
 
 
+@pytest.fixture
+def mock_supabase():
+    """Mock async Supabase client (``await query.execute()``)."""
+    return _query_mock()
+
+
+@pytest.fixture
+def supabase_tables(mock_supabase):
+    """Give each table of ``mock_supabase`` its own query mock, keyed by table name."""
+    tables = defaultdict(_query_mock)
+    mock_supabase.table.side_effect = tables.__getitem__
+    return tables
+
+
+@pytest.fixture
+def encryption_key(monkeypatch):
+    """Set a test encryption key and reload the key ring."""
+    monkeypatch.setenv("ENCRYPTION_KEY", "a" * 64)
+    reset_keyring()
+    yield
+    reset_keyring()
+
+
+@pytest.fixture
+def contact_row(encryption_key):
+    """Factory for encrypted profile_contact rows as PostgREST returns them."""
+
+    def make(
+        value,
+        profile_id="11111111-1111-1111-1111-111111111111",
+        contact_id="33333333-3333-3333-3333-333333333333",
+        contact_kind="email",
+    ):
+        ciphertext, nonce, auth_tag, key_version = encrypt_contact(value)
+        return {
+            "id": contact_id,
+            "profile_id": profile_id,
+            "contact_kind": contact_kind,
+            "label": None,
+            "ciphertext": encode_bytea(ciphertext),
+            "nonce": encode_bytea(nonce),
+            "auth_tag": encode_bytea(auth_tag),
+            "key_version": key_version,
+        }
+
+    return make
+
+
 @pytest.fixture
 def mock_user():
     """Mock authenticated user."""
@@ -38,6 +99,18 @@ def client(mock_supabase):
     return TestClient(app)
 
 
+@pytest.fixture
+def api_client(mock_supabase, mock_user):
+    """Test client with auth and Supabase overridden."""
+    from app.auth.dependencies import get_current_user
+    from app.core.db import get_supabase_client
+
+    app = create_app()
+    app.dependency_overrides[get_current_user] = lambda: mock_user
+    app.dependency_overrides[get_supabase_client] = lambda: mock_supabase
+    return TestClient(app)
+
+
 @pytest.fixture
 def auth_headers():
     """Authorization headers."""
@@ -0,0 +1,50 @@
+"""Tests for experience and project bullet endpoints."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.core import worker
+
+EXPERIENCE_ID = "44444444-4444-4444-4444-444444444444"
+BULLET_ID = "55555555-5555-5555-5555-555555555555"
+
+
+@pytest.fixture
+def celery_app(monkeypatch):
+    """Celery client receiving enqueued embedding tasks."""
+    celery_app = MagicMock()
+    monkeypatch.setattr(worker, "celery_app", celery_app)
+    return celery_app
+
+
+def test_create_bullet_enqueues_embedding(api_client, mock_supabase, celery_app):
+    """Test a new bullet is queued for embedding."""
+    mock_supabase.execute.return_value = MagicMock(data=[{"id": BULLET_ID, "bullet": "Built"}])
+
+    response = api_client.post(
+        f"/api/v1/experience/{EXPERIENCE_ID}/bullets", json={"bullet": "Built"}
+    )
+
+    assert response.status_code == 201
+    assert mock_supabase.insert.call_args.args[0]["experience_id"] == EXPERIENCE_ID
+    celery_app.send_task.assert_called_once_with(
+        worker.ENQUEUE_EMBEDDING_TASK, args=["experience_bullet", BULLET_ID]
+    )
+
+
+@pytest.mark.parametrize(
+    "body,enqueued", [({"bullet": "Rewritten"}, True), ({"sort_order": 2}, False)]
+)
+def test_update_bullet_enqueues_embedding_on_text_change(
+    api_client, mock_supabase, celery_app, body, enqueued
+):
+    """Test an edited bullet is re-embedded, and a reorder is not."""
+    mock_supabase.execute.return_value = MagicMock(data=[{"id": BULLET_ID, **body}])
+
+    response = api_client.put(f"/api/v1/projects/{EXPERIENCE_ID}/bullets/{BULLET_ID}", json=body)
+
+    assert response.status_code == 200
+    assert celery_app.send_task.called is enqueued
+    if enqueued:
+        assert celery_app.send_task.call_args.kwargs["args"] == ["project_bullet", BULLET_ID]
@@ -0,0 +1,19 @@
+"""Tests for job description endpoints."""
+
+from unittest.mock import MagicMock
+
+from app.core import worker
+
+
+def test_create_job_description_enqueues_embedding(api_client, mock_supabase, monkeypatch):
+    """Test the embedding is requested from the worker through the broker."""
+    celery_app = MagicMock()
+    monkeypatch.setattr(worker, "celery_app", celery_app)
+    mock_supabase.execute.return_value = MagicMock(data=[{"id": "jd-1", "raw_text": "JD"}])
+
+    response = api_client.post("/api/v1/job-descriptions", json={"raw_text": "JD"})
+
+    assert response.status_code == 201
+    celery_app.send_task.assert_called_once_with(
+        worker.ENQUEUE_EMBEDDING_TASK, args=["job_description", "jd-1"]
+    )
@@ -0,0 +1,363 @@
+"""Tests for resume generation endpoints."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.api.v1 import resume
+from app.auth.stream_token import create_stream_token, verify_stream_token
+
+PROFILE_ID = "11111111-1111-1111-1111-111111111111"
+
+
+@pytest.fixture
+def resume_client(api_client, monkeypatch):
+    """Test client with auth and Supabase overridden and rate limits off."""
+    monkeypatch.setattr(resume.limiter, "enabled", False)
+    return api_client
+
+
+@pytest.fixture
+def profile(monkeypatch):
+    """Snapshot returned by ProfileService.get_profile_snapshot."""
+    snapshot = {
+        "profile": {"id": PROFILE_ID, "name": "Test User", "contacts": []},
+        "education": [],
+        "experience": [],
+        "projects": [],
+        "skills": [],
+    }
+    calls = []
+
+    async def get_profile_snapshot(self, profile_id):
+        calls.append(profile_id)
+        return snapshot
+
+    monkeypatch.setattr(resume.ProfileService, "get_profile_snapshot", get_profile_snapshot)
+    return calls
+
+
+def test_generate_batch_inserts_once_and_dispatches_group(
+    resume_client, supabase_tables, profile, monkeypatch
+):
+    """Test batch generation bulk-inserts one row per JD and dispatches a group."""
+    for name, data in (
+        ("job_description", [{"id": "jd-1", "raw_text": "Saved JD"}]),
+        ("resume_template", [{"id": "tpl-1"}]),
+        ("generated_resume", [{"id": "gen-1"}, {"id": "gen-2"}]),
+    ):
+        supabase_tables[name].execute.return_value = MagicMock(data=data)
+
+    celery_app = MagicMock()
+    group = MagicMock()
+    monkeypatch.setattr(resume, "celery_app", celery_app)
+    monkeypatch.setattr(resume, "group", group, raising=False)
+
+    response = resume_client.post(
+        "/api/v1/resumes/generate/batch",
+        json={
+            "profile_id": PROFILE_ID,
+            "job_description_ids": ["jd-1"],
+            "job_description_texts": ["Pasted JD"],
+        },
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["generated_resume_ids"] == ["gen-1", "gen-2"]
+    assert body["status"] == "QUEUED"
+
+    # One bulk insert sharing a single snapshot and batch id
+    supabase_tables["generated_resume"].insert.assert_called_once()
+    rows = supabase_tables["generated_resume"].insert.call_args[0][0]
+    assert [(row["job_description_id"], row["jd_snapshot"]) for row in rows] == [
+        ("jd-1", "Saved JD"),
+        (None, "Pasted JD"),
+    ]
+    assert {row["batch_id"] for row in rows} == {body["batch_id"]}
+    assert rows[0]["profile_snapshot"] == rows[1]["profile_snapshot"]
+    assert len(profile) == 1
+
+    assert celery_app.signature.call_count == 2
+    group.return_value.apply_async.assert_called_once()
+
+
+def test_generate_batch_requires_job_descriptions(resume_client, profile):
+    """Test batch generation rejects an empty batch."""
+    response = resume_client.post("/api/v1/resumes/generate/batch", json={"profile_id": PROFILE_ID})
+    assert response.status_code == 400
+
+
+def test_generate_batch_without_worker_creates_no_rows(resume_client, mock_supabase, monkeypatch):
+    """Test a batch is refused before any row is inserted when no worker is available."""
+    monkeypatch.setattr(resume, "celery_app", None)
+
+    response = resume_client.post(
+        "/api/v1/resumes/generate/batch",
+        json={"profile_id": PROFILE_ID, "job_description_texts": ["JD"]},
+    )
+
+    assert response.status_code == 500
+    mock_supabase.insert.assert_not_called()
+
+
+def test_generate_batch_charges_rate_limit_per_job_description(
+    resume_client, mock_supabase, profile, monkeypatch
+):
+    """Test each job description in a batch counts against the hourly limit."""
+    monkeypatch.setattr(resume.limiter, "enabled", True)
+    resume.limiter.reset()
+    monkeypatch.setattr(resume, "celery_app", MagicMock())
+    monkeypatch.setattr(resume, "group", MagicMock(), raising=False)
+    limit = resume.settings.RATE_LIMIT_GENERATE_PER_HOUR
+    mock_supabase.execute = AsyncMock(
+        return_value=MagicMock(data=[{"id": f"gen-{i}"} for i in range(limit)])
+    )
+
+    def generate_batch(count):
+        return resume_client.post(
+            "/api/v1/resumes/generate/batch",
+            json={"profile_id": PROFILE_ID, "job_description_texts": ["JD"] * count},
+        )
+
+    try:
+        assert generate_batch(limit).status_code == 200
+        assert generate_batch(1).status_code == 429
+    finally:
+        resume.limiter.reset()
+
+
+@pytest.mark.parametrize(
+    "statuses,expected",
+    [
+        (["QUEUED", "QUEUED"], "QUEUED"),
+        (["DONE", "QUEUED"], "RUNNING"),
+        (["DONE", "DONE"], "DONE"),
+        (["FAILED", "FAILED"], "FAILED"),
+        (["DONE", "FAILED"], "PARTIAL"),
+    ],
+)
+def test_aggregate_status(statuses, expected):
+    """Test batch status aggregation."""
+    assert resume._aggregate_status(statuses) == expected
+
+
+class FakePubSub:
+    """Redis pub/sub returning queued messages."""
+
+    def __init__(self, messages):
+        self.messages = list(messages)
+        self.channels = []
+        self.closed = False
+
+    async def subscribe(self, channel):
+        self.channels.append(channel)
+
+    async def get_message(self, ignore_subscribe_messages=True, timeout=None):
+        return self.messages.pop(0) if self.messages else None
+
+    async def aclose(self):
+        self.closed = True
+
+
+def _event(status, stage=None):
+    data = json.dumps({"generated_resume_id": PROFILE_ID, "status": status, "stage": stage})
+    return {"type": "message", "data": data.encode()}
+
+
+def _stream_events(resume_client, monkeypatch, pubsub, token=None):
+    monkeypatch.setattr(
+        resume, "get_redis_client", lambda: MagicMock(pubsub=MagicMock(return_value=pubsub))
+    )
+    token = token or create_stream_token("test-user-123", PROFILE_ID)
+    return resume_client.get(f"/api/v1/resumes/{PROFILE_ID}/events", params={"token": token})
+
+
+def test_stream_status_until_done(resume_client, mock_supabase, monkeypatch):
+    """Test the stream sends the current status, then stage events until DONE."""
+    mock_supabase.execute = AsyncMock(return_value=MagicMock(data=[{"status": "RUNNING"}]))
+    pubsub = FakePubSub([None, _event("RUNNING", "compile"), _event("DONE")])
+
+    response = _stream_events(resume_client, monkeypatch, pubsub)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = [
+        json.loads(line[len("data: ") :])
+        for line in response.text.splitlines()
+        if line.startswith("data: ")
+    ]
+    assert [(e["status"], e["stage"]) for e in events] == [
+        ("RUNNING", None),
+        ("RUNNING", "compile"),
+        ("DONE", None),
+    ]
+    assert ": keep-alive" in response.text
+    assert pubsub.channels == [f"resume-events:{PROFILE_ID}"]
+    assert pubsub.closed
+    mock_supabase.select.assert_called_with("status, failure_reason")
+
+
+def test_stream_status_finished_resume(resume_client, mock_supabase, monkeypatch):
+    """Test a finished resume gets one event and the stream closes."""
+    mock_supabase.execute = AsyncMock(
+        return_value=MagicMock(data=[{"status": "FAILED", "failure_reason": "boom"}])
+    )
+    pubsub = FakePubSub([_event("RUNNING", "ai")])
+
+    response = _stream_events(resume_client, monkeypatch, pubsub)
+
+    assert response.text.count("event: status") == 1
+    assert '"failure_reason":"boom"' in response.text
+    assert pubsub.closed
+
+
+def test_stream_status_not_found(resume_client, monkeypatch):
+    """Test streaming someone else's resume is a 404 and releases the subscription."""
+    pubsub = FakePubSub([])
+
+    response = _stream_events(resume_client, monkeypatch, pubsub)
+
+    assert response.status_code == 404
+    assert pubsub.closed
+
+
+def test_stream_status_scopes_query_to_token_user(resume_client, mock_supabase, monkeypatch):
+    """Test a stream token authenticates the stream as the user it was issued to."""
+    mock_supabase.execute = AsyncMock(return_value=MagicMock(data=[{"status": "DONE"}]))
+
+    response = _stream_events(
+        resume_client, monkeypatch, FakePubSub([]), create_stream_token("other-user", PROFILE_ID)
+    )
+
+    assert response.status_code == 200
+    mock_supabase.eq.assert_any_call("user_id", "other-user")
+
+
+@pytest.mark.parametrize(
+    "token",
+    [
+        create_stream_token("test-user-123", "22222222-2222-2222-2222-222222222222"),
+        "not-a-token",
+    ],
+    ids=["other-resume", "malformed"],
+)
+def test_stream_status_rejects_bad_token(resume_client, monkeypatch, token):
+    """Test a token for another resume, or a forged one, cannot open the stream."""
+    pubsub = FakePubSub([])
+
+    response = _stream_events(resume_client, monkeypatch, pubsub, token)
+
+    assert response.status_code == 401
+    assert pubsub.channels == []
+
+
+def test_stream_status_rejects_expired_token(resume_client, monkeypatch):
+    """Test a stream token stops working after its TTL."""
+    monkeypatch.setattr(resume.settings, "EVENT_STREAM_TOKEN_TTL_SECONDS", -1)
+    token = create_stream_token("test-user-123", PROFILE_ID)
+
+    response = _stream_events(resume_client, monkeypatch, FakePubSub([]), token)
+
+    assert response.status_code == 401
+
+
+def test_stream_status_requires_credentials(resume_client):
+    """Test the stream is closed to requests with neither a token nor a Bearer header."""
+    response = resume_client.get(f"/api/v1/resumes/{PROFILE_ID}/events")
+    assert response.status_code == 401
+
+
+def test_create_events_token(resume_client, mock_supabase):
+    """Test the token endpoint issues a token bound to an owned resume."""
+    mock_supabase.execute = AsyncMock(return_value=MagicMock(data=[{"id": PROFILE_ID}]))
+
+    response = resume_client.post(f"/api/v1/resumes/{PROFILE_ID}/events/token")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["expires_in"] == resume.settings.EVENT_STREAM_TOKEN_TTL_SECONDS
+    mock_supabase.eq.assert_any_call("user_id", "test-user-123")
+    assert verify_stream_token(body["token"], PROFILE_ID) == "test-user-123"
+
+
+def test_create_events_token_not_found(resume_client):
+    """Test no token is issued for someone else's resume."""
+    response = resume_client.post(f"/api/v1/resumes/{PROFILE_ID}/events/token")
+    assert response.status_code == 404
+
+
+def _resume_row(index, **extra):
+    return {
+        "id": f"00000000-0000-0000-0000-00000000000{index}",
+        "profile_id": PROFILE_ID,
+        "job_description_id": None,
+        "template_id": PROFILE_ID,
+        "batch_id": None,
+        "status": "DONE",
+        "page_count": 1,
+        "include_projects": True,
+        "include_skills": True,
+        "provider": "mock",
+        "model_name": "mock",
+        "prompt_version": "2",
+        "failure_reason": None,
+        "created_at": f"2026-01-0{index}T00:00:00+00:00",
+        "updated_at": f"2026-01-0{index}T00:00:00+00:00",
+        **extra,
+    }
+
+
+def test_get_resume_status_projects_light_columns(resume_client, mock_supabase):
+    """Test the status endpoint skips heavy columns unless requested."""
+    mock_supabase.execute = AsyncMock(return_value=MagicMock(data=[_resume_row(1)]))
+
+    response = resume_client.get(f"/api/v1/resumes/{PROFILE_ID}")
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "DONE"
+    assert "ai_output_json" not in response.json()
+    columns = mock_supabase.select.call_args.args[0]
+    assert "profile_snapshot" not in columns
+    assert "status" in columns
+
+
+def test_get_resume_status_expands_requested_fields(resume_client, mock_supabase):
+    """Test ?fields= adds heavy columns to the projection and response."""
+    row = _resume_row(1, ai_output_json={"experience": []})
+    mock_supabase.execute = AsyncMock(return_value=MagicMock(data=[row]))
+
+    response = resume_client.get(f"/api/v1/resumes/{PROFILE_ID}?fields=ai_output_json")
+
+    assert response.json()["ai_output_json"] == {"experience": []}
+    assert mock_supabase.select.call_args.args[0].endswith(", ai_output_json")
+
+    bad = resume_client.get(f"/api/v1/resumes/{PROFILE_ID}?fields=user_id")
+    assert bad.status_code == 400
+
+
+def test_list_resumes_keyset_pagination(resume_client, mock_supabase):
+    """Test pages are fetched with limit + 1 and continue after the cursor row."""
+    mock_supabase.execute = AsyncMock(
+        return_value=MagicMock(data=[_resume_row(3), _resume_row(2), _resume_row(1)])
+    )
+
+    first = resume_client.get("/api/v1/resumes?limit=2").json()
+
+    assert [item["id"][-1] for item in first["items"]] == ["3", "2"]
+    assert "profile_snapshot" not in first["items"][0]
+    assert first["next_cursor"]
+    mock_supabase.limit.assert_called_with(3)
+    mock_supabase.or_.assert_not_called()
+
+    mock_supabase.execute = AsyncMock(return_value=MagicMock(data=[_resume_row(1)]))
+    second = resume_client.get(f"/api/v1/resumes?limit=2&cursor={first['next_cursor']}").json()
+
+    assert [item["id"][-1] for item in second["items"]] == ["1"]
+    assert second["next_cursor"] is None
+    cursor_filter = mock_supabase.or_.call_args.args[0]
+    assert 'created_at.lt."2026-01-02T00:00:00+00:00"' in cursor_filter
+    assert "id.lt.00000000-0000-0000-0000-000000000002" in cursor_filter
+
+    assert resume_client.get("/api/v1/resumes?cursor=garbage").status_code == 400
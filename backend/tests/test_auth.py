@@ -21,3 +21,93 @@ async def test_verify_cognito_token_invalid(monkeypatch):
     with pytest.raises(CognitoTokenError):
         await verify_cognito_token("invalid-token")
 
+
+@pytest.fixture
+def rsa_jwks():
+    """JWKS document with a single freshly generated RS256 key."""
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+    from jose import jwk
+
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    public_pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+    public_jwk = jwk.construct(public_pem, algorithm="RS256").to_dict()
+    public_jwk["kid"] = "key-1"
+    return {"keys": [public_jwk]}
+
+
+@pytest.mark.asyncio
+async def test_jwks_cache_fetches_once(monkeypatch, rsa_jwks):
+    """Test cached keys are reused until the TTL expires."""
+    from app.auth import cognito
+
+    calls = []
+
+    async def fake_fetch_jwks():
+        calls.append(1)
+        return rsa_jwks
+
+    monkeypatch.setattr(cognito, "fetch_jwks", fake_fetch_jwks)
+    cache = cognito.JWKSCache(ttl_seconds=3600, min_refresh_interval=30)
+
+    first = await cache.get_key("key-1")
+    second = await cache.get_key("key-1")
+    assert first is second
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_jwks_cache_unknown_kid_refresh_is_throttled(monkeypatch, rsa_jwks):
+    """Test unknown kids refresh the JWKS at most once per interval."""
+    import asyncio
+
+    from app.auth import cognito
+
+    calls = []
+
+    async def fake_fetch_jwks():
+        calls.append(1)
+        return rsa_jwks
+
+    monkeypatch.setattr(cognito, "fetch_jwks", fake_fetch_jwks)
+    cache = cognito.JWKSCache(ttl_seconds=3600, min_refresh_interval=30)
+
+    results = await asyncio.gather(*(cache.get_key("rotated") for _ in range(5)))
+    assert results == [None] * 5
+    assert len(calls) == 1
+
+
+def test_verified_token_cache_hit_until_exp():
+    """Test cached claims are returned until the token expires."""
+    import time
+
+    from app.auth.token_cache import VerifiedTokenCache
+
+    cache = VerifiedTokenCache(max_size=10)
+    cache.set("live-token", {"sub": "user-1", "exp": time.time() + 60})
+    cache.set("expired-token", {"sub": "user-2", "exp": time.time() - 1})
+
+    assert cache.get("live-token")["sub"] == "user-1"
+    assert cache.get("expired-token") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_verified_token_cache_evicts_lru():
+    """Test least recently used tokens are evicted when full."""
+    import time
+
+    from app.auth.token_cache import VerifiedTokenCache
+
+    cache = VerifiedTokenCache(max_size=2)
+    exp = time.time() + 60
+    cache.set("a", {"sub": "a", "exp": exp})
+    cache.set("b", {"sub": "b", "exp": exp})
+    cache.get("a")
+    cache.set("c", {"sub": "c", "exp": exp})
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.stats()["evictions"] == 1
@@ -3,7 +3,7 @@
 import os
 
 import pytest
-from shared.app.utils.encryption import decrypt_contact, encrypt_contact
+from shared.app.utils.encryption import decrypt_contact, encrypt_contact, reset_keyring
 
 
 @pytest.fixture
@@ -11,8 +11,10 @@ def mock_encryption_key():
     """Set test encryption key."""
     test_key = "0" * 64
     os.environ["ENCRYPTION_KEY"] = test_key
+    reset_keyring()
     yield test_key
     os.environ.pop("ENCRYPTION_KEY", None)
+    reset_keyring()
 
 
 def test_encrypt_decrypt_contact(mock_encryption_key):
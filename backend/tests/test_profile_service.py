@@ -0,0 +1,172 @@
+"""Tests for profile service."""
+
+from unittest.mock import MagicMock
+from uuid import UUID
+
+import pytest
+
+from app.services.profile import PROFILE_SNAPSHOT_SELECT, ProfileService
+from shared.app.schemas.profile import ContactCreate, ContactUpdate, ProfileCreate, ProfileUpdate
+
+PROFILE_ID = "11111111-1111-1111-1111-111111111111"
+USER_ID = "22222222-2222-2222-2222-222222222222"
+
+
+def _profile_row(profile_id=PROFILE_ID, **extra):
+    return {
+        "id": profile_id,
+        "user_id": USER_ID,
+        "name": "Test User",
+        "created_at": "2024-01-01T00:00:00",
+        "updated_at": "2024-01-01T00:00:00",
+        **extra,
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_profile_snapshot_single_query(mock_supabase, contact_row):
+    """Test the snapshot is fetched with one nested select."""
+    mock_supabase.execute.return_value = MagicMock(
+        data=[
+            _profile_row(
+                profile_contact=[contact_row("test@example.com")],
+                education=[{"id": "ed-1", "education_highlight": []}],
+                experience=[{"id": "ex-1", "experience_bullet": [{"id": "b-1"}]}],
+                project=[{"id": "pr-1", "project_bullet": []}],
+                skill_category=[{"id": "sk-1", "skill_item": []}],
+            )
+        ]
+    )
+
+    snapshot = await ProfileService(mock_supabase, USER_ID).get_profile_snapshot(UUID(PROFILE_ID))
+
+    assert mock_supabase.execute.call_count == 1
+    mock_supabase.select.assert_called_once_with(PROFILE_SNAPSHOT_SELECT)
+    assert snapshot["profile"]["id"] == PROFILE_ID
+    assert snapshot["profile"]["contacts"][0]["value"] == "test@example.com"
+    assert "profile_contact" not in snapshot["profile"]
+    assert snapshot["experience"] == [{"id": "ex-1", "experience_bullet": [{"id": "b-1"}]}]
+    assert snapshot["projects"][0]["id"] == "pr-1"
+    assert snapshot["skills"][0]["id"] == "sk-1"
+
+
+@pytest.mark.asyncio
+async def test_get_profile_snapshot_not_found(mock_supabase):
+    """Test a missing profile returns None."""
+    snapshot = await ProfileService(mock_supabase, USER_ID).get_profile_snapshot(UUID(PROFILE_ID))
+    assert snapshot is None
+
+
+@pytest.mark.asyncio
+async def test_list_profiles_constant_query_count(mock_supabase, contact_row):
+    """Test listing profiles takes two queries however many profiles exist."""
+    profile_ids = [f"0000000{i}-0000-0000-0000-000000000000" for i in range(1, 6)]
+    contacts = [
+        contact_row(f"user{i}@example.com", profile_id, f"0000000{i}-1111-1111-1111-111111111111")
+        for i, profile_id in enumerate(profile_ids[:3], start=1)
+    ]
+    mock_supabase.execute.side_effect = [
+        MagicMock(data=[_profile_row(profile_id) for profile_id in profile_ids]),
+        MagicMock(data=contacts),
+    ]
+
+    profiles = await ProfileService(mock_supabase, USER_ID).list_profiles()
+
+    assert mock_supabase.execute.call_count == 2
+    mock_supabase.in_.assert_called_once_with("profile_id", profile_ids)
+    assert [str(profile.id) for profile in profiles] == profile_ids
+    assert [len(profile.contacts) for profile in profiles] == [1, 1, 1, 0, 0]
+    assert profiles[2].contacts[0].value == "user3@example.com"
+
+
+@pytest.mark.asyncio
+async def test_create_profile_bulk_inserts_contacts(mock_supabase, encryption_key):
+    """Test contacts are encrypted and inserted with one request."""
+    values = ["a@example.com", "555-0100", "https://example.com"]
+
+    def insert(rows):
+        if isinstance(rows, list):
+            mock_supabase.execute.return_value = MagicMock(
+                data=[
+                    {**row, "id": f"0000000{i}-1111-1111-1111-111111111111"}
+                    for i, row in enumerate(rows, start=1)
+                ]
+            )
+        else:
+            mock_supabase.execute.return_value = MagicMock(data=[_profile_row()])
+        return mock_supabase
+
+    mock_supabase.insert.side_effect = insert
+
+    profile = await ProfileService(mock_supabase, USER_ID).create_profile(
+        ProfileCreate(
+            name="Test User",
+            contacts=[ContactCreate(contact_kind="email", value=value) for value in values],
+        )
+    )
+
+    assert mock_supabase.execute.call_count == 2
+    contact_rows = mock_supabase.insert.call_args_list[1][0][0]
+    assert len(contact_rows) == 3
+    assert all(value not in str(contact_rows) for value in values)
+    assert [contact.value for contact in profile.contacts] == values
+
+
+@pytest.mark.asyncio
+async def test_update_profile_writes_only_changed_contacts(mock_supabase, contact_row):
+    """Test only new or changed contacts are upserted and only dropped ones deleted."""
+    kept_id, changed_id, removed_id = (f"0000000{i}-1111-1111-1111-111111111111" for i in (1, 2, 3))
+    mock_supabase.execute.return_value = MagicMock(
+        data=[
+            _profile_row(
+                profile_contact=[
+                    contact_row("kept@example.com", contact_id=kept_id),
+                    contact_row("old@example.com", contact_id=changed_id),
+                    contact_row("removed@example.com", contact_id=removed_id),
+                ]
+            )
+        ]
+    )
+
+    def upsert(rows):
+        mock_supabase.execute.return_value = MagicMock(data=rows)
+        return mock_supabase
+
+    mock_supabase.upsert.side_effect = upsert
+
+    profile = await ProfileService(mock_supabase, USER_ID).update_profile(
+        UUID(PROFILE_ID),
+        ProfileUpdate(
+            contacts=[
+                ContactUpdate(contact_kind="email", value="kept@example.com"),
+                ContactUpdate(id=changed_id, contact_kind="email", value="new@example.com"),
+                ContactUpdate(contact_kind="phone", value="555-0100"),
+            ]
+        ),
+    )
+
+    assert mock_supabase.execute.call_count == 3
+    mock_supabase.update.assert_not_called()
+    upserted = mock_supabase.upsert.call_args[0][0]
+    assert len(upserted) == 2
+    assert upserted[0]["id"] == changed_id
+    mock_supabase.in_.assert_called_once_with("id", [removed_id])
+    assert [contact.value for contact in profile.contacts] == [
+        "kept@example.com",
+        "new@example.com",
+        "555-0100",
+    ]
+    assert str(profile.contacts[0].id) == kept_id
+
+
+@pytest.mark.asyncio
+async def test_update_profile_not_found_writes_nothing(mock_supabase):
+    """Test updating someone else's profile returns None without writing."""
+    profile = await ProfileService(mock_supabase, USER_ID).update_profile(
+        UUID(PROFILE_ID), ProfileUpdate(name="New", contacts=[])
+    )
+
+    assert profile is None
+    assert mock_supabase.execute.call_count == 1
+    mock_supabase.update.assert_not_called()
+    mock_supabase.delete.assert_not_called()
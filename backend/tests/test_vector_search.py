@@ -0,0 +1,31 @@
+"""Tests for vector search service."""
+
+import pytest
+
+from app.services.vector_search import VectorSearchService
+
+
+@pytest.mark.asyncio
+async def test_find_relevant_experiences_uses_parameterized_function(mock_supabase):
+    """Test experience search passes the embedding as a bound parameter."""
+    mock_supabase.execute.return_value.data = [{"id": "b1", "similarity": 0.9}]
+
+    service = VectorSearchService(mock_supabase, ef_search=7)
+    rows = await service.find_relevant_experiences([0.1, 0.2], "user-1", limit=3)
+
+    assert rows == [{"id": "b1", "similarity": 0.9}]
+    mock_supabase.rpc.assert_called_once_with(
+        "match_experience_bullets",
+        {"p_user_id": "user-1", "p_query": [0.1, 0.2], "p_limit": 3, "p_ef_search": 7},
+    )
+
+
+@pytest.mark.asyncio
+async def test_find_similar_job_descriptions_empty(mock_supabase):
+    """Test search returns an empty list when nothing matches."""
+    mock_supabase.execute.return_value.data = None
+
+    service = VectorSearchService(mock_supabase)
+    assert await service.find_similar_job_descriptions([0.1], "user-1") == []
+    assert mock_supabase.rpc.call_args[0][0] == "match_job_descriptions"
+    assert mock_supabase.rpc.call_args[0][1]["p_ef_search"] == service.ef_search
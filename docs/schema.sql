@@ -97,10 +97,12 @@ CREATE TABLE experience_bullet (
   user_id           UUID NOT NULL REFERENCES app_user(id) ON DELETE CASCADE,
   bullet            TEXT NOT NULL,
   sort_order        INT NOT NULL DEFAULT 0,
-  embedding         vector(1536)  -- OpenAI text-embedding-3-small dimension
+  embedding         vector(1536),  -- OpenAI text-embedding-3-small dimension
+  embedding_text_hash TEXT           -- sha256 of (model, text) the embedding was computed from
 );
 
-CREATE INDEX idx_exp_bullet_embedding ON experience_bullet USING ivfflat (embedding vector_cosine_ops);
+CREATE INDEX idx_exp_bullet_user ON experience_bullet(user_id);
+CREATE INDEX idx_exp_bullet_embedding ON experience_bullet USING hnsw (embedding vector_cosine_ops) WITH (m = 16, ef_construction = 64);
 
 -- Project table
 CREATE TABLE project (
@@ -142,10 +144,12 @@ CREATE TABLE project_bullet (
   user_id           UUID NOT NULL REFERENCES app_user(id) ON DELETE CASCADE,
   bullet            TEXT NOT NULL,
   sort_order        INT NOT NULL DEFAULT 0,
-  embedding         vector(1536)  -- OpenAI text-embedding-3-small dimension
+  embedding         vector(1536),  -- OpenAI text-embedding-3-small dimension
+  embedding_text_hash TEXT           -- sha256 of (model, text) the embedding was computed from
 );
 
-CREATE INDEX idx_proj_bullet_embedding ON project_bullet USING ivfflat (embedding vector_cosine_ops);
+CREATE INDEX idx_proj_bullet_user ON project_bullet(user_id);
+CREATE INDEX idx_proj_bullet_embedding ON project_bullet USING hnsw (embedding vector_cosine_ops) WITH (m = 16, ef_construction = 64);
 
 -- Skill categories
 CREATE TABLE skill_category (
@@ -177,11 +181,12 @@ CREATE TABLE job_description (
   source_url        TEXT,
   company           TEXT,
   embedding         vector(1536),  -- OpenAI text-embedding-3-small dimension
+  embedding_text_hash TEXT,          -- sha256 of (model, text) the embedding was computed from
   created_at        TIMESTAMPTZ NOT NULL DEFAULT NOW()
 );
 
 CREATE INDEX idx_jd_user ON job_description(user_id);
-CREATE INDEX idx_jd_embedding ON job_description USING ivfflat (embedding vector_cosine_ops);
+CREATE INDEX idx_jd_embedding ON job_description USING hnsw (embedding vector_cosine_ops) WITH (m = 16, ef_construction = 64);
 
 -- Resume template table
 CREATE TABLE resume_template (
@@ -220,6 +225,7 @@ CREATE TABLE generated_resume (
   ai_warnings         JSONB,
   failure_reason      TEXT,
   token_usage         JSONB,
+  batch_id            UUID,               -- set when created by POST /resumes/generate/batch
   created_at          TIMESTAMPTZ NOT NULL DEFAULT NOW(),
   updated_at          TIMESTAMPTZ NOT NULL DEFAULT NOW()
 );
@@ -227,6 +233,8 @@ CREATE TABLE generated_resume (
 CREATE INDEX idx_gen_user ON generated_resume(user_id);
 CREATE INDEX idx_gen_profile ON generated_resume(profile_id);
 CREATE INDEX idx_gen_status ON generated_resume(status);
+CREATE INDEX idx_gen_user_batch ON generated_resume(user_id, batch_id) WHERE batch_id IS NOT NULL;
+CREATE INDEX idx_gen_user_created ON generated_resume(user_id, created_at DESC, id DESC);
 
 -- File type enum
 CREATE TYPE file_type AS ENUM ('LATEX','PDF','DOCX');
@@ -246,6 +254,7 @@ CREATE TABLE generated_file (
 
 CREATE INDEX idx_file_resume ON generated_file(generated_resume_id);
 CREATE INDEX idx_file_user ON generated_file(user_id);
+CREATE INDEX idx_file_user_type_sha256 ON generated_file(user_id, type, sha256) WHERE sha256 IS NOT NULL;
 
 -- Audit log table
 CREATE TABLE audit_log (
@@ -263,3 +272,211 @@ CREATE TABLE audit_log (
 CREATE INDEX idx_audit_user ON audit_log(user_id);
 CREATE INDEX idx_audit_action ON audit_log(action);
 
+
+-- Bulk embedding writes (used by the worker's embedding pipeline)
+CREATE OR REPLACE FUNCTION set_embeddings(
+  p_table text,
+  p_ids uuid[],
+  p_embeddings text[],
+  p_text_hashes text[]
+) RETURNS void
+LANGUAGE plpgsql
+AS $$
+BEGIN
+  IF p_table NOT IN ('job_description', 'experience_bullet', 'project_bullet') THEN
+    RAISE EXCEPTION 'Table % has no embedding column', p_table;
+  END IF;
+
+  EXECUTE format(
+    'UPDATE %I AS t
+        SET embedding = u.embedding::vector,
+            embedding_text_hash = u.text_hash
+       FROM unnest($1, $2, $3) AS u(id, embedding, text_hash)
+      WHERE t.id = u.id',
+    p_table
+  ) USING p_ids, p_embeddings, p_text_hashes;
+END;
+$$;
+
+
+-- Stores a finished resume's file rows and marks it DONE in one transaction
+-- (used by the generate_resume worker task).
+CREATE OR REPLACE FUNCTION complete_generated_resume(
+  p_generated_resume_id uuid,
+  p_files jsonb,
+  p_ai_output_json jsonb,
+  p_provider text,
+  p_model_name text,
+  p_prompt_version text
+) RETURNS void
+LANGUAGE plpgsql
+AS $$
+BEGIN
+  INSERT INTO generated_file (
+    generated_resume_id, user_id, type, storage_key, mime_type, size_bytes, sha256
+  )
+  SELECT r.id, r.user_id, f.type::file_type, f.storage_key, f.mime_type,
+         f.size_bytes, f.sha256
+    FROM generated_resume AS r
+   CROSS JOIN jsonb_to_recordset(p_files)
+         AS f(type text, storage_key text, mime_type text, size_bytes bigint, sha256 text)
+   WHERE r.id = p_generated_resume_id;
+
+  UPDATE generated_resume
+     SET status = 'DONE',
+         ai_output_json = p_ai_output_json,
+         provider = p_provider,
+         model_name = p_model_name,
+         prompt_version = p_prompt_version
+   WHERE id = p_generated_resume_id;
+
+  IF NOT FOUND THEN
+    RAISE EXCEPTION 'Generated resume % not found', p_generated_resume_id;
+  END IF;
+END;
+$$;
+
+-- Bulk re-encryption after a key rotation (used by the worker's key rotation task).
+-- Rows whose nonce changed since they were read are skipped.
+CREATE OR REPLACE FUNCTION reencrypt_profile_contacts(
+  p_ids uuid[],
+  p_old_nonces text[],
+  p_ciphertexts text[],
+  p_nonces text[],
+  p_auth_tags text[],
+  p_key_version int
+) RETURNS int
+LANGUAGE plpgsql
+AS $$
+DECLARE
+  updated int;
+BEGIN
+  UPDATE profile_contact AS c
+     SET ciphertext = u.ciphertext::bytea,
+         nonce = u.nonce::bytea,
+         auth_tag = u.auth_tag::bytea,
+         key_version = p_key_version
+    FROM unnest(p_ids, p_old_nonces, p_ciphertexts, p_nonces, p_auth_tags)
+         AS u(id, old_nonce, ciphertext, nonce, auth_tag)
+   WHERE c.id = u.id
+     AND c.nonce = u.old_nonce::bytea;
+  GET DIAGNOSTICS updated = ROW_COUNT;
+  RETURN updated;
+END;
+$$;
+
+-- Vector search (query vector bound once; ORDER BY distance LIMIT uses the HNSW index)
+CREATE OR REPLACE FUNCTION match_experience_bullets(
+    p_user_id uuid,
+    p_query vector(1536),
+    p_limit int DEFAULT 10,
+    p_ef_search int DEFAULT 40
+) RETURNS TABLE (
+    id uuid,
+    experience_id uuid,
+    user_id uuid,
+    bullet text,
+    sort_order int,
+    company text,
+    role text,
+    similarity double precision
+)
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    PERFORM set_config('hnsw.ef_search', greatest(p_ef_search, p_limit)::text, true);
+    IF current_setting('hnsw.iterative_scan', true) IS NOT NULL THEN
+        PERFORM set_config('hnsw.iterative_scan', 'relaxed_order', true);
+    END IF;
+    RETURN QUERY
+    SELECT m.id, m.experience_id, m.user_id, m.bullet, m.sort_order,
+           e.company, e.role, 1 - m.distance AS similarity
+      FROM (
+        SELECT eb.id, eb.experience_id, eb.user_id, eb.bullet, eb.sort_order,
+               eb.embedding <=> p_query AS distance
+          FROM experience_bullet eb
+         WHERE eb.user_id = p_user_id
+           AND eb.embedding IS NOT NULL
+         ORDER BY distance
+         LIMIT p_limit
+      ) m
+      JOIN experience e ON e.id = m.experience_id
+     ORDER BY m.distance;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION match_project_bullets(
+    p_user_id uuid,
+    p_query vector(1536),
+    p_limit int DEFAULT 5,
+    p_ef_search int DEFAULT 40
+) RETURNS TABLE (
+    id uuid,
+    project_id uuid,
+    user_id uuid,
+    bullet text,
+    sort_order int,
+    project_name text,
+    similarity double precision
+)
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    PERFORM set_config('hnsw.ef_search', greatest(p_ef_search, p_limit)::text, true);
+    IF current_setting('hnsw.iterative_scan', true) IS NOT NULL THEN
+        PERFORM set_config('hnsw.iterative_scan', 'relaxed_order', true);
+    END IF;
+    RETURN QUERY
+    SELECT m.id, m.project_id, m.user_id, m.bullet, m.sort_order,
+           p.name AS project_name, 1 - m.distance AS similarity
+      FROM (
+        SELECT pb.id, pb.project_id, pb.user_id, pb.bullet, pb.sort_order,
+               pb.embedding <=> p_query AS distance
+          FROM project_bullet pb
+         WHERE pb.user_id = p_user_id
+           AND pb.embedding IS NOT NULL
+         ORDER BY distance
+         LIMIT p_limit
+      ) m
+      JOIN project p ON p.id = m.project_id
+     ORDER BY m.distance;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION match_job_descriptions(
+    p_user_id uuid,
+    p_query vector(1536),
+    p_limit int DEFAULT 5,
+    p_ef_search int DEFAULT 40
+) RETURNS TABLE (
+    id uuid,
+    user_id uuid,
+    title text,
+    raw_text text,
+    source_url text,
+    company text,
+    created_at timestamptz,
+    similarity double precision
+)
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    PERFORM set_config('hnsw.ef_search', greatest(p_ef_search, p_limit)::text, true);
+    IF current_setting('hnsw.iterative_scan', true) IS NOT NULL THEN
+        PERFORM set_config('hnsw.iterative_scan', 'relaxed_order', true);
+    END IF;
+    RETURN QUERY
+    SELECT m.id, m.user_id, m.title, m.raw_text, m.source_url, m.company,
+           m.created_at, 1 - m.distance AS similarity
+      FROM (
+        SELECT jd.id, jd.user_id, jd.title, jd.raw_text, jd.source_url, jd.company,
+               jd.created_at, jd.embedding <=> p_query AS distance
+          FROM job_description jd
+         WHERE jd.user_id = p_user_id
+           AND jd.embedding IS NOT NULL
+         ORDER BY distance
+         LIMIT p_limit
+      ) m
+     ORDER BY m.distance;
+END;
+$$;
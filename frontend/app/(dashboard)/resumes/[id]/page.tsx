@@ -10,45 +10,95 @@ export default function ResumeStatusPage() {
   const [files, setFiles] = useState<any[]>([])
 
   useEffect(() => {
+    const apiUrl = process.env.NEXT_PUBLIC_API_URL
+    const authHeaders = () => ({
+      Authorization: `Bearer ${localStorage.getItem('token')}`,
+    })
+    let source: EventSource | null = null
+    let pollTimer: ReturnType<typeof setTimeout> | undefined
+    let streamFailures = 0
+    let cancelled = false
+
+    const fetchFiles = async () => {
+      const filesResponse = await fetch(`${apiUrl}/api/v1/resumes/${resumeId}/files`, {
+        headers: authHeaders(),
+      })
+      if (filesResponse.ok && !cancelled) {
+        setFiles(await filesResponse.json())
+      }
+    }
+
+    // Returns true once the resume is finished
+    const handleStatus = (data: any) => {
+      setStatus((previous: any) => ({ ...previous, ...data }))
+      if (data.status === 'DONE') {
+        fetchFiles().catch((error) => console.error('Error fetching files:', error))
+      }
+      return data.status === 'DONE' || data.status === 'FAILED'
+    }
+
+    // Fallback when the event stream is unavailable
     const fetchStatus = async () => {
       try {
+        const response = await fetch(`${apiUrl}/api/v1/resumes/${resumeId}`, {
+          headers: authHeaders(),
+        })
+        if (response.ok && !cancelled && !handleStatus(await response.json())) {
+          // Poll every 2 seconds
+          pollTimer = setTimeout(fetchStatus, 2000)
+        }
+      } catch (error) {
+        console.error('Error fetching status:', error)
+      }
+    }
+
+    const openStream = async () => {
+      if (typeof EventSource === 'undefined' || streamFailures >= 3) {
+        fetchStatus()
+        return
+      }
+      try {
+        // EventSource cannot send the Authorization header, so exchange it
+        // for a short-lived token passed in the query string
         const response = await fetch(
-          `${process.env.NEXT_PUBLIC_API_URL}/api/v1/resumes/${resumeId}`,
-          {
-            headers: {
-              Authorization: `Bearer ${localStorage.getItem('token')}`,
-            },
-          }
+          `${apiUrl}/api/v1/resumes/${resumeId}/events/token`,
+          { method: 'POST', headers: authHeaders() }
         )
-        if (response.ok) {
-          const data = await response.json()
-          setStatus(data)
+        if (!response.ok) {
+          throw new Error(`Stream token request failed: ${response.status}`)
+        }
+        const { token } = await response.json()
+        if (cancelled) return
 
-          if (data.status === 'DONE') {
-            // Fetch files
-            const filesResponse = await fetch(
-              `${process.env.NEXT_PUBLIC_API_URL}/api/v1/resumes/${resumeId}/files`,
-              {
-                headers: {
-                  Authorization: `Bearer ${localStorage.getItem('token')}`,
-                },
-              }
-            )
-            if (filesResponse.ok) {
-              const filesData = await filesResponse.json()
-              setFiles(filesData)
-            }
-          } else if (data.status !== 'DONE' && data.status !== 'FAILED') {
-            // Poll every 2 seconds
-            setTimeout(fetchStatus, 2000)
+        source = new EventSource(
+          `${apiUrl}/api/v1/resumes/${resumeId}/events?token=${encodeURIComponent(token)}`
+        )
+        source.addEventListener('status', (event) => {
+          streamFailures = 0
+          if (handleStatus(JSON.parse((event as MessageEvent).data))) {
+            source?.close()
           }
+        })
+        source.onerror = () => {
+          // The server ends long streams and the token expires, so reconnect
+          // with a fresh token rather than letting EventSource retry the old URL
+          source?.close()
+          streamFailures += 1
+          if (!cancelled) openStream()
         }
       } catch (error) {
-        console.error('Error fetching status:', error)
+        console.error('Error opening status stream:', error)
+        fetchStatus()
       }
     }
 
-    fetchStatus()
+    openStream()
+
+    return () => {
+      cancelled = true
+      source?.close()
+      clearTimeout(pollTimer)
+    }
   }, [resumeId])
 
   return (
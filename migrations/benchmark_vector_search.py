@@ -0,0 +1,169 @@
+"""Benchmark recall@k and latency of experience bullet vector search.
+
+Inserts synthetic users, experiences and clustered bullet embeddings inside a
+transaction, runs the ``match_experience_bullets`` function that backs
+``VectorSearchService.find_relevant_experiences`` for several ``ef_search``
+values, compares against an exact (index-free) search, and rolls back.
+
+Usage:
+    poetry run python benchmark_vector_search.py --users 20 --bullets-per-user 500
+"""
+
+import argparse
+import math
+import os
+import random
+import statistics
+import time
+from uuid import uuid4
+
+import psycopg2
+from psycopg2.extras import execute_values
+
+DIMENSION = 1536
+
+
+def get_db_connection():
+    """Get database connection from environment."""
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        raise ValueError("DATABASE_URL environment variable is required")
+    return psycopg2.connect(database_url)
+
+
+def vector_literal(embedding):
+    """Format an embedding as a pgvector text literal."""
+    return "[" + ",".join(f"{x:.6f}" for x in embedding) + "]"
+
+
+def normalize(vector):
+    """Scale a vector to unit length."""
+    norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+    return [x / norm for x in vector]
+
+
+def random_vector(rng, center=None, spread=0.3):
+    """Random unit vector, optionally near ``center``."""
+    noise = [rng.gauss(0.0, 1.0) for _ in range(DIMENSION)]
+    if center is None:
+        return normalize(noise)
+    return normalize([c + spread * n / math.sqrt(DIMENSION) for c, n in zip(center, noise)])
+
+
+def insert_synthetic_data(cur, rng, users, bullets_per_user, clusters):
+    """Insert synthetic users with clustered bullet embeddings; return (user_ids, centers)."""
+    centers = [random_vector(rng) for _ in range(clusters)]
+    user_ids = []
+    for _ in range(users):
+        user_id = str(uuid4())
+        profile_id = str(uuid4())
+        experience_id = str(uuid4())
+        user_ids.append(user_id)
+        cur.execute(
+            "INSERT INTO app_user (id, cognito_sub) VALUES (%s, %s)",
+            (user_id, f"benchmark-{user_id}"),
+        )
+        cur.execute(
+            "INSERT INTO profile (id, user_id, name) VALUES (%s, %s, %s)",
+            (profile_id, user_id, "Benchmark"),
+        )
+        cur.execute(
+            "INSERT INTO experience (id, profile_id, user_id, company, role) "
+            "VALUES (%s, %s, %s, %s, %s)",
+            (experience_id, profile_id, user_id, "Benchmark Co", "Engineer"),
+        )
+        rows = [
+            (
+                experience_id,
+                user_id,
+                f"Synthetic bullet {index}",
+                index,
+                vector_literal(random_vector(rng, rng.choice(centers))),
+            )
+            for index in range(bullets_per_user)
+        ]
+        execute_values(
+            cur,
+            "INSERT INTO experience_bullet (experience_id, user_id, bullet, sort_order, embedding) "
+            "VALUES %s",
+            rows,
+            template="(%s, %s, %s, %s, %s::vector)",
+        )
+    return user_ids, centers
+
+
+def exact_search(cur, user_id, query, k):
+    """Ground-truth top-k ids with index scans disabled."""
+    cur.execute("SET LOCAL enable_indexscan = off")
+    cur.execute(
+        "SELECT id FROM experience_bullet WHERE user_id = %s AND embedding IS NOT NULL "
+        "ORDER BY embedding <=> %s::vector LIMIT %s",
+        (user_id, query, k),
+    )
+    ids = [row[0] for row in cur.fetchall()]
+    cur.execute("SET LOCAL enable_indexscan = on")
+    return ids
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def run_benchmark(args):
+    """Run the benchmark and print one result line per ef_search value."""
+    rng = random.Random(args.seed)
+    conn = get_db_connection()
+    cur = conn.cursor()
+    try:
+        print(f"Inserting {args.users} users x {args.bullets_per_user} bullets...")
+        user_ids, centers = insert_synthetic_data(
+            cur, rng, args.users, args.bullets_per_user, args.clusters
+        )
+        cur.execute("ANALYZE experience_bullet")
+
+        queries = []
+        for _ in range(args.queries):
+            user_id = rng.choice(user_ids)
+            query = vector_literal(random_vector(rng, rng.choice(centers)))
+            queries.append((user_id, query, set(exact_search(cur, user_id, query, args.k))))
+
+        print(f"{'ef_search':>9} {'recall@' + str(args.k):>10} {'p50 ms':>8} {'p95 ms':>8}")
+        for ef_search in args.ef_search:
+            recalls = []
+            latencies = []
+            for user_id, query, expected in queries:
+                start = time.perf_counter()
+                cur.execute(
+                    "SELECT id FROM match_experience_bullets(%s, %s::vector, %s, %s)",
+                    (user_id, query, args.k, ef_search),
+                )
+                found = {row[0] for row in cur.fetchall()}
+                latencies.append((time.perf_counter() - start) * 1000)
+                recalls.append(len(found & expected) / len(expected) if expected else 1.0)
+            print(
+                f"{ef_search:>9} {statistics.mean(recalls):>10.3f} "
+                f"{percentile(latencies, 0.5):>8.2f} {percentile(latencies, 0.95):>8.2f}"
+            )
+    finally:
+        conn.rollback()
+        cur.close()
+        conn.close()
+
+
+def main():
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--bullets-per-user", type=int, default=500)
+    parser.add_argument("--clusters", type=int, default=50)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--ef-search", type=int, nargs="+", default=[20, 40, 80, 160])
+    parser.add_argument("--seed", type=int, default=42)
+    run_benchmark(parser.parse_args())
+
+
+if __name__ == "__main__":
+    main()
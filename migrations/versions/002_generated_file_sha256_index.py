@@ -0,0 +1,30 @@
+"""Index generated_file by content hash
+
+Revision ID: 002_file_sha256
+Revises: 001_initial
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '002_file_sha256'
+down_revision = '001_initial'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Lookup key for the worker's content-addressed PDF cache
+    op.create_index(
+        'idx_file_user_type_sha256',
+        'generated_file',
+        ['user_id', 'type', 'sha256'],
+        postgresql_where=sa.text('sha256 IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_file_user_type_sha256', table_name='generated_file')
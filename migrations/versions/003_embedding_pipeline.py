@@ -0,0 +1,57 @@
+"""Embedding text hashes and bulk embedding writes
+
+Revision ID: 003_embedding_pipeline
+Revises: 002_file_sha256
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '003_embedding_pipeline'
+down_revision = '002_file_sha256'
+branch_labels = None
+depends_on = None
+
+EMBEDDING_TABLES = ('job_description', 'experience_bullet', 'project_bullet')
+
+
+def upgrade() -> None:
+    # Hash of (model, text) the current embedding was computed from
+    for table in EMBEDDING_TABLES:
+        op.add_column(table, sa.Column('embedding_text_hash', sa.Text(), nullable=True))
+
+    # Bulk write of embeddings for one table in a single statement
+    op.execute("""
+        CREATE OR REPLACE FUNCTION set_embeddings(
+            p_table text,
+            p_ids uuid[],
+            p_embeddings text[],
+            p_text_hashes text[]
+        ) RETURNS void
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+            IF p_table NOT IN ('job_description', 'experience_bullet', 'project_bullet') THEN
+                RAISE EXCEPTION 'Table % has no embedding column', p_table;
+            END IF;
+
+            EXECUTE format(
+                'UPDATE %I AS t
+                    SET embedding = u.embedding::vector,
+                        embedding_text_hash = u.text_hash
+                   FROM unnest($1, $2, $3) AS u(id, embedding, text_hash)
+                  WHERE t.id = u.id',
+                p_table
+            ) USING p_ids, p_embeddings, p_text_hashes;
+        END;
+        $$;
+    """)
+
+
+def downgrade() -> None:
+    op.execute('DROP FUNCTION IF EXISTS set_embeddings(text, uuid[], text[], text[])')
+    for table in reversed(EMBEDDING_TABLES):
+        op.drop_column(table, 'embedding_text_hash')
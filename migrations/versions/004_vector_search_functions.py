@@ -0,0 +1,144 @@
+"""Parameterized vector search functions
+
+Revision ID: 004_vector_search
+Revises: 003_embedding_pipeline
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '004_vector_search'
+down_revision = '003_embedding_pipeline'
+branch_labels = None
+depends_on = None
+
+
+# The query vector is bound once as a parameter and the distance is computed
+# once in the inner select; ordering by that same expression with a LIMIT lets
+# the planner use the vector index. Probes are set per call (transaction-local).
+MATCH_EXPERIENCE_BULLETS = """
+CREATE OR REPLACE FUNCTION match_experience_bullets(
+    p_user_id uuid,
+    p_query vector(1536),
+    p_limit int DEFAULT 10,
+    p_probes int DEFAULT 10
+) RETURNS TABLE (
+    id uuid,
+    experience_id uuid,
+    user_id uuid,
+    bullet text,
+    sort_order int,
+    company text,
+    role text,
+    similarity double precision
+)
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    PERFORM set_config('ivfflat.probes', p_probes::text, true);
+    RETURN QUERY
+    SELECT m.id, m.experience_id, m.user_id, m.bullet, m.sort_order,
+           e.company, e.role, 1 - m.distance AS similarity
+      FROM (
+        SELECT eb.id, eb.experience_id, eb.user_id, eb.bullet, eb.sort_order,
+               eb.embedding <=> p_query AS distance
+          FROM experience_bullet eb
+         WHERE eb.user_id = p_user_id
+           AND eb.embedding IS NOT NULL
+         ORDER BY distance
+         LIMIT p_limit
+      ) m
+      JOIN experience e ON e.id = m.experience_id
+     ORDER BY m.distance;
+END;
+$$;
+"""
+
+MATCH_PROJECT_BULLETS = """
+CREATE OR REPLACE FUNCTION match_project_bullets(
+    p_user_id uuid,
+    p_query vector(1536),
+    p_limit int DEFAULT 5,
+    p_probes int DEFAULT 10
+) RETURNS TABLE (
+    id uuid,
+    project_id uuid,
+    user_id uuid,
+    bullet text,
+    sort_order int,
+    project_name text,
+    similarity double precision
+)
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    PERFORM set_config('ivfflat.probes', p_probes::text, true);
+    RETURN QUERY
+    SELECT m.id, m.project_id, m.user_id, m.bullet, m.sort_order,
+           p.name AS project_name, 1 - m.distance AS similarity
+      FROM (
+        SELECT pb.id, pb.project_id, pb.user_id, pb.bullet, pb.sort_order,
+               pb.embedding <=> p_query AS distance
+          FROM project_bullet pb
+         WHERE pb.user_id = p_user_id
+           AND pb.embedding IS NOT NULL
+         ORDER BY distance
+         LIMIT p_limit
+      ) m
+      JOIN project p ON p.id = m.project_id
+     ORDER BY m.distance;
+END;
+$$;
+"""
+
+MATCH_JOB_DESCRIPTIONS = """
+CREATE OR REPLACE FUNCTION match_job_descriptions(
+    p_user_id uuid,
+    p_query vector(1536),
+    p_limit int DEFAULT 5,
+    p_probes int DEFAULT 10
+) RETURNS TABLE (
+    id uuid,
+    user_id uuid,
+    title text,
+    raw_text text,
+    source_url text,
+    company text,
+    created_at timestamptz,
+    similarity double precision
+)
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    PERFORM set_config('ivfflat.probes', p_probes::text, true);
+    RETURN QUERY
+    SELECT m.id, m.user_id, m.title, m.raw_text, m.source_url, m.company,
+           m.created_at, 1 - m.distance AS similarity
+      FROM (
+        SELECT jd.id, jd.user_id, jd.title, jd.raw_text, jd.source_url, jd.company,
+               jd.created_at, jd.embedding <=> p_query AS distance
+          FROM job_description jd
+         WHERE jd.user_id = p_user_id
+           AND jd.embedding IS NOT NULL
+         ORDER BY distance
+         LIMIT p_limit
+      ) m
+     ORDER BY m.distance;
+END;
+$$;
+"""
+
+
+def upgrade() -> None:
+    op.execute(MATCH_EXPERIENCE_BULLETS)
+    op.execute(MATCH_PROJECT_BULLETS)
+    op.execute(MATCH_JOB_DESCRIPTIONS)
+
+
+def downgrade() -> None:
+    op.execute('DROP FUNCTION IF EXISTS match_job_descriptions(uuid, vector, int, int)')
+    op.execute('DROP FUNCTION IF EXISTS match_project_bullets(uuid, vector, int, int)')
+    op.execute('DROP FUNCTION IF EXISTS match_experience_bullets(uuid, vector, int, int)')
@@ -0,0 +1,199 @@
+"""HNSW vector indexes with tunable build and search parameters
+
+Revision ID: 005_hnsw_indexes
+Revises: 004_vector_search
+Create Date: 2026-10-18 00:00:00.000000
+
+Build parameters are read from the environment when the migration runs:
+VECTOR_HNSW_M (default 16) and VECTOR_HNSW_EF_CONSTRUCTION (default 64).
+"""
+import importlib.util
+import os
+from pathlib import Path
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '005_hnsw_indexes'
+down_revision = '004_vector_search'
+branch_labels = None
+depends_on = None
+
+# (table, embedding index name, user_id index name)
+VECTOR_TABLES = (
+    ('experience_bullet', 'idx_exp_bullet_embedding', 'idx_exp_bullet_user'),
+    ('project_bullet', 'idx_proj_bullet_embedding', 'idx_proj_bullet_user'),
+    ('job_description', 'idx_jd_embedding', None),  # idx_jd_user already exists
+)
+
+# ef_search is raised to at least the LIMIT, and on pgvector >= 0.8 iterative
+# scans keep walking the graph until enough rows pass the per-user filter
+# (relaxed order is fine because the outer query re-sorts by distance).
+SEARCH_SETTINGS = """
+    PERFORM set_config('hnsw.ef_search', greatest(p_ef_search, p_limit)::text, true);
+    IF current_setting('hnsw.iterative_scan', true) IS NOT NULL THEN
+        PERFORM set_config('hnsw.iterative_scan', 'relaxed_order', true);
+    END IF;
+"""
+
+MATCH_EXPERIENCE_BULLETS = """
+CREATE FUNCTION match_experience_bullets(
+    p_user_id uuid,
+    p_query vector(1536),
+    p_limit int DEFAULT 10,
+    p_ef_search int DEFAULT 40
+) RETURNS TABLE (
+    id uuid,
+    experience_id uuid,
+    user_id uuid,
+    bullet text,
+    sort_order int,
+    company text,
+    role text,
+    similarity double precision
+)
+LANGUAGE plpgsql
+AS $$
+BEGIN
+""" + SEARCH_SETTINGS + """
+    RETURN QUERY
+    SELECT m.id, m.experience_id, m.user_id, m.bullet, m.sort_order,
+           e.company, e.role, 1 - m.distance AS similarity
+      FROM (
+        SELECT eb.id, eb.experience_id, eb.user_id, eb.bullet, eb.sort_order,
+               eb.embedding <=> p_query AS distance
+          FROM experience_bullet eb
+         WHERE eb.user_id = p_user_id
+           AND eb.embedding IS NOT NULL
+         ORDER BY distance
+         LIMIT p_limit
+      ) m
+      JOIN experience e ON e.id = m.experience_id
+     ORDER BY m.distance;
+END;
+$$;
+"""
+
+MATCH_PROJECT_BULLETS = """
+CREATE FUNCTION match_project_bullets(
+    p_user_id uuid,
+    p_query vector(1536),
+    p_limit int DEFAULT 5,
+    p_ef_search int DEFAULT 40
+) RETURNS TABLE (
+    id uuid,
+    project_id uuid,
+    user_id uuid,
+    bullet text,
+    sort_order int,
+    project_name text,
+    similarity double precision
+)
+LANGUAGE plpgsql
+AS $$
+BEGIN
+""" + SEARCH_SETTINGS + """
+    RETURN QUERY
+    SELECT m.id, m.project_id, m.user_id, m.bullet, m.sort_order,
+           p.name AS project_name, 1 - m.distance AS similarity
+      FROM (
+        SELECT pb.id, pb.project_id, pb.user_id, pb.bullet, pb.sort_order,
+               pb.embedding <=> p_query AS distance
+          FROM project_bullet pb
+         WHERE pb.user_id = p_user_id
+           AND pb.embedding IS NOT NULL
+         ORDER BY distance
+         LIMIT p_limit
+      ) m
+      JOIN project p ON p.id = m.project_id
+     ORDER BY m.distance;
+END;
+$$;
+"""
+
+MATCH_JOB_DESCRIPTIONS = """
+CREATE FUNCTION match_job_descriptions(
+    p_user_id uuid,
+    p_query vector(1536),
+    p_limit int DEFAULT 5,
+    p_ef_search int DEFAULT 40
+) RETURNS TABLE (
+    id uuid,
+    user_id uuid,
+    title text,
+    raw_text text,
+    source_url text,
+    company text,
+    created_at timestamptz,
+    similarity double precision
+)
+LANGUAGE plpgsql
+AS $$
+BEGIN
+""" + SEARCH_SETTINGS + """
+    RETURN QUERY
+    SELECT m.id, m.user_id, m.title, m.raw_text, m.source_url, m.company,
+           m.created_at, 1 - m.distance AS similarity
+      FROM (
+        SELECT jd.id, jd.user_id, jd.title, jd.raw_text, jd.source_url, jd.company,
+               jd.created_at, jd.embedding <=> p_query AS distance
+          FROM job_description jd
+         WHERE jd.user_id = p_user_id
+           AND jd.embedding IS NOT NULL
+         ORDER BY distance
+         LIMIT p_limit
+      ) m
+     ORDER BY m.distance;
+END;
+$$;
+"""
+
+MATCH_FUNCTIONS = ('match_experience_bullets', 'match_project_bullets', 'match_job_descriptions')
+
+
+def _drop_match_functions() -> None:
+    for name in MATCH_FUNCTIONS:
+        op.execute(f'DROP FUNCTION IF EXISTS {name}(uuid, vector, int, int)')
+
+
+def upgrade() -> None:
+    hnsw_m = int(os.getenv('VECTOR_HNSW_M', '16'))
+    hnsw_ef_construction = int(os.getenv('VECTOR_HNSW_EF_CONSTRUCTION', '64'))
+
+    for table, embedding_index, user_index in VECTOR_TABLES:
+        op.execute(f'DROP INDEX IF EXISTS {embedding_index}')
+        op.execute(
+            f'CREATE INDEX {embedding_index} ON {table} '
+            f'USING hnsw (embedding vector_cosine_ops) '
+            f'WITH (m = {hnsw_m}, ef_construction = {hnsw_ef_construction})'
+        )
+        if user_index:
+            op.create_index(user_index, table, ['user_id'])
+
+    # Same signatures as 004, with the last argument now meaning ef_search
+    _drop_match_functions()
+    op.execute(MATCH_EXPERIENCE_BULLETS)
+    op.execute(MATCH_PROJECT_BULLETS)
+    op.execute(MATCH_JOB_DESCRIPTIONS)
+
+
+def downgrade() -> None:
+    _drop_match_functions()
+    previous = importlib.util.spec_from_file_location(
+        'vector_search_functions', Path(__file__).with_name('004_vector_search_functions.py')
+    )
+    module = importlib.util.module_from_spec(previous)
+    previous.loader.exec_module(module)
+    op.execute(module.MATCH_EXPERIENCE_BULLETS)
+    op.execute(module.MATCH_PROJECT_BULLETS)
+    op.execute(module.MATCH_JOB_DESCRIPTIONS)
+
+    for table, embedding_index, user_index in VECTOR_TABLES:
+        if user_index:
+            op.drop_index(user_index, table_name=table)
+        op.execute(f'DROP INDEX IF EXISTS {embedding_index}')
+        op.execute(
+            f'CREATE INDEX {embedding_index} ON {table} USING ivfflat (embedding vector_cosine_ops)'
+        )
@@ -0,0 +1,36 @@
+"""Group generated resumes into batches
+
+Revision ID: 006_resume_batch
+Revises: 005_hnsw_indexes
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '006_resume_batch'
+down_revision = '005_hnsw_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Set for rows created together by the batch generate endpoint
+    op.add_column(
+        'generated_resume',
+        sa.Column('batch_id', postgresql.UUID(as_uuid=True), nullable=True),
+    )
+    op.create_index(
+        'idx_gen_user_batch',
+        'generated_resume',
+        ['user_id', 'batch_id'],
+        postgresql_where=sa.text('batch_id IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_gen_user_batch', table_name='generated_resume')
+    op.drop_column('generated_resume', 'batch_id')
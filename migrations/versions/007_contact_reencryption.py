@@ -0,0 +1,56 @@
+"""Bulk re-encryption of contact fields for key rotation
+
+Revision ID: 007_contact_reencryption
+Revises: 006_resume_batch
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '007_contact_reencryption'
+down_revision = '006_resume_batch'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Writes a batch of re-encrypted contacts in one statement. A row is only
+    # updated if its nonce is unchanged since it was read, so a concurrent
+    # profile edit is never overwritten with stale data.
+    op.execute("""
+        CREATE OR REPLACE FUNCTION reencrypt_profile_contacts(
+            p_ids uuid[],
+            p_old_nonces text[],
+            p_ciphertexts text[],
+            p_nonces text[],
+            p_auth_tags text[],
+            p_key_version int
+        ) RETURNS int
+        LANGUAGE plpgsql
+        AS $$
+        DECLARE
+            updated int;
+        BEGIN
+            UPDATE profile_contact AS c
+               SET ciphertext = u.ciphertext::bytea,
+                   nonce = u.nonce::bytea,
+                   auth_tag = u.auth_tag::bytea,
+                   key_version = p_key_version
+              FROM unnest(p_ids, p_old_nonces, p_ciphertexts, p_nonces, p_auth_tags)
+                   AS u(id, old_nonce, ciphertext, nonce, auth_tag)
+             WHERE c.id = u.id
+               AND c.nonce = u.old_nonce::bytea;
+            GET DIAGNOSTICS updated = ROW_COUNT;
+            RETURN updated;
+        END;
+        $$;
+    """)
+
+
+def downgrade() -> None:
+    op.execute(
+        'DROP FUNCTION IF EXISTS reencrypt_profile_contacts(uuid[], text[], text[], text[], text[], int)'
+    )
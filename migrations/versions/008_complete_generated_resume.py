@@ -0,0 +1,63 @@
+"""Transactional completion of generated resumes
+
+Revision ID: 008_complete_resume
+Revises: 007_contact_reencryption
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '008_complete_resume'
+down_revision = '007_contact_reencryption'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Inserts the generated_file rows and marks the resume DONE atomically, so
+    # a resume is never DONE without its files (or the reverse).
+    op.execute("""
+        CREATE OR REPLACE FUNCTION complete_generated_resume(
+            p_generated_resume_id uuid,
+            p_files jsonb,
+            p_ai_output_json jsonb,
+            p_provider text,
+            p_model_name text,
+            p_prompt_version text
+        ) RETURNS void
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+            INSERT INTO generated_file (
+                generated_resume_id, user_id, type, storage_key, mime_type, size_bytes, sha256
+            )
+            SELECT r.id, r.user_id, f.type::file_type, f.storage_key, f.mime_type,
+                   f.size_bytes, f.sha256
+              FROM generated_resume AS r
+             CROSS JOIN jsonb_to_recordset(p_files)
+                   AS f(type text, storage_key text, mime_type text, size_bytes bigint, sha256 text)
+             WHERE r.id = p_generated_resume_id;
+
+            UPDATE generated_resume
+               SET status = 'DONE',
+                   ai_output_json = p_ai_output_json,
+                   provider = p_provider,
+                   model_name = p_model_name,
+                   prompt_version = p_prompt_version
+             WHERE id = p_generated_resume_id;
+
+            IF NOT FOUND THEN
+                RAISE EXCEPTION 'Generated resume % not found', p_generated_resume_id;
+            END IF;
+        END;
+        $$;
+    """)
+
+
+def downgrade() -> None:
+    op.execute(
+        'DROP FUNCTION IF EXISTS complete_generated_resume(uuid, jsonb, jsonb, text, text, text)'
+    )
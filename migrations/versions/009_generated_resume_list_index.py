@@ -0,0 +1,29 @@
+"""Keyset pagination index for listing generated resumes
+
+Revision ID: 009_resume_list_index
+Revises: 008_complete_resume
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '009_resume_list_index'
+down_revision = '008_complete_resume'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Serves GET /resumes pages (newest first, (created_at, id) cursor)
+    op.create_index(
+        'idx_gen_user_created',
+        'generated_resume',
+        ['user_id', sa.text('created_at DESC'), sa.text('id DESC')],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_gen_user_created', table_name='generated_resume')
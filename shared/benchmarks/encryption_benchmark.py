@@ -0,0 +1,70 @@
+"""Microbenchmark of per-contact encryption cost.
+
+Compares building a fresh AESGCM from ENCRYPTION_KEY on every call (the old
+per-call path) with the cached key ring, one value at a time and in bulk.
+
+Usage (from the shared directory):
+    python -m benchmarks.encryption_benchmark --contacts 1000
+"""
+
+import argparse
+import os
+import time
+
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+from shared.app.utils.encryption import get_encryption_key, get_keyring
+
+
+def _per_call_encrypt(plaintext: str):
+    """Encrypt the way the uncached path did: parse the key and build a cipher per call."""
+    aesgcm = AESGCM(get_encryption_key())
+    nonce = os.urandom(12)
+    ciphertext = aesgcm.encrypt(nonce, plaintext.encode("utf-8"), None)
+    return ciphertext[:-16], nonce, ciphertext[-16:], 1
+
+
+def _per_call_decrypt(record):
+    ciphertext, nonce, auth_tag, _ = record
+    aesgcm = AESGCM(get_encryption_key())
+    return aesgcm.decrypt(nonce, ciphertext + auth_tag, None).decode("utf-8")
+
+
+def _time_per_item(func, count: int, repeat: int) -> float:
+    """Best-of-``repeat`` microseconds per item."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best / count * 1e6
+
+
+def main():
+    """Run the benchmark and print microseconds per contact."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--contacts", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    os.environ.setdefault("ENCRYPTION_KEY", os.urandom(32).hex())
+    plaintexts = [f"user{i}@example.com" for i in range(args.contacts)]
+    keyring = get_keyring()
+    records = keyring.encrypt_many(plaintexts)
+
+    cases = [
+        ("encrypt, cipher per call", lambda: [_per_call_encrypt(p) for p in plaintexts]),
+        ("encrypt, cached key ring", lambda: [get_keyring().encrypt(p) for p in plaintexts]),
+        ("encrypt_many", lambda: keyring.encrypt_many(plaintexts)),
+        ("decrypt, cipher per call", lambda: [_per_call_decrypt(r) for r in records]),
+        ("decrypt, cached key ring", lambda: [get_keyring().decrypt(*r) for r in records]),
+        ("decrypt_many", lambda: keyring.decrypt_many(records)),
+    ]
+
+    print(f"{args.contacts} contacts, best of {args.repeat}")
+    for name, func in cases:
+        print(f"{name:<28} {_time_per_item(func, args.contacts, args.repeat):8.2f} us/contact")
+
+
+if __name__ == "__main__":
+    main()
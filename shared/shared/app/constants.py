@@ -12,6 +12,18 @@ class GenerationStatus(str, Enum):
     FAILED = "FAILED"
 
 
+class GenerationStage(str, Enum):
+    """Pipeline stage of a running generation, reported in status events."""
+
+    AI = "ai"
+    COMPILE = "compile"
+    PUBLISH = "publish"
+
+
+# Redis pub/sub channel carrying the status events of one generated resume
+RESUME_EVENTS_CHANNEL = "resume-events:{generated_resume_id}"
+
+
 class FileType(str, Enum):
     """Type of generated file."""
 
@@ -1,14 +1,31 @@
 """Pydantic schemas for validation."""
 
 from .ai_output import AIOutput, AIOutputEducation, AIOutputExperience, AIOutputProject
-from .resume_request import ResumeGenerateRequest, ResumeGenerateResponse
+from .resume_request import (
+    ResumeBatchGenerateRequest,
+    ResumeBatchGenerateResponse,
+    ResumeBatchItem,
+    ResumeBatchStatusResponse,
+    ResumeGenerateRequest,
+    ResumeGenerateResponse,
+    ResumeListResponse,
+    ResumeStatus,
+    ResumeStatusEvent,
+)
 
 __all__ = [
     "AIOutput",
     "AIOutputEducation",
     "AIOutputExperience",
     "AIOutputProject",
+    "ResumeBatchGenerateRequest",
+    "ResumeBatchGenerateResponse",
+    "ResumeBatchItem",
+    "ResumeBatchStatusResponse",
     "ResumeGenerateRequest",
     "ResumeGenerateResponse",
+    "ResumeListResponse",
+    "ResumeStatus",
+    "ResumeStatusEvent",
 ]
 
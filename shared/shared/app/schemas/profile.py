@@ -14,6 +14,12 @@ class ContactCreate(BaseModel):
     value: str = Field(..., description="Contact value (will be encrypted)")
 
 
+class ContactUpdate(ContactCreate):
+    """Contact information in a profile update; ``id`` updates an existing contact."""
+
+    id: Optional[UUID] = None
+
+
 class ContactResponse(BaseModel):
     """Contact information response (decrypted)."""
 
@@ -40,7 +46,7 @@ class ProfileUpdate(BaseModel):
     headline: Optional[str] = None
     summary: Optional[str] = None
     location: Optional[str] = None
-    contacts: Optional[List[ContactCreate]] = None
+    contacts: Optional[List[ContactUpdate]] = None
 
 
 class ProfileResponse(BaseModel):
@@ -1,20 +1,13 @@
 """Schemas for resume generation requests."""
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
 
-class ResumeGenerateRequest(BaseModel):
-    """Request to generate a resume."""
+class ResumeGenerateOptions(BaseModel):
+    """Generation options shared by single and batch requests."""
 
-    profile_id: str = Field(..., description="Profile ID to use")
-    job_description_id: Optional[str] = Field(
-        None, description="Job description ID (or provide raw_text)"
-    )
-    job_description_text: Optional[str] = Field(
-        None, description="Raw job description text (if not using saved JD)"
-    )
     template_id: str = Field(default="jakes-resume-ats", description="Template ID")
     page_count: int = Field(default=1, ge=1, le=3, description="Number of pages (1-3)")
     include_projects: bool = Field(default=True, description="Include projects section")
@@ -23,6 +16,21 @@ class ResumeGenerateRequest(BaseModel):
         default_factory=lambda: ["PDF"],
         description="Output formats: PDF, LATEX, DOCX",
     )
+    bypass_cache: bool = Field(
+        default=False, description="Force a fresh AI response instead of a cached one"
+    )
+
+
+class ResumeGenerateRequest(ResumeGenerateOptions):
+    """Request to generate a resume."""
+
+    profile_id: str = Field(..., description="Profile ID to use")
+    job_description_id: Optional[str] = Field(
+        None, description="Job description ID (or provide raw_text)"
+    )
+    job_description_text: Optional[str] = Field(
+        None, description="Raw job description text (if not using saved JD)"
+    )
 
 
 class ResumeGenerateResponse(BaseModel):
@@ -32,3 +40,90 @@ class ResumeGenerateResponse(BaseModel):
     status: str = Field(..., description="QUEUED, RUNNING, DONE, FAILED")
     message: Optional[str] = None
 
+
+class ResumeBatchGenerateRequest(ResumeGenerateOptions):
+    """Request to generate one resume per job description from a single profile."""
+
+    profile_id: str = Field(..., description="Profile ID to use")
+    job_description_ids: List[str] = Field(
+        default_factory=list, description="Saved job description IDs"
+    )
+    job_description_texts: List[str] = Field(
+        default_factory=list, description="Raw job description texts"
+    )
+
+
+class ResumeBatchGenerateResponse(BaseModel):
+    """Response from a batch resume generation request."""
+
+    batch_id: str
+    generated_resume_ids: List[str]
+    status: str = Field(..., description="QUEUED, RUNNING, DONE, FAILED, PARTIAL")
+    message: Optional[str] = None
+
+
+class ResumeBatchItem(BaseModel):
+    """Status of one resume in a batch."""
+
+    generated_resume_id: str
+    job_description_id: Optional[str] = None
+    status: str
+    failure_reason: Optional[str] = None
+
+
+class ResumeBatchStatusResponse(BaseModel):
+    """Aggregated status of a batch."""
+
+    batch_id: str
+    status: str = Field(
+        ...,
+        description="QUEUED, RUNNING, DONE, FAILED, or PARTIAL when finished with some failures",
+    )
+    counts: Dict[str, int] = Field(default_factory=dict, description="Resumes per status")
+    resumes: List[ResumeBatchItem] = Field(default_factory=list)
+
+
+class ResumeStatusEvent(BaseModel):
+    """Status update of one generated resume, pushed to clients as it happens."""
+
+    generated_resume_id: str
+    status: str = Field(..., description="QUEUED, RUNNING, DONE, FAILED")
+    stage: Optional[str] = Field(None, description="ai, compile or publish while RUNNING")
+    completed_sections: List[str] = Field(
+        default_factory=list, description="AI output sections received so far"
+    )
+    failure_reason: Optional[str] = None
+
+
+class ResumeStatus(BaseModel):
+    """Generated resume as returned by the status and list endpoints."""
+
+    id: str
+    profile_id: str
+    job_description_id: Optional[str] = None
+    template_id: str
+    batch_id: Optional[str] = None
+    status: str = Field(..., description="QUEUED, RUNNING, DONE, FAILED")
+    page_count: int
+    include_projects: bool
+    include_skills: bool
+    provider: Optional[str] = None
+    model_name: Optional[str] = None
+    prompt_version: Optional[str] = None
+    failure_reason: Optional[str] = None
+    created_at: str
+    updated_at: str
+
+    # Heavy columns, only returned when requested with ?fields=
+    profile_snapshot: Optional[Any] = None
+    jd_snapshot: Optional[str] = None
+    ai_output_json: Optional[Any] = None
+    ai_warnings: Optional[Any] = None
+    token_usage: Optional[Any] = None
+
+
+class ResumeListResponse(BaseModel):
+    """One page of generated resumes, newest first."""
+
+    items: List[ResumeStatus] = Field(default_factory=list)
+    next_cursor: Optional[str] = Field(None, description="Pass as ?cursor= for the next page")
@@ -1,7 +1,30 @@
 """Utility functions."""
 
-from .encryption import decrypt_contact, encrypt_contact
+from .encryption import (
+    KeyRing,
+    decode_bytea,
+    decode_encrypted_columns,
+    decrypt_contact,
+    decrypt_contacts,
+    encrypt_contact,
+    encode_bytea,
+    encrypt_contacts,
+    get_keyring,
+    reset_keyring,
+)
 from .latex import escape_latex
 
-__all__ = ["escape_latex", "encrypt_contact", "decrypt_contact"]
+__all__ = [
+    "escape_latex",
+    "encrypt_contact",
+    "encrypt_contacts",
+    "decrypt_contact",
+    "decrypt_contacts",
+    "KeyRing",
+    "get_keyring",
+    "reset_keyring",
+    "encode_bytea",
+    "decode_bytea",
+    "decode_encrypted_columns",
+]
 
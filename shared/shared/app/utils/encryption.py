@@ -1,10 +1,89 @@
-"""Encryption utilities for sensitive contact fields."""
+"""Encryption utilities for sensitive contact fields.
+
+Keys are configured through the environment:
+
+- ``ENCRYPTION_KEY``: 64 hex characters, key version 1
+- ``ENCRYPTION_KEYS``: additional versions as ``"2:<hex>,3:<hex>"``
+- ``ENCRYPTION_KEY_VERSION``: version used for new encryptions (defaults to
+  the highest configured version)
+
+Keys are loaded once per process. To rotate, add the new key to
+``ENCRYPTION_KEYS`` and restart; rows encrypted with older versions stay
+readable until they are re-encrypted.
+"""
 
 import os
-from typing import Tuple
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
+NONCE_SIZE = 12  # 96-bit nonce for GCM
+TAG_SIZE = 16
+
+# (ciphertext, nonce, auth_tag, key_version)
+EncryptedValue = Tuple[bytes, bytes, bytes, int]
+
+
+def encode_bytea(data: bytes) -> str:
+    """Encode bytes for a BYTEA column in PostgREST/SQL hex format (``\\x...``)."""
+    return "\\x" + data.hex()
+
+
+def decode_bytea(value: str) -> bytes:
+    """Decode a BYTEA value returned by PostgREST (``\\x...``) or a bare hex string."""
+    if value.startswith("\\x"):
+        value = value[2:]
+    return bytes.fromhex(value)
+
+
+def _is_hex_of_length(data: bytes, size: int) -> bool:
+    """Whether ``data`` is the ASCII hex encoding of ``size`` bytes."""
+    try:
+        return len(data) == 2 * size and len(bytes.fromhex(data.decode("ascii"))) == size
+    except ValueError:
+        return False
+
+
+def decode_encrypted_columns(
+    ciphertext: str, nonce: str, auth_tag: str
+) -> Tuple[bytes, bytes, bytes]:
+    """
+    Decode the ciphertext, nonce and auth tag BYTEA values of a contact row.
+
+    Rows written before values were sent as ``\\x...`` stored the ASCII of
+    their hex string, so PostgREST returns the hex of that hex. Such rows are
+    recognised by a nonce and auth tag that decode to hex text of exactly
+    ``NONCE_SIZE`` and ``TAG_SIZE`` bytes, and are hex-decoded a second time.
+    Empty values (no nonce) are returned as-is.
+
+    Returns:
+        Tuple of (ciphertext, nonce, auth_tag) bytes
+    """
+    raw_ciphertext, raw_nonce, raw_tag = (
+        decode_bytea(ciphertext),
+        decode_bytea(nonce),
+        decode_bytea(auth_tag),
+    )
+    if _is_hex_of_length(raw_nonce, NONCE_SIZE) and _is_hex_of_length(raw_tag, TAG_SIZE):
+        return (
+            bytes.fromhex(raw_ciphertext.decode("ascii")),
+            bytes.fromhex(raw_nonce.decode("ascii")),
+            bytes.fromhex(raw_tag.decode("ascii")),
+        )
+    return raw_ciphertext, raw_nonce, raw_tag
+
+
+def _parse_key(key_hex: str, name: str) -> bytes:
+    """Decode a 64-hex-character AES-256 key."""
+    if len(key_hex) != 64:  # 32 bytes = 64 hex chars
+        raise ValueError(f"{name} must be 64 hex characters (32 bytes)")
+
+    try:
+        return bytes.fromhex(key_hex)
+    except ValueError as e:
+        raise ValueError(f"{name} must be valid hex: {e}") from e
+
 
 def get_encryption_key() -> bytes:
     """
@@ -19,48 +98,175 @@ def get_encryption_key() -> bytes:
     key_hex = os.getenv("ENCRYPTION_KEY")
     if not key_hex:
         raise ValueError("ENCRYPTION_KEY environment variable is required")
+    return _parse_key(key_hex, "ENCRYPTION_KEY")
 
-    if len(key_hex) != 64:  # 32 bytes = 64 hex chars
-        raise ValueError("ENCRYPTION_KEY must be 64 hex characters (32 bytes)")
 
-    try:
-        return bytes.fromhex(key_hex)
-    except ValueError as e:
-        raise ValueError(f"ENCRYPTION_KEY must be valid hex: {e}") from e
+class KeyRing:
+    """
+    Versioned AES-256-GCM keys with one cached cipher instance per version.
+
+    New values are encrypted with ``current_version``; values are decrypted
+    with the version they were stored with.
+    """
+
+    def __init__(self, keys: Dict[int, bytes], current_version: Optional[int] = None):
+        """
+        Initialize key ring.
+
+        Args:
+            keys: Key bytes by version
+            current_version: Version for new encryptions (default: highest)
+
+        Raises:
+            ValueError: If no keys are given or current_version is unknown
+        """
+        if not keys:
+            raise ValueError("ENCRYPTION_KEY environment variable is required")
+        self.current_version = current_version if current_version is not None else max(keys)
+        if self.current_version not in keys:
+            raise ValueError(f"Unknown current key version: {self.current_version}")
+        self._ciphers = {version: AESGCM(key) for version, key in keys.items()}
+
+    @classmethod
+    def from_env(cls) -> "KeyRing":
+        """Load all key versions from the environment."""
+        keys: Dict[int, bytes] = {}
+        if os.getenv("ENCRYPTION_KEY"):
+            keys[1] = get_encryption_key()
 
+        for entry in (os.getenv("ENCRYPTION_KEYS") or "").split(","):
+            if not entry.strip():
+                continue
+            version, sep, key_hex = entry.strip().partition(":")
+            if not sep or not version.strip().isdigit():
+                raise ValueError("ENCRYPTION_KEYS entries must look like '<version>:<hex key>'")
+            keys[int(version)] = _parse_key(key_hex.strip(), f"ENCRYPTION_KEYS version {version}")
 
-def encrypt_contact(plaintext: str, key_version: int = 1) -> Tuple[bytes, bytes, bytes, int]:
+        current = os.getenv("ENCRYPTION_KEY_VERSION")
+        return cls(keys, int(current) if current else None)
+
+    @property
+    def versions(self) -> List[int]:
+        """Configured key versions."""
+        return sorted(self._ciphers)
+
+    def cipher(self, key_version: int) -> AESGCM:
+        """
+        Get the cached cipher for a key version.
+
+        Raises:
+            ValueError: If the version is not configured
+        """
+        try:
+            return self._ciphers[key_version]
+        except KeyError:
+            raise ValueError(f"Unknown encryption key version: {key_version}") from None
+
+    def encrypt(self, plaintext: str, key_version: Optional[int] = None) -> EncryptedValue:
+        """Encrypt one value (with the current version unless given)."""
+        version = self.current_version if key_version is None else key_version
+        if not plaintext:
+            return b"", b"", b"", version
+
+        nonce = os.urandom(NONCE_SIZE)
+        ciphertext = self.cipher(version).encrypt(nonce, plaintext.encode("utf-8"), None)
+
+        # GCM auth tag is appended to ciphertext; split it out for storage
+        return ciphertext[:-TAG_SIZE], nonce, ciphertext[-TAG_SIZE:], version
+
+    def decrypt(self, ciphertext: bytes, nonce: bytes, auth_tag: bytes, key_version: int) -> str:
+        """
+        Decrypt one value.
+
+        Raises:
+            ValueError: If decryption fails (unknown version, wrong key, tampered data)
+        """
+        if not ciphertext or not nonce or not auth_tag:
+            return ""
+
+        cipher = self.cipher(key_version)
+        try:
+            return cipher.decrypt(nonce, ciphertext + auth_tag, None).decode("utf-8")
+        except Exception as e:
+            raise ValueError(f"Decryption failed: {e}") from e
+
+    def encrypt_many(
+        self, plaintexts: Iterable[str], key_version: Optional[int] = None
+    ) -> List[EncryptedValue]:
+        """Encrypt many values, in input order."""
+        return [self.encrypt(plaintext, key_version) for plaintext in plaintexts]
+
+    def decrypt_many(self, records: Iterable[EncryptedValue]) -> List[Optional[str]]:
+        """Decrypt many values, in input order, with None for records that fail."""
+        plaintexts: List[Optional[str]] = []
+        for record in records:
+            try:
+                plaintexts.append(self.decrypt(*record))
+            except ValueError:
+                plaintexts.append(None)
+        return plaintexts
+
+
+_keyring: Optional[KeyRing] = None
+_keyring_lock = threading.Lock()
+
+
+def get_keyring() -> KeyRing:
+    """
+    Get the process-wide key ring.
+
+    Keys are read from the environment and ciphers built on first use only;
+    call ``reset_keyring`` to pick up changed key variables.
+
+    Raises:
+        ValueError: If no key is configured or a key is invalid
+    """
+    global _keyring
+    if _keyring is None:
+        with _keyring_lock:
+            if _keyring is None:
+                _keyring = KeyRing.from_env()
+    return _keyring
+
+
+def reset_keyring() -> None:
+    """Drop the cached key ring so keys are reloaded on next use."""
+    global _keyring
+    with _keyring_lock:
+        _keyring = None
+
+
+def encrypt_contact(plaintext: str, key_version: Optional[int] = None) -> EncryptedValue:
     """
     Encrypt contact field using AES-256-GCM.
 
     Args:
         plaintext: Text to encrypt
-        key_version: Version of encryption key (for key rotation)
+        key_version: Version of encryption key (default: current version)
 
     Returns:
         Tuple of (ciphertext, nonce, auth_tag, key_version)
     """
-    if not plaintext:
-        return b"", b"", b"", key_version
+    return get_keyring().encrypt(plaintext, key_version)
 
-    key = get_encryption_key()
-    aesgcm = AESGCM(key)
-    nonce = os.urandom(12)  # 96-bit nonce for GCM
 
-    plaintext_bytes = plaintext.encode("utf-8")
-    ciphertext = aesgcm.encrypt(nonce, plaintext_bytes, None)
+def encrypt_contacts(
+    plaintexts: Iterable[str], key_version: Optional[int] = None
+) -> List[EncryptedValue]:
+    """
+    Encrypt many contact fields with the cached cipher.
 
-    # GCM auth tag is appended to ciphertext
-    # Split it out for storage
-    auth_tag = ciphertext[-16:]
-    ciphertext_only = ciphertext[:-16]
+    Args:
+        plaintexts: Texts to encrypt
+        key_version: Version of encryption key (default: current version)
 
-    return ciphertext_only, nonce, auth_tag, key_version
+    Returns:
+        (ciphertext, nonce, auth_tag, key_version) tuples in input order
+    """
+    return get_keyring().encrypt_many(plaintexts, key_version)
 
 
-def decrypt_contact(
-    ciphertext: bytes, nonce: bytes, auth_tag: bytes, key_version: int
-) -> str:
+def decrypt_contact(ciphertext: bytes, nonce: bytes, auth_tag: bytes, key_version: int) -> str:
     """
     Decrypt contact field using AES-256-GCM.
 
@@ -78,16 +284,23 @@ def decrypt_contact(
     """
     if not ciphertext or not nonce or not auth_tag:
         return ""
+    return get_keyring().decrypt(ciphertext, nonce, auth_tag, key_version)
 
-    key = get_encryption_key()
-    aesgcm = AESGCM(key)
 
-    # Reconstruct full ciphertext with auth tag
-    full_ciphertext = ciphertext + auth_tag
+def decrypt_contacts(records: Iterable[EncryptedValue]) -> List[Optional[str]]:
+    """
+    Decrypt many contact fields with the cached ciphers.
 
-    try:
-        plaintext_bytes = aesgcm.decrypt(nonce, full_ciphertext, None)
-        return plaintext_bytes.decode("utf-8")
-    except Exception as e:
-        raise ValueError(f"Decryption failed: {e}") from e
+    Args:
+        records: (ciphertext, nonce, auth_tag, key_version) tuples
 
+    Returns:
+        Plaintexts in input order, with None for records that fail to decrypt
+
+    Raises:
+        ValueError: If ENCRYPTION_KEY is not set or invalid
+    """
+    records = list(records)
+    if not any(ciphertext and nonce and auth_tag for ciphertext, nonce, auth_tag, _ in records):
+        return ["" for _ in records]
+    return get_keyring().decrypt_many(records)
@@ -4,7 +4,17 @@ import os
 
 import pytest
 
-from shared.app.utils.encryption import decrypt_contact, encrypt_contact, get_encryption_key
+from shared.app.utils.encryption import (
+    KeyRing,
+    decode_encrypted_columns,
+    decrypt_contact,
+    decrypt_contacts,
+    encrypt_contact,
+    encrypt_contacts,
+    get_encryption_key,
+    get_keyring,
+    reset_keyring,
+)
 
 
 @pytest.fixture
@@ -12,8 +22,10 @@ def mock_encryption_key():
     """Set a test encryption key."""
     test_key = "0" * 64  # 32 bytes in hex
     os.environ["ENCRYPTION_KEY"] = test_key
+    reset_keyring()
     yield test_key
     os.environ.pop("ENCRYPTION_KEY", None)
+    reset_keyring()
 
 
 def test_get_encryption_key(mock_encryption_key):
@@ -74,3 +86,85 @@ def test_encrypt_decrypt_special_chars(mock_encryption_key):
     decrypted = decrypt_contact(ciphertext, nonce, auth_tag, key_version)
     assert decrypted == plaintext
 
+
+def test_decrypt_contacts(mock_encryption_key):
+    """Test bulk decryption keeps order and marks failures."""
+    first = encrypt_contact("a@example.com")
+    second = encrypt_contact("555-0100")
+    tampered = (b"x" * len(second[0]), second[1], second[2], second[3])
+
+    assert decrypt_contacts([first, (b"", b"", b"", 1), tampered, second]) == [
+        "a@example.com",
+        "",
+        None,
+        "555-0100",
+    ]
+
+
+def test_encrypt_contacts_round_trip(mock_encryption_key):
+    """Test bulk encryption round-trips and uses a fresh nonce per value."""
+    records = encrypt_contacts(["a@example.com", "", "a@example.com"])
+
+    assert records[1] == (b"", b"", b"", 1)
+    assert records[0][1] != records[2][1]
+    assert decrypt_contacts(records) == ["a@example.com", "", "a@example.com"]
+
+
+def test_keyring_rotation(mock_encryption_key, monkeypatch):
+    """Test new values use the newest key while old versions stay readable."""
+    old = encrypt_contact("a@example.com")
+    assert old[3] == 1
+
+    monkeypatch.setenv("ENCRYPTION_KEYS", "2:" + "1" * 64)
+    reset_keyring()
+    new = encrypt_contact("a@example.com")
+
+    assert new[3] == 2
+    # Empty values are tagged with the current version too
+    assert encrypt_contact("")[3] == 2
+    assert [record[3] for record in encrypt_contacts(["", ""])] == [2, 2]
+    assert decrypt_contacts([old, new]) == ["a@example.com", "a@example.com"]
+    # A value is only readable with the key version it was encrypted with
+    assert decrypt_contacts([(new[0], new[1], new[2], 1)]) == [None]
+
+    monkeypatch.setenv("ENCRYPTION_KEY_VERSION", "1")
+    reset_keyring()
+    assert encrypt_contact("a@example.com")[3] == 1
+
+
+def test_keyring_cached_until_reset(mock_encryption_key, monkeypatch):
+    """Test the key ring and its ciphers are built once until reset."""
+    keyring = get_keyring()
+    assert get_keyring() is keyring
+    assert keyring.cipher(1) is keyring.cipher(1)
+
+    monkeypatch.setenv("ENCRYPTION_KEYS", "2:" + "1" * 64)
+    assert get_keyring() is keyring
+    reset_keyring()
+    assert get_keyring() is not keyring
+    assert get_keyring().versions == [1, 2]
+
+
+def test_keyring_unknown_version():
+    """Test decrypting with an unconfigured key version fails."""
+    keyring = KeyRing({1: bytes(32)})
+    ciphertext, nonce, auth_tag, _ = keyring.encrypt("a@example.com")
+    with pytest.raises(ValueError, match="Unknown encryption key version"):
+        keyring.decrypt(ciphertext, nonce, auth_tag, 3)
+    assert keyring.decrypt_many([(ciphertext, nonce, auth_tag, 3)]) == [None]
+
+
+def test_decode_encrypted_columns_legacy_hex_rows(mock_encryption_key):
+    """Test rows stored as hex text (read back as hex of the hex) still decrypt."""
+    ciphertext, nonce, auth_tag, key_version = encrypt_contact("a@example.com")
+
+    # PostgREST output for a BYTEA written with the ``.hex()`` string itself
+    legacy = [
+        "\\x" + value.hex().encode("ascii").hex() for value in (ciphertext, nonce, auth_tag)
+    ]
+    current = ["\\x" + value.hex() for value in (ciphertext, nonce, auth_tag)]
+
+    assert decode_encrypted_columns(*legacy) == (ciphertext, nonce, auth_tag)
+    assert decode_encrypted_columns(*current) == (ciphertext, nonce, auth_tag)
+    assert decode_encrypted_columns("\\x", "\\x", "\\x") == (b"", b"", b"")
+    assert decrypt_contact(*decode_encrypted_columns(*legacy), key_version) == "a@example.com"
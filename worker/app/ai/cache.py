@@ -0,0 +1,186 @@
+"""Memoization of AI provider responses."""
+
+import asyncio
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import redis
+
+from app.ai.provider import AIProvider
+from app.core.config import settings
+from app.core.redis import get_redis_client
+
+KEY_PREFIX = "ai-response:"
+
+
+def fingerprint(
+    provider: AIProvider,
+    profile_snapshot: Dict,
+    job_description: str,
+    page_count: int,
+    include_projects: bool,
+    include_skills: bool,
+) -> str:
+    """
+    Get a canonical hash of everything that determines a provider response.
+
+    Includes the provider, model and prompt version so that changing any of
+    them naturally invalidates earlier responses.
+    """
+    payload = {
+        "provider": provider.get_provider_name(),
+        "model": provider.get_model_name(),
+        "prompt_version": provider.get_prompt_version(),
+        "profile_snapshot": profile_snapshot,
+        "job_description": job_description,
+        "page_count": page_count,
+        "include_projects": include_projects,
+        "include_skills": include_skills,
+    }
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class AIResponseCache:
+    """
+    Two-level cache of AI responses: a per-process LRU in front of Redis.
+
+    Values are stored as JSON text and decoded on every hit so callers can
+    freely mutate what they get back. Redis failures are treated as misses;
+    the cache never makes a generation fail.
+    """
+
+    def __init__(
+        self,
+        redis_client: Optional[redis.Redis],
+        ttl_seconds: int,
+        local_max_size: int,
+    ):
+        """Initialize cache with optional Redis client."""
+        self.redis = redis_client
+        self.ttl_seconds = ttl_seconds
+        self.local_max_size = local_max_size
+        self._local: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get_local(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if time.time() >= expires_at:
+                del self._local[key]
+                return None
+            self._local.move_to_end(key)
+            return value
+
+    def _set_local(self, key: str, value: str, expires_at: float) -> None:
+        if self.local_max_size <= 0:
+            return
+        with self._lock:
+            self._local[key] = (expires_at, value)
+            self._local.move_to_end(key)
+            while len(self._local) > self.local_max_size:
+                self._local.popitem(last=False)
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Get a cached response, or None on miss."""
+        value = self._get_local(key)
+        if value is None and self.redis is not None:
+            try:
+                raw = self.redis.get(KEY_PREFIX + key)
+                ttl = self.redis.ttl(KEY_PREFIX + key) if raw is not None else -2
+            except redis.RedisError:
+                raw = None
+            if raw is not None:
+                value = raw.decode("utf-8") if isinstance(raw, bytes) else raw
+                remaining = ttl if ttl > 0 else self.ttl_seconds
+                self._set_local(key, value, time.time() + remaining)
+        return json.loads(value) if value is not None else None
+
+    def set(self, key: str, response: Dict) -> None:
+        """Cache a provider response for the configured TTL."""
+        if self.ttl_seconds <= 0:
+            return
+        value = json.dumps(response, separators=(",", ":"))
+        self._set_local(key, value, time.time() + self.ttl_seconds)
+        if self.redis is not None:
+            try:
+                self.redis.set(KEY_PREFIX + key, value, ex=self.ttl_seconds)
+            except redis.RedisError:
+                pass
+
+
+def generate_content_cached(
+    provider: AIProvider,
+    cache: AIResponseCache,
+    bypass: bool = False,
+    on_section: Optional[Callable[[str, Any], None]] = None,
+    **inputs,
+) -> Dict:
+    """
+    Call the provider through the response cache.
+
+    With ``bypass`` the cache is not read, but the fresh response still
+    replaces any cached entry. When ``on_section`` is given the provider is
+    streamed and the callback fires as each output section completes.
+    """
+    key = fingerprint(provider, **inputs)
+    if not bypass:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+    if on_section is None:
+        response = provider.generate_content(**inputs)
+    else:
+        response = {}
+        for section, value in provider.stream_content(**inputs):
+            response[section] = value
+            on_section(section, value)
+
+    cache.set(key, response)
+    return response
+
+
+async def agenerate_content_cached(
+    provider: AIProvider,
+    cache: AIResponseCache,
+    bypass: bool = False,
+    **inputs,
+) -> Dict:
+    """
+    Async ``generate_content_cached`` for the asyncio execution mode.
+
+    Redis lookups run in a thread and the provider is called through
+    ``agenerate_content``; responses are not streamed.
+    """
+    key = fingerprint(provider, **inputs)
+    if not bypass:
+        cached = await asyncio.to_thread(cache.get, key)
+        if cached is not None:
+            return cached
+
+    response = await provider.agenerate_content(**inputs)
+    await asyncio.to_thread(cache.set, key, response)
+    return response
+
+
+_cache: AIResponseCache | None = None
+
+
+def get_ai_response_cache() -> AIResponseCache:
+    """Get the per-process AI response cache."""
+    global _cache
+    if _cache is None:
+        _cache = AIResponseCache(
+            get_redis_client() if settings.REDIS_URL else None,
+            ttl_seconds=settings.AI_CACHE_TTL_SECONDS,
+            local_max_size=settings.AI_CACHE_LOCAL_SIZE,
+        )
+    return _cache
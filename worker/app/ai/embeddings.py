@@ -0,0 +1,116 @@
+"""Embedding provider interface and implementations."""
+
+import hashlib
+import math
+import re
+import threading
+from abc import ABC, abstractmethod
+from typing import List
+
+from app.ai.provider import build_http_client
+from app.core.config import settings
+
+_TOKEN_RE = re.compile(r"[a-z0-9+#.]+")
+
+
+class EmbeddingProvider(ABC):
+    """Abstract base class for embedding providers."""
+
+    @abstractmethod
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """Embed a batch of texts, returning one vector per text in order."""
+        pass
+
+    @abstractmethod
+    def get_model_name(self) -> str:
+        """Get model name."""
+        pass
+
+    def text_hash(self, text: str) -> str:
+        """Hash of the text as embedded by this model (detects stale embeddings)."""
+        payload = f"{self.get_model_name()}\0{text}".encode("utf-8")
+        return hashlib.sha256(payload).hexdigest()
+
+    def close(self) -> None:
+        """Release network resources held by the provider."""
+        pass
+
+
+class OpenAIEmbeddingProvider(EmbeddingProvider):
+    """OpenAI embeddings API."""
+
+    def __init__(self):
+        """Initialize OpenAI client."""
+        from openai import OpenAI
+
+        api_key = settings.OPENAI_API_KEY
+        if not api_key:
+            raise ValueError("OPENAI_API_KEY is required")
+        self.client = OpenAI(api_key=api_key, http_client=build_http_client())
+        self.model = settings.EMBEDDING_MODEL
+
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """Embed a batch of texts with one API call."""
+        response = self.client.embeddings.create(model=self.model, input=texts)
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+
+    def get_model_name(self) -> str:
+        """Get model name."""
+        return self.model
+
+    def close(self) -> None:
+        """Close the OpenAI HTTP connection pool."""
+        self.client.close()
+
+
+class LocalEmbeddingProvider(EmbeddingProvider):
+    """
+    Deterministic offline embeddings using signed feature hashing.
+
+    Texts sharing words get similar vectors, which is enough for tests and
+    local development without network access or model downloads.
+    """
+
+    def __init__(self, dimension: int):
+        """Initialize provider producing ``dimension``-sized vectors."""
+        self.dimension = dimension
+
+    def _embed(self, text: str) -> List[float]:
+        vector = [0.0] * self.dimension
+        for token in _TOKEN_RE.findall(text.lower()):
+            digest = hashlib.sha256(token.encode("utf-8")).digest()
+            index = int.from_bytes(digest[:4], "big") % self.dimension
+            vector[index] += 1.0 if digest[4] & 1 else -1.0
+
+        norm = math.sqrt(sum(x * x for x in vector))
+        if not norm:
+            return vector
+        return [x / norm for x in vector]
+
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """Embed a batch of texts."""
+        return [self._embed(text) for text in texts]
+
+    def get_model_name(self) -> str:
+        """Get model name."""
+        return f"local-hash-{self.dimension}"
+
+
+_provider: EmbeddingProvider | None = None
+_provider_lock = threading.Lock()
+
+
+def get_embedding_provider() -> EmbeddingProvider:
+    """Get the per-process embedding provider based on configuration."""
+    global _provider
+    if _provider is None:
+        with _provider_lock:
+            if _provider is None:
+                name = settings.EMBEDDING_PROVIDER.lower()
+                if name == "openai":
+                    _provider = OpenAIEmbeddingProvider()
+                elif name == "local":
+                    _provider = LocalEmbeddingProvider(settings.EMBEDDING_DIMENSION)
+                else:
+                    raise ValueError(f"Unknown embedding provider: {name}")
+    return _provider
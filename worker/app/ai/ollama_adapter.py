@@ -1,11 +1,19 @@
 """Ollama adapter for local AI models."""
 
 import json
-from typing import Dict
+from typing import Any, Dict, Iterator, Tuple
 
 import httpx
 
-from app.ai.provider import AIProvider
+from app.ai.prompt import (
+    CompactProfile,
+    build_compact_profile,
+    report_prompt_size,
+    restore_ids,
+    restore_section_ids,
+)
+from app.ai.provider import AIProvider, build_async_http_client, build_http_client
+from app.ai.streaming import parse_section_stream
 from app.core.config import settings
 
 
@@ -16,6 +24,27 @@ class OllamaAdapter(AIProvider):
         """Initialize Ollama client."""
         self.url = settings.OLLAMA_URL
         self.model = "llama3"
+        self.client = build_http_client(base_url=self.url)
+        self._async_client: httpx.AsyncClient | None = None
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """Async HTTP client, created on first use inside the event loop."""
+        if self._async_client is None:
+            self._async_client = build_async_http_client(base_url=self.url)
+        return self._async_client
+
+    def _build_prompt(self, profile: CompactProfile, job_description: str, page_count: int) -> str:
+        """Build the generation prompt."""
+        prompt = f"""Generate resume content from this profile (keep the short ids as given):
+{profile.to_json()}
+
+Job description: {job_description}
+Page count: {page_count}
+
+Return JSON only."""
+        report_prompt_size(self.get_provider_name(), prompt)
+        return prompt
 
     def generate_content(
         self,
@@ -26,26 +55,77 @@ class OllamaAdapter(AIProvider):
         include_skills: bool,
     ) -> Dict:
         """Generate resume content using Ollama."""
-        prompt = f"""Generate resume content from this profile:
-{json.dumps(profile_snapshot, indent=2)}
+        profile = build_compact_profile(profile_snapshot)
+        prompt = self._build_prompt(profile, job_description, page_count)
 
-Job description: {job_description}
-Page count: {page_count}
+        response = self.client.post(
+            "/api/generate",
+            json={"model": self.model, "prompt": prompt, "stream": False},
+        )
+        response.raise_for_status()
+        result = response.json()
+        content = result.get("response", "{}")
+        return restore_ids(json.loads(content), profile.id_map)
 
-Return JSON only."""
+    async def agenerate_content(
+        self,
+        profile_snapshot: Dict,
+        job_description: str,
+        page_count: int,
+        include_projects: bool,
+        include_skills: bool,
+    ) -> Dict:
+        """Generate resume content using the async Ollama client."""
+        profile = build_compact_profile(profile_snapshot)
+        prompt = self._build_prompt(profile, job_description, page_count)
+
+        response = await self.async_client.post(
+            "/api/generate",
+            json={"model": self.model, "prompt": prompt, "stream": False},
+        )
+        response.raise_for_status()
+        content = response.json().get("response", "{}")
+        return restore_ids(json.loads(content), profile.id_map)
+
+    def stream_content(
+        self,
+        profile_snapshot: Dict,
+        job_description: str,
+        page_count: int,
+        include_projects: bool,
+        include_skills: bool,
+    ) -> Iterator[Tuple[str, Any]]:
+        """Stream resume content from Ollama, yielding sections as they complete."""
+        profile = build_compact_profile(profile_snapshot)
+        prompt = self._build_prompt(profile, job_description, page_count)
 
-        with httpx.Client() as client:
-            response = client.post(
-                f"{self.url}/api/generate",
-                json={"model": self.model, "prompt": prompt, "stream": False},
-                timeout=60.0,
-            )
+        with self.client.stream(
+            "POST",
+            "/api/generate",
+            json={"model": self.model, "prompt": prompt, "stream": True, "format": "json"},
+        ) as response:
             response.raise_for_status()
-            result = response.json()
-            content = result.get("response", "{}")
-            return json.loads(content)
+
+            def chunks() -> Iterator[str]:
+                # Ollama streams one JSON object per line
+                for line in response.iter_lines():
+                    if line:
+                        yield json.loads(line).get("response", "")
+
+            for section, value in parse_section_stream(chunks()):
+                yield section, restore_section_ids(section, value, profile.id_map)
 
     def get_provider_name(self) -> str:
         """Get provider name."""
         return "ollama"
 
+    def close(self) -> None:
+        """Close the Ollama HTTP connection pool."""
+        self.client.close()
+
+    async def aclose(self) -> None:
+        """Close the async Ollama HTTP connection pool."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
@@ -1,11 +1,19 @@
 """OpenAI adapter for AI content generation."""
 
 import json
-from typing import Dict
-
-from openai import OpenAI
-
-from app.ai.provider import AIProvider
+from typing import Any, Dict, Iterator, List, Tuple
+
+from openai import AsyncOpenAI, OpenAI
+
+from app.ai.prompt import (
+    CompactProfile,
+    build_compact_profile,
+    report_prompt_size,
+    restore_ids,
+    restore_section_ids,
+)
+from app.ai.provider import AIProvider, build_async_http_client, build_http_client
+from app.ai.streaming import parse_section_stream
 from app.core.config import settings
 from shared.app.constants import PAGE_COUNT_LIMITS
 
@@ -18,18 +26,28 @@ class OpenAIAdapter(AIProvider):
         api_key = settings.OPENAI_API_KEY
         if not api_key:
             raise ValueError("OPENAI_API_KEY is required")
-        self.client = OpenAI(api_key=api_key)
+        self.client = OpenAI(api_key=api_key, http_client=build_http_client())
         self.model = "gpt-4o"
-
-    def generate_content(
+        self._async_client: AsyncOpenAI | None = None
+
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """Async OpenAI client, created on first use inside the event loop."""
+        if self._async_client is None:
+            self._async_client = AsyncOpenAI(
+                api_key=self.client.api_key, http_client=build_async_http_client()
+            )
+        return self._async_client
+
+    def _build_messages(
         self,
-        profile_snapshot: Dict,
+        profile: CompactProfile,
         job_description: str,
         page_count: int,
         include_projects: bool,
         include_skills: bool,
-    ) -> Dict:
-        """Generate resume content using OpenAI."""
+    ) -> List[Dict[str, str]]:
+        """Build chat messages for a generation request."""
         limits = PAGE_COUNT_LIMITS.get(page_count, PAGE_COUNT_LIMITS[3])
 
         system_prompt = """You are a resume content selector and optimizer.
@@ -41,8 +59,8 @@ Prioritize content most relevant to the job description."""
         user_prompt = f"""Job Description:
 {job_description}
 
-Profile Data:
-{json.dumps(profile_snapshot, indent=2)}
+Profile Data (use the short ids as given for "id" and bullet "original_id"):
+{profile.to_json()}
 
 Page Count: {page_count}
 Max bullets per experience: {limits.get('max_bullets_per_experience', 999)}
@@ -52,20 +70,99 @@ Include skills: {include_skills}
 
 Select and optimize content to fit within these constraints."""
 
+        report_prompt_size(self.get_provider_name(), system_prompt + user_prompt)
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ]
+
+    def generate_content(
+        self,
+        profile_snapshot: Dict,
+        job_description: str,
+        page_count: int,
+        include_projects: bool,
+        include_skills: bool,
+    ) -> Dict:
+        """Generate resume content using OpenAI."""
+        profile = build_compact_profile(profile_snapshot)
         response = self.client.chat.completions.create(
             model=self.model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
+            messages=self._build_messages(
+                profile, job_description, page_count, include_projects, include_skills
+            ),
+            response_format={"type": "json_object"},
+            temperature=0.3,
+        )
+
+        content = response.choices[0].message.content
+        return restore_ids(json.loads(content), profile.id_map)
+
+    async def agenerate_content(
+        self,
+        profile_snapshot: Dict,
+        job_description: str,
+        page_count: int,
+        include_projects: bool,
+        include_skills: bool,
+    ) -> Dict:
+        """Generate resume content using the async OpenAI client."""
+        profile = build_compact_profile(profile_snapshot)
+        response = await self.async_client.chat.completions.create(
+            model=self.model,
+            messages=self._build_messages(
+                profile, job_description, page_count, include_projects, include_skills
+            ),
             response_format={"type": "json_object"},
             temperature=0.3,
         )
 
         content = response.choices[0].message.content
-        return json.loads(content)
+        return restore_ids(json.loads(content), profile.id_map)
+
+    def stream_content(
+        self,
+        profile_snapshot: Dict,
+        job_description: str,
+        page_count: int,
+        include_projects: bool,
+        include_skills: bool,
+    ) -> Iterator[Tuple[str, Any]]:
+        """Stream resume content from OpenAI, yielding sections as they complete."""
+        profile = build_compact_profile(profile_snapshot)
+        stream = self.client.chat.completions.create(
+            model=self.model,
+            messages=self._build_messages(
+                profile, job_description, page_count, include_projects, include_skills
+            ),
+            response_format={"type": "json_object"},
+            temperature=0.3,
+            stream=True,
+        )
+
+        def chunks() -> Iterator[str]:
+            for chunk in stream:
+                if chunk.choices:
+                    yield chunk.choices[0].delta.content or ""
+
+        try:
+            for section, value in parse_section_stream(chunks()):
+                yield section, restore_section_ids(section, value, profile.id_map)
+        finally:
+            # Stop reading (and paying for) tokens on early abort
+            stream.close()
 
     def get_provider_name(self) -> str:
         """Get provider name."""
         return "openai"
 
+    def close(self) -> None:
+        """Close the OpenAI HTTP connection pool."""
+        self.client.close()
+
+    async def aclose(self) -> None:
+        """Close the async OpenAI HTTP connection pool."""
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
+
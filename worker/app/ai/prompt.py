@@ -0,0 +1,169 @@
+"""Compact prompt serialization for AI providers."""
+
+import json
+import logging
+import math
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Rough average for English text with GPT-style BPE tokenizers
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of tokens in a prompt string."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def report_prompt_size(provider_name: str, prompt: str) -> int:
+    """Log and return the estimated token count of a prompt."""
+    tokens = estimate_tokens(prompt)
+    logger.info("%s prompt: %d chars, ~%d tokens", provider_name, len(prompt), tokens)
+    return tokens
+
+
+def _sorted_rows(rows: Optional[List[Dict]]) -> List[Dict]:
+    return sorted(rows or [], key=lambda row: row.get("sort_order", 0))
+
+
+def _compact(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop null, empty and false-y flag values."""
+    return {
+        key: value
+        for key, value in entry.items()
+        if value is not None and value is not False and value != "" and value != []
+    }
+
+
+@dataclass
+class CompactProfile:
+    """Projected profile snapshot plus the short-id mapping used in the prompt."""
+
+    data: Dict[str, Any]
+    id_map: Dict[str, str] = field(default_factory=dict)
+
+    def to_json(self) -> str:
+        """Serialize without whitespace."""
+        return json.dumps(self.data, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def build_compact_profile(profile_snapshot: Dict) -> CompactProfile:
+    """
+    Project a profile snapshot down to what the AIOutput schema needs.
+
+    Database ids, user ids, timestamps, embeddings and null columns are
+    dropped, and UUIDs are replaced with short stable ids (``ed1``, ``ex2``,
+    ``ex2b3``...) derived from position. ``id_map`` maps them back.
+    """
+    id_map: Dict[str, str] = {}
+
+    def short_id(prefix: str, row: Dict) -> str:
+        if row.get("id") is not None:
+            id_map[prefix] = str(row["id"])
+        return prefix
+
+    education = []
+    for index, row in enumerate(profile_snapshot.get("education") or [], start=1):
+        education.append(
+            _compact(
+                {
+                    "id": short_id(f"ed{index}", row),
+                    "school": row.get("school"),
+                    "degree": row.get("degree"),
+                    "major": row.get("major"),
+                    "gpa": row.get("gpa"),
+                    "start_date": row.get("start_date"),
+                    "end_date": row.get("end_date"),
+                    "location": row.get("location"),
+                    "highlights": [
+                        h.get("highlight") for h in _sorted_rows(row.get("education_highlight"))
+                    ],
+                }
+            )
+        )
+
+    experience = []
+    for index, row in enumerate(profile_snapshot.get("experience") or [], start=1):
+        exp_id = short_id(f"ex{index}", row)
+        bullets = [
+            {"id": short_id(f"{exp_id}b{b_index}", bullet), "text": bullet.get("bullet")}
+            for b_index, bullet in enumerate(_sorted_rows(row.get("experience_bullet")), start=1)
+        ]
+        experience.append(
+            _compact(
+                {
+                    "id": exp_id,
+                    "company": row.get("company"),
+                    "role": row.get("role"),
+                    "location": row.get("location"),
+                    "start_date": row.get("start_date"),
+                    "end_date": row.get("end_date"),
+                    "is_current": row.get("is_current"),
+                    "bullets": bullets,
+                }
+            )
+        )
+
+    projects = []
+    for index, row in enumerate(profile_snapshot.get("projects") or [], start=1):
+        proj_id = short_id(f"pr{index}", row)
+        bullets = [
+            {"id": short_id(f"{proj_id}b{b_index}", bullet), "text": bullet.get("bullet")}
+            for b_index, bullet in enumerate(_sorted_rows(row.get("project_bullet")), start=1)
+        ]
+        projects.append(
+            _compact(
+                {
+                    "id": proj_id,
+                    "name": row.get("name"),
+                    "role": row.get("role"),
+                    "start_date": row.get("start_date"),
+                    "end_date": row.get("end_date"),
+                    "technologies": [t.get("tech") for t in row.get("project_tech") or []],
+                    "bullets": bullets,
+                }
+            )
+        )
+
+    skills = [
+        {
+            "name": row.get("name"),
+            "items": [i.get("item") for i in _sorted_rows(row.get("skill_item"))],
+        }
+        for row in _sorted_rows(profile_snapshot.get("skills"))
+    ]
+
+    data = _compact(
+        {
+            "education": education,
+            "experience": experience,
+            "projects": projects,
+            "skills": skills,
+        }
+    )
+    return CompactProfile(data=data, id_map=id_map)
+
+
+def restore_section_ids(section: str, value: Any, id_map: Dict[str, str]) -> Any:
+    """Map short ids in one AI output section back to database ids."""
+    if section not in ("education", "experience", "projects") or not isinstance(value, list):
+        return value
+
+    for entry in value:
+        if not isinstance(entry, dict):
+            continue
+        if entry.get("id") in id_map:
+            entry["id"] = id_map[entry["id"]]
+        for bullet in entry.get("bullets") or []:
+            if isinstance(bullet, dict) and bullet.get("original_id") in id_map:
+                bullet["original_id"] = id_map[bullet["original_id"]]
+    return value
+
+
+def restore_ids(ai_output: Dict, id_map: Dict[str, str]) -> Dict:
+    """Map short ids in a full AI output back to database ids."""
+    for section, value in ai_output.items():
+        restore_section_ids(section, value, id_map)
+    return ai_output
@@ -1,11 +1,18 @@
 """AI provider interface and factory."""
 
+import asyncio
 import os
+import threading
 from abc import ABC, abstractmethod
-from typing import Dict
+from typing import Any, Dict, Iterator, Tuple
+
+import httpx
 
 from app.core.config import settings
 
+# Bump whenever prompts change so cached responses are invalidated
+PROMPT_VERSION = "2"
+
 
 class AIProvider(ABC):
     """Abstract base class for AI providers."""
@@ -22,20 +29,102 @@ class AIProvider(ABC):
         """Generate resume content."""
         pass
 
+    def stream_content(
+        self,
+        profile_snapshot: Dict,
+        job_description: str,
+        page_count: int,
+        include_projects: bool,
+        include_skills: bool,
+    ) -> Iterator[Tuple[str, Any]]:
+        """
+        Generate resume content, yielding each top-level section as it completes.
+
+        Providers that cannot stream yield all sections after a regular
+        ``generate_content`` call.
+        """
+        content = self.generate_content(
+            profile_snapshot=profile_snapshot,
+            job_description=job_description,
+            page_count=page_count,
+            include_projects=include_projects,
+            include_skills=include_skills,
+        )
+        yield from content.items()
+
+    async def agenerate_content(
+        self,
+        profile_snapshot: Dict,
+        job_description: str,
+        page_count: int,
+        include_projects: bool,
+        include_skills: bool,
+    ) -> Dict:
+        """
+        Generate resume content without blocking the event loop.
+
+        Providers without an async client run ``generate_content`` in a thread.
+        """
+        return await asyncio.to_thread(
+            self.generate_content,
+            profile_snapshot=profile_snapshot,
+            job_description=job_description,
+            page_count=page_count,
+            include_projects=include_projects,
+            include_skills=include_skills,
+        )
+
     @abstractmethod
     def get_provider_name(self) -> str:
         """Get provider name."""
         pass
 
+    def get_model_name(self) -> str:
+        """Get model name."""
+        return getattr(self, "model", "")
 
-def get_ai_provider() -> AIProvider:
-    """Get AI provider based on configuration."""
+    def get_prompt_version(self) -> str:
+        """Get prompt version."""
+        return PROMPT_VERSION
+
+    def close(self) -> None:
+        """Release network resources held by the provider."""
+        pass
+
+    async def aclose(self) -> None:
+        """Release async network resources held by the provider."""
+        pass
+
+
+def _http_limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=settings.AI_HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.AI_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=settings.AI_HTTP_KEEPALIVE_EXPIRY,
+    )
+
+
+def build_http_client(**kwargs) -> httpx.Client:
+    """Build a keep-alive HTTP client for provider calls."""
+    return httpx.Client(limits=_http_limits(), timeout=settings.AI_HTTP_TIMEOUT, **kwargs)
+
+
+def build_async_http_client(**kwargs) -> httpx.AsyncClient:
+    """Build a keep-alive async HTTP client for provider calls (asyncio mode)."""
+    return httpx.AsyncClient(limits=_http_limits(), timeout=settings.AI_HTTP_TIMEOUT, **kwargs)
+
+
+# Provider instances are long-lived so their connection pools survive across tasks
+_providers: Dict[str, AIProvider] = {}
+_providers_lock = threading.Lock()
+
+
+def _create_ai_provider(provider: str) -> AIProvider:
+    """Create a new AI provider instance."""
     # Import adapters here to avoid circular imports
     from app.ai.mock_adapter import MockAdapter
     from app.ai.openai_adapter import OpenAIAdapter
     from app.ai.ollama_adapter import OllamaAdapter
-    
-    provider = os.getenv("AI_PROVIDER", settings.AI_PROVIDER).lower()
 
     if provider == "mock":
         return MockAdapter()
@@ -46,3 +135,32 @@ def get_ai_provider() -> AIProvider:
     else:
         raise ValueError(f"Unknown AI provider: {provider}")
 
+
+def get_ai_provider() -> AIProvider:
+    """Get AI provider based on configuration, reusing the per-process instance."""
+    provider = os.getenv("AI_PROVIDER", settings.AI_PROVIDER).lower()
+
+    instance = _providers.get(provider)
+    if instance is None:
+        with _providers_lock:
+            instance = _providers.get(provider)
+            if instance is None:
+                instance = _create_ai_provider(provider)
+                _providers[provider] = instance
+    return instance
+
+
+def close_ai_providers() -> None:
+    """Close and forget all provider instances."""
+    with _providers_lock:
+        for instance in _providers.values():
+            instance.close()
+        _providers.clear()
+
+
+async def aclose_ai_providers() -> None:
+    """Close the async clients of all provider instances."""
+    with _providers_lock:
+        instances = list(_providers.values())
+    for instance in instances:
+        await instance.aclose()
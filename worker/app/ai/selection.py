@@ -0,0 +1,114 @@
+"""Embedding-based pre-selection of profile content before calling the AI provider."""
+
+import json
+import math
+from typing import Any, Dict, List, Optional, Sequence
+
+from shared.app.constants import PAGE_COUNT_LIMITS
+
+
+def parse_embedding(value: Any) -> Optional[List[float]]:
+    """Parse a pgvector value (JSON-style text or list) into floats."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = json.loads(value)
+    return [float(x) for x in value]
+
+
+class _Query:
+    """Query embedding with its norm precomputed."""
+
+    def __init__(self, embedding: Sequence[float]):
+        self.embedding = embedding
+        self.norm = math.sqrt(sum(x * x for x in embedding))
+
+    def similarity(self, value: Any) -> float:
+        """Cosine similarity against a stored embedding (0.0 when missing)."""
+        embedding = parse_embedding(value)
+        if not embedding or not self.norm:
+            return 0.0
+        norm = math.sqrt(sum(x * x for x in embedding))
+        if not norm:
+            return 0.0
+        dot = sum(a * b for a, b in zip(self.embedding, embedding))
+        return dot / (self.norm * norm)
+
+
+def _top_bullets(query: _Query, bullets: List[Dict], limit: int) -> List[Dict]:
+    """Keep the ``limit`` most relevant bullets, preserving their original order."""
+    if len(bullets) <= limit:
+        return list(bullets)
+    ranked = sorted(
+        range(len(bullets)),
+        key=lambda i: query.similarity(bullets[i].get("embedding")),
+        reverse=True,
+    )
+    keep = set(ranked[:limit])
+    return [bullet for i, bullet in enumerate(bullets) if i in keep]
+
+
+def preselect_content(
+    profile_snapshot: Dict,
+    jd_embedding: Optional[Sequence[float]],
+    page_count: int,
+    candidate_factor: float = 2.0,
+) -> Dict:
+    """
+    Trim a profile snapshot to the bullets most relevant to a job description.
+
+    Each experience keeps its top ``max_bullets_per_experience *
+    candidate_factor`` bullets and only the top ``max_projects *
+    candidate_factor`` projects (ranked by their best bullet) are kept, so
+    the provider still has a choice but prompt size no longer grows with
+    the profile. Bullets without embeddings rank as neutral. The input
+    snapshot is not modified; without a JD embedding it is returned as is.
+
+    Args:
+        profile_snapshot: Full profile snapshot
+        jd_embedding: Job description embedding
+        page_count: Requested page count (selects PAGE_COUNT_LIMITS)
+        candidate_factor: How many candidates to send per slot on the page
+
+    Returns:
+        Snapshot containing only the selected candidates
+    """
+    if not jd_embedding:
+        return profile_snapshot
+
+    query = _Query(list(jd_embedding))
+    limits = PAGE_COUNT_LIMITS.get(page_count, PAGE_COUNT_LIMITS[3])
+    max_bullets = math.ceil(limits.get("max_bullets_per_experience", 999) * candidate_factor)
+    max_projects = math.ceil(limits.get("max_projects", 999) * candidate_factor)
+
+    experience = [
+        {
+            **exp,
+            "experience_bullet": _top_bullets(
+                query, exp.get("experience_bullet") or [], max_bullets
+            ),
+        }
+        for exp in profile_snapshot.get("experience") or []
+    ]
+
+    projects = [
+        {
+            **proj,
+            "project_bullet": _top_bullets(query, proj.get("project_bullet") or [], max_bullets),
+        }
+        for proj in profile_snapshot.get("projects") or []
+    ]
+    if len(projects) > max_projects:
+        scores = [
+            max(
+                (query.similarity(b.get("embedding")) for b in proj["project_bullet"]),
+                default=0.0,
+            )
+            for proj in projects
+        ]
+        keep = set(
+            sorted(range(len(projects)), key=lambda i: scores[i], reverse=True)[:max_projects]
+        )
+        projects = [proj for i, proj in enumerate(projects) if i in keep]
+
+    return {**profile_snapshot, "experience": experience, "projects": projects}
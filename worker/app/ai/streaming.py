@@ -0,0 +1,143 @@
+"""Incremental parsing of streamed AI output."""
+
+import json
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+_WHITESPACE = " \t\r\n"
+_CLOSERS = {"{": "}", "[": "]"}
+
+
+class SectionStreamParser:
+    """
+    Incremental parser for a streamed top-level JSON object.
+
+    Text is fed in arbitrary chunks; every time a top-level member (e.g.
+    ``"education": [...]``) is complete it is decoded and returned as a
+    ``(key, value)`` pair. Malformed output raises ``ValueError`` as soon as
+    it is detected, so callers can abort the stream instead of waiting for
+    the whole completion.
+    """
+
+    def __init__(self):
+        """Initialize an empty parser."""
+        self._text = ""
+        self._pos = 0
+        self._depth = 0
+        self._stack: List[str] = []  # brackets opened inside the top-level object
+        self._in_string = False
+        self._escape = False
+        self._started = False
+        self._done = False
+        self._expect = "key"
+        self._key: Optional[str] = None
+        self._key_start = 0
+        self._value_start: Optional[int] = None
+
+    @property
+    def done(self) -> bool:
+        """Whether the closing brace of the top-level object was seen."""
+        return self._done
+
+    def _emit(self, end: int) -> Tuple[str, Any]:
+        if self._key is None or self._value_start is None:
+            raise ValueError("Malformed AI output: member without key")
+        raw = self._text[self._value_start : end].strip()
+        try:
+            value = json.loads(raw)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Malformed AI output in section '{self._key}': {e}") from e
+        member = (self._key, value)
+        self._key = None
+        self._value_start = None
+        return member
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """
+        Consume a chunk of text.
+
+        Returns:
+            Top-level members completed by this chunk
+
+        Raises:
+            ValueError: If the stream is not a well-formed JSON object
+        """
+        self._text += chunk
+        completed: List[Tuple[str, Any]] = []
+
+        while self._pos < len(self._text):
+            index = self._pos
+            char = self._text[index]
+            self._pos += 1
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._depth == 1 and self._expect == "key":
+                        self._key = json.loads(self._text[self._key_start : index + 1])
+                        self._expect = "colon"
+                continue
+
+            if char in _WHITESPACE:
+                continue
+
+            if self._done:
+                raise ValueError("Malformed AI output: data after closing brace")
+
+            if self._depth == 0:
+                if char != "{" or self._started:
+                    raise ValueError("Malformed AI output: expected a JSON object")
+                self._started = True
+                self._depth = 1
+                continue
+
+            if self._depth == 1 and self._expect == "key":
+                if char == "}" and self._key is None:
+                    self._depth = 0
+                    self._done = True
+                    continue
+                if char != '"':
+                    raise ValueError(f"Malformed AI output: unexpected '{char}' before key")
+                self._key_start = index
+                self._in_string = True
+            elif self._depth == 1 and self._expect == "colon":
+                if char != ":":
+                    raise ValueError(f"Malformed AI output: expected ':' after '{self._key}'")
+                self._value_start = index + 1
+                self._expect = "value"
+            elif char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._stack.append(char)
+                self._depth += 1
+            elif char in "}]":
+                opener = self._stack.pop() if self._stack else "{"
+                if _CLOSERS[opener] != char:
+                    raise ValueError(f"Malformed AI output: unexpected '{char}'")
+                self._depth -= 1
+                if self._depth == 0:
+                    completed.append(self._emit(index))
+                    self._done = True
+            elif char == "," and self._depth == 1:
+                completed.append(self._emit(index))
+                self._expect = "key"
+
+        return completed
+
+
+def parse_section_stream(chunks: Iterable[str]) -> Iterator[Tuple[str, Any]]:
+    """
+    Yield top-level ``(key, value)`` pairs from a stream of JSON text chunks.
+
+    Raises:
+        ValueError: If the stream is malformed or ends before the object closes
+    """
+    parser = SectionStreamParser()
+    for chunk in chunks:
+        if chunk:
+            yield from parser.feed(chunk)
+    if not parser.done:
+        raise ValueError("Malformed AI output: stream ended before the JSON object closed")
@@ -3,15 +3,22 @@
 import os
 
 from celery import Celery
+from celery.signals import worker_process_init, worker_process_shutdown, worker_shutdown
 
 # Get Redis URL from environment
 redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 
+# Network-bound work (AI, storage, database) runs on the I/O queue, consumed
+# by a high-concurrency thread pool; LaTeX compilation runs on the CPU queue,
+# consumed by a prefork pool sized to the cores.
+IO_QUEUE = "io"
+CPU_QUEUE = "cpu"
+
 celery_app = Celery(
     "worker",
     broker=redis_url,
     backend=redis_url,
-    include=["app.tasks.generate_resume", "app.tasks.embeddings"],
+    include=["app.tasks.generate_resume", "app.tasks.embeddings", "app.tasks.key_rotation"],
 )
 
 celery_app.conf.update(
@@ -20,5 +27,45 @@ celery_app.conf.update(
     task_soft_time_limit=240,  # 4 minutes
     worker_prefetch_multiplier=1,
     worker_max_tasks_per_child=50,
+    task_default_queue=IO_QUEUE,
+    task_routes={
+        "worker.app.tasks.generate_resume.compile_resume": {"queue": CPU_QUEUE},
+    },
 )
 
+
+@worker_process_init.connect
+def warm_latex_compiler(**kwargs) -> None:
+    """Warm the Tectonic workspace pool in each worker process, off the init path."""
+    from app.core.config import settings
+    from app.latex.compiler import get_compile_engine
+
+    if settings.LATEX_WARM_ON_START:
+        # worker_process_init must return within worker_proc_alive_timeout
+        get_compile_engine().warm_in_background()
+
+
+@worker_shutdown.connect
+@worker_process_shutdown.connect
+def close_latex_compiler(**kwargs) -> None:
+    """Remove the Tectonic workspaces when a worker process exits."""
+    from app.latex.compiler import close_compile_engine
+
+    close_compile_engine()
+
+
+@worker_shutdown.connect
+@worker_process_shutdown.connect
+def close_ai_clients(**kwargs) -> None:
+    """Close pooled AI provider connections when a worker process exits."""
+    from app.ai.provider import close_ai_providers
+
+    close_ai_providers()
+
+
+@worker_shutdown.connect
+def stop_async_runner(**kwargs) -> None:
+    """Stop the asyncio-mode event loop and compile process pool, if started."""
+    from app.core.aio import shutdown_async_runner
+
+    shutdown_async_runner()
@@ -0,0 +1,211 @@
+"""Asyncio execution mode: one event loop per worker process.
+
+With ``WORKER_ASYNC_MODE`` enabled, generation tasks schedule a coroutine on
+the process-wide loop and return, so a single process keeps up to
+``WORKER_ASYNC_MAX_IN_FLIGHT`` generations in flight while they wait on the
+AI provider, Supabase and Storage. LaTeX compilation is CPU-bound and runs in
+a process pool so it never blocks the loop.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Awaitable, Callable, Optional, Set
+
+from supabase import AsyncClient, acreate_client
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncRunner:
+    """
+    Event loop running in a background thread, with a bound on in-flight work.
+
+    ``submit`` blocks the calling (Celery) thread while ``max_in_flight``
+    coroutines are already running, so the worker stops taking messages
+    instead of queueing work in memory. Each coroutine is cancelled after
+    ``timeout`` seconds; on ``shutdown`` running coroutines get a grace
+    period and are then cancelled, so they can record their failure.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int,
+        compile_processes: int = 0,
+        timeout: Optional[float] = None,
+        process_initializer: Optional[Callable[[], None]] = None,
+    ):
+        """
+        Start the loop thread.
+
+        Args:
+            max_in_flight: Maximum number of coroutines running at once
+            compile_processes: Size of the CPU process pool (0: one per core)
+            timeout: Seconds after which a coroutine is cancelled (None: no limit)
+            process_initializer: Picklable function run once in each pool process
+        """
+        self.max_in_flight = max(1, max_in_flight)
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(self.max_in_flight)
+        self._closed = False
+        self._tasks: Set[asyncio.Task] = set()  # only touched from the loop thread
+        self._compile_processes = compile_processes or os.cpu_count() or 1
+        self._process_pool: ProcessPoolExecutor | None = None
+        self._process_pool_lock = threading.Lock()
+        self._process_initializer = process_initializer
+
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self.loop.run_forever, name="async-runner", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, func: Callable[..., Awaitable[Any]], *args: Any) -> Future:
+        """
+        Run ``func(*args)`` on the loop once an in-flight slot is free.
+
+        Returns:
+            Future resolved with the coroutine's result
+
+        Raises:
+            RuntimeError: If the runner is shut down
+        """
+        if self._closed:
+            raise RuntimeError("Async runner is shut down")
+        self._slots.acquire()
+        try:
+            if self._closed:
+                raise RuntimeError("Async runner is shut down")
+            future = asyncio.run_coroutine_threadsafe(self._run(func, *args), self.loop)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(self._on_done)
+        return future
+
+    async def _run(self, func: Callable[..., Awaitable[Any]], *args: Any) -> Any:
+        task = asyncio.current_task()
+        self._tasks.add(task)
+        try:
+            if self.timeout is None:
+                return await func(*args)
+            return await asyncio.wait_for(func(*args), self.timeout)
+        finally:
+            self._tasks.discard(task)
+
+    def _on_done(self, future: Future) -> None:
+        self._slots.release()
+        if not future.cancelled() and future.exception() is not None:
+            logger.error("Async task failed: %r", future.exception())
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        if self._process_pool is None:
+            with self._process_pool_lock:
+                if self._process_pool is None:
+                    # Spawned (not forked) children: this process runs threads
+                    self._process_pool = ProcessPoolExecutor(
+                        max_workers=self._compile_processes,
+                        mp_context=multiprocessing.get_context("spawn"),
+                        initializer=self._process_initializer,
+                    )
+        return self._process_pool
+
+    async def run_cpu(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a picklable CPU-bound function in the process pool."""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._get_process_pool(), func, *args
+        )
+
+    async def _drain(self, timeout: float) -> int:
+        """Wait for running coroutines, cancel those still running after ``timeout``."""
+        tasks = set(self._tasks)
+        if not tasks:
+            return 0
+        _, pending = await asyncio.wait(tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        if pending:
+            # Let cancelled coroutines run their failure handling
+            await asyncio.wait(pending, timeout=10)
+        return len(pending)
+
+    def shutdown(self, timeout: float = 60.0) -> None:
+        """
+        Stop taking work, drain in-flight coroutines, then stop the loop and pools.
+
+        Args:
+            timeout: Grace period in seconds before in-flight coroutines are cancelled
+        """
+        from app.ai.provider import aclose_ai_providers
+
+        self._closed = True
+        try:
+            cancelled = asyncio.run_coroutine_threadsafe(self._drain(timeout), self.loop).result(
+                timeout=timeout + 15
+            )
+            if cancelled:
+                logger.warning("Cancelled %s in-flight async tasks at shutdown", cancelled)
+        except Exception:
+            logger.warning("Failed to drain in-flight async tasks", exc_info=True)
+
+        try:
+            asyncio.run_coroutine_threadsafe(aclose_ai_providers(), self.loop).result(timeout=10)
+        except Exception:
+            logger.warning("Failed to close async AI clients", exc_info=True)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout=10)
+        if self._process_pool is not None:
+            self._process_pool.shutdown(cancel_futures=True)
+
+
+_runner: AsyncRunner | None = None
+_runner_lock = threading.Lock()
+
+
+def get_async_runner() -> AsyncRunner:
+    """Get the per-process async runner."""
+    global _runner
+    if _runner is None:
+        with _runner_lock:
+            if _runner is None:
+                from app.celery_app import celery_app
+                from app.latex.compiler import init_compile_process
+
+                # Celery's time limit no longer applies once the task has returned
+                _runner = AsyncRunner(
+                    settings.WORKER_ASYNC_MAX_IN_FLIGHT,
+                    compile_processes=settings.WORKER_ASYNC_COMPILE_PROCESSES,
+                    timeout=celery_app.conf.task_time_limit,
+                    process_initializer=init_compile_process,
+                )
+    return _runner
+
+
+def shutdown_async_runner() -> None:
+    """Stop the per-process async runner, if it was started."""
+    global _runner
+    with _runner_lock:
+        if _runner is not None:
+            _runner.shutdown(timeout=settings.WORKER_ASYNC_SHUTDOWN_TIMEOUT)
+            _runner = None
+
+
+_async_supabase: AsyncClient | None = None
+_async_supabase_lock = asyncio.Lock()
+
+
+async def get_async_supabase_client() -> AsyncClient:
+    """Get the async Supabase client of the runner's event loop."""
+    global _async_supabase
+    if _async_supabase is None:
+        async with _async_supabase_lock:
+            if _async_supabase is None:
+                _async_supabase = await acreate_client(
+                    settings.SUPABASE_URL, settings.SUPABASE_SERVICE_KEY
+                )
+    return _async_supabase
@@ -26,11 +26,54 @@ class Settings(BaseSettings):
     AI_PROVIDER: str = "openai"
     OPENAI_API_KEY: str = ""
     OLLAMA_URL: str = "http://localhost:11434"
+    AI_STREAMING: bool = True
+    AI_HTTP_TIMEOUT: float = 60.0
+    AI_HTTP_MAX_CONNECTIONS: int = 10
+    AI_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 5
+    AI_HTTP_KEEPALIVE_EXPIRY: float = 30.0
+
+    # Redis
+    REDIS_URL: str = "redis://localhost:6379/0"
+
+    # AI response cache
+    AI_CACHE_ENABLED: bool = True
+    AI_CACHE_TTL_SECONDS: int = 7 * 24 * 3600
+    AI_CACHE_LOCAL_SIZE: int = 256
+
+    # Embedding-based pre-selection of bullets sent to the AI provider
+    AI_PRESELECT_ENABLED: bool = True
+    AI_PRESELECT_CANDIDATE_FACTOR: float = 2.0
 
     # Embedding
     EMBEDDING_PROVIDER: str = "openai"
     EMBEDDING_MODEL: str = "text-embedding-3-small"
     EMBEDDING_DIMENSION: int = 1536
+    EMBEDDING_BATCH_SIZE: int = 64
+    EMBEDDING_FLUSH_INTERVAL: float = 2.0
+    EMBEDDING_FLUSH_MAX_RETRIES: int = 5
+
+    # Asyncio execution mode (see app.core.aio)
+    WORKER_ASYNC_MODE: bool = False
+    WORKER_ASYNC_MAX_IN_FLIGHT: int = 32
+    WORKER_ASYNC_COMPILE_PROCESSES: int = 0  # 0: one per core
+    WORKER_ASYNC_SHUTDOWN_TIMEOUT: float = 60.0
+
+    # Storage
+    STORAGE_UPLOAD_CONCURRENCY: int = 4
+
+    # Contact key rotation
+    KEY_ROTATION_BATCH_SIZE: int = 500
+
+    # LaTeX
+    TEMPLATE_BYTECODE_CACHE_DIR: str = ""
+    LATEX_COMPILE_POOL_SIZE: int = 2
+    LATEX_COMPILE_TIMEOUT: int = 30
+    LATEX_WARM_ON_START: bool = True
+    TECTONIC_CACHE_DIR: str = ""
+    TECTONIC_ONLY_CACHED: bool = True
+    PDF_CACHE_ENABLED: bool = True
+    PDF_CACHE_DIR: str = ""
+    ARTIFACT_SPOOL_TTL: int = 3600  # Seconds compiled files wait in Redis for publishing
 
     model_config = SettingsConfigDict(
         extra="ignore",  # Ignore extra fields from .env (used by backend/frontend)
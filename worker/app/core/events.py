@@ -0,0 +1,41 @@
+"""Status events published to Redis for clients streaming generation progress."""
+
+import logging
+from typing import List, Optional
+
+import redis
+
+from app.core.redis import get_redis_client
+from shared.app.constants import RESUME_EVENTS_CHANNEL
+from shared.app.schemas.resume_request import ResumeStatusEvent
+
+logger = logging.getLogger(__name__)
+
+
+def publish_status(
+    generated_resume_id: str,
+    status: str,
+    stage: Optional[str] = None,
+    completed_sections: Optional[List[str]] = None,
+    failure_reason: Optional[str] = None,
+) -> None:
+    """
+    Publish a status event on the resume's channel.
+
+    Events are best effort: the database stays the source of truth, so Redis
+    errors are logged and never fail a generation.
+    """
+    event = ResumeStatusEvent(
+        generated_resume_id=generated_resume_id,
+        status=status,
+        stage=stage,
+        completed_sections=completed_sections or [],
+        failure_reason=failure_reason,
+    )
+    try:
+        get_redis_client().publish(
+            RESUME_EVENTS_CHANNEL.format(generated_resume_id=generated_resume_id),
+            event.model_dump_json(),
+        )
+    except redis.RedisError as e:
+        logger.warning("Failed to publish status event: %s", e)
@@ -0,0 +1,15 @@
+"""Shared Redis client."""
+
+import redis
+
+from app.core.config import settings
+
+_redis_client: redis.Redis | None = None
+
+
+def get_redis_client() -> redis.Redis:
+    """Get Redis client for caches and work queues."""
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = redis.Redis.from_url(settings.REDIS_URL)
+    return _redis_client
@@ -0,0 +1,96 @@
+"""Content-addressed cache of compiled PDFs."""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from supabase import Client
+
+from app.storage.client import download_file
+
+
+def latex_sha256(latex_bytes: bytes) -> str:
+    """Get the cache key for rendered LaTeX."""
+    return hashlib.sha256(latex_bytes).hexdigest()
+
+
+class PDFCache:
+    """
+    Cache of compiled PDFs keyed on the SHA-256 of the rendered LaTeX.
+
+    Lookups try the local disk first and then previously generated files in
+    Supabase Storage, found through the ``sha256`` column of the LATEX
+    ``generated_file`` row. Storage lookups are scoped to the requesting
+    user so one user's files are never served to another.
+    """
+
+    def __init__(self, supabase: Client, cache_dir: Optional[Path] = None):
+        """Initialize cache with Supabase client and optional local directory."""
+        self.supabase = supabase
+        self.cache_dir = cache_dir
+
+    def _local_path(self, sha256: str) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / sha256[:2] / f"{sha256}.pdf"
+
+    def _get_local(self, sha256: str) -> Optional[bytes]:
+        path = self._local_path(sha256)
+        if path is None or not path.exists():
+            return None
+        return path.read_bytes()
+
+    def _get_remote(self, sha256: str, user_id: str) -> Optional[bytes]:
+        latex_result = (
+            self.supabase.table("generated_file")
+            .select("generated_resume_id")
+            .eq("user_id", user_id)
+            .eq("type", "LATEX")
+            .eq("sha256", sha256)
+            .limit(1)
+            .execute()
+        )
+        if not latex_result.data:
+            return None
+
+        pdf_result = (
+            self.supabase.table("generated_file")
+            .select("storage_key")
+            .eq("generated_resume_id", latex_result.data[0]["generated_resume_id"])
+            .eq("type", "PDF")
+            .limit(1)
+            .execute()
+        )
+        if not pdf_result.data:
+            return None
+
+        try:
+            return download_file(pdf_result.data[0]["storage_key"])
+        except Exception:
+            # Object deleted or storage unavailable: fall back to compiling
+            return None
+
+    def get(self, sha256: str, user_id: str) -> Optional[bytes]:
+        """Get a cached PDF for rendered LaTeX, or None on miss."""
+        pdf_bytes = self._get_local(sha256)
+        if pdf_bytes is not None:
+            return pdf_bytes
+
+        pdf_bytes = self._get_remote(sha256, user_id)
+        if pdf_bytes is not None:
+            self.put(sha256, pdf_bytes)
+        return pdf_bytes
+
+    def put(self, sha256: str, pdf_bytes: bytes) -> None:
+        """Store a compiled PDF in the local cache."""
+        path = self._local_path(sha256)
+        if path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename so concurrent readers never see a partial file
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as tmp_file:
+            tmp_file.write(pdf_bytes)
+        os.replace(tmp_name, path)
@@ -1,52 +1,295 @@
 """LaTeX to PDF compilation using Tectonic."""
 
+import atexit
+import logging
+import os
+import queue
+import shutil
 import subprocess
 import tempfile
+import threading
 from pathlib import Path
+from typing import Dict, List, Optional
 
+from app.core.config import settings
+from app.latex.renderer import TEMPLATE_FILE, TEMPLATES_ROOT, render_latex
 
-def compile_pdf(latex_content: str) -> bytes:
-    """
-    Compile LaTeX content to PDF using Tectonic.
+logger = logging.getLogger(__name__)
 
-    Args:
-        latex_content: LaTeX source code
+# Minimal document used when no template renders; pulls in the resume class' package set
+WARMUP_DOCUMENT = "\\documentclass{resume}\n\\begin{document}\nwarmup\n\\end{document}\n"
 
-    Returns:
-        PDF file bytes
+# Sample content filling every template section, so warm-up fetches what real resumes use
+WARMUP_PROFILE = {
+    "profile": {
+        "name": "Warm Up",
+        "contacts": [
+            {"contact_kind": kind, "value": value}
+            for kind, value in (
+                ("email", "warmup@example.com"),
+                ("phone", "555-0100"),
+                ("location", "Remote"),
+                ("linkedin", "linkedin.com/in/warmup"),
+                ("github", "github.com/warmup"),
+                ("website", "example.com"),
+            )
+        ],
+    }
+}
+WARMUP_AI_OUTPUT = {
+    "education": [
+        {
+            "school": "University",
+            "location": "City",
+            "start_date": "2018",
+            "end_date": "2022",
+            "degree": "BSc",
+            "major": "Computer Science",
+            "gpa": "4.0",
+            "highlights": ["Highlight"],
+        }
+    ],
+    "experience": [
+        {
+            "company": "Company",
+            "location": "City",
+            "start_date": "2022",
+            "is_current": True,
+            "role": "Engineer",
+            "bullets": [{"bullet": "Bullet"}],
+        }
+    ],
+    "projects": [
+        {
+            "name": "Project",
+            "start_date": "2021",
+            "end_date": "2022",
+            "role": "Author",
+            "bullets": [{"bullet": "Bullet"}],
+            "technologies": ["Python"],
+        }
+    ],
+    "skills": [{"name": "Languages", "items": ["Python"]}],
+}
 
-    Raises:
-        RuntimeError: If compilation fails
+
+def warmup_documents() -> List[str]:
+    """Render every template with sample content, falling back to ``WARMUP_DOCUMENT``."""
+    documents = []
+    for template_file in sorted(TEMPLATES_ROOT.glob(f"*/{TEMPLATE_FILE}")):
+        name = template_file.parent.name
+        try:
+            documents.append(render_latex(WARMUP_PROFILE, WARMUP_AI_OUTPUT, True, True, name))
+        except Exception as e:
+            logger.warning("Could not render template %s for warm-up: %s", name, e)
+    return documents or [WARMUP_DOCUMENT]
+
+
+class CompileEngine:
+    """
+    Pool of warm Tectonic workspaces.
+
+    Tectonic has no server mode, so warmth comes from state that outlives a
+    single compile: every workspace is a long-lived directory pre-seeded with
+    the template class files, and all compiles share one persistent Tectonic
+    cache directory holding the downloaded bundle files and the generated
+    LaTeX format. Once warmed, compiles run with ``--only-cached`` and never
+    touch the network. The pool size bounds concurrent compiles; callers
+    beyond it wait in the queue.
     """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Write LaTeX file
-        tex_file = Path(tmpdir) / "resume.tex"
+
+    def __init__(
+        self,
+        pool_size: int,
+        cache_dir: Optional[str] = None,
+        timeout: int = 30,
+        class_files: Optional[List[Path]] = None,
+    ):
+        """Create ``pool_size`` workspaces seeded with ``class_files``."""
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
+
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.cache_dir = cache_dir
+        self.warmed = False
+
+        self._root = Path(tempfile.mkdtemp(prefix="tectonic-pool-"))
+        self._workspaces: "queue.Queue[Path]" = queue.Queue()
+        for index in range(pool_size):
+            workspace = self._root / f"workspace-{index}"
+            workspace.mkdir()
+            for class_file in class_files or []:
+                shutil.copy2(class_file, workspace / class_file.name)
+            self._workspaces.put(workspace)
+
+        self._env = dict(os.environ)
+        if cache_dir:
+            Path(cache_dir).mkdir(parents=True, exist_ok=True)
+            self._env["TECTONIC_CACHE_DIR"] = cache_dir
+
+        self._lock = threading.Lock()
+        self._waiting = 0
+        self._in_flight = 0
+
+    def _command(self, workspace: Path, tex_file: Path, only_cached: bool) -> List[str]:
+        command = ["tectonic", "--outdir", str(workspace), "--untrusted"]
+        if only_cached:
+            command.append("--only-cached")
+        command.append(str(tex_file))
+        return command
+
+    def _tectonic(self, workspace: Path, tex_file: Path, only_cached: bool) -> None:
+        subprocess.run(
+            self._command(workspace, tex_file, only_cached),
+            capture_output=True,
+            text=True,
+            timeout=self.timeout,
+            check=True,
+            cwd=str(workspace),
+            env=self._env,
+        )
+
+    def _run(self, workspace: Path, latex_content: str) -> bytes:
+        tex_file = workspace / "resume.tex"
+        pdf_file = workspace / "resume.pdf"
         tex_file.write_text(latex_content, encoding="utf-8")
 
-        # Compile with Tectonic
+        only_cached = self.warmed and settings.TECTONIC_ONLY_CACHED
         try:
-            result = subprocess.run(
-                [
-                    "tectonic",
-                    "--outdir",
-                    str(tmpdir),
-                    "--untrusted",
-                    str(tex_file),
-                ],
-                capture_output=True,
-                text=True,
-                timeout=30,
-                check=True,
-            )
+            try:
+                self._tectonic(workspace, tex_file, only_cached)
+            except subprocess.CalledProcessError as e:
+                if not only_cached:
+                    raise
+                # The document needs a bundle file the warm-up didn't fetch; allow the download
+                logger.info("Cache miss compiling offline, retrying with network: %s", e.stderr)
+                self._tectonic(workspace, tex_file, False)
         except subprocess.TimeoutExpired:
             raise RuntimeError("LaTeX compilation timed out")
         except subprocess.CalledProcessError as e:
             raise RuntimeError(f"LaTeX compilation failed: {e.stderr}")
 
-        # Read PDF
-        pdf_file = Path(tmpdir) / "resume.pdf"
         if not pdf_file.exists():
             raise RuntimeError("PDF file was not generated")
 
         return pdf_file.read_bytes()
 
+    def compile(self, latex_content: str) -> bytes:
+        """
+        Compile LaTeX content to PDF in the next free workspace.
+
+        Args:
+            latex_content: LaTeX source code
+
+        Returns:
+            PDF file bytes
+
+        Raises:
+            RuntimeError: If compilation fails
+        """
+        with self._lock:
+            self._waiting += 1
+        try:
+            workspace = self._workspaces.get()
+        finally:
+            with self._lock:
+                self._waiting -= 1
+                self._in_flight += 1
+
+        try:
+            return self._run(workspace, latex_content)
+        finally:
+            for name in ("resume.tex", "resume.pdf"):
+                (workspace / name).unlink(missing_ok=True)
+            with self._lock:
+                self._in_flight -= 1
+            self._workspaces.put(workspace)
+
+    def warm(self) -> bool:
+        """Compile the rendered templates to populate the bundle and format cache."""
+        try:
+            for document in warmup_documents():
+                self.compile(document)
+        except (RuntimeError, OSError) as e:
+            logger.warning("Tectonic warm-up failed: %s", e)
+            return False
+        self.warmed = True
+        return True
+
+    def warm_in_background(self) -> threading.Thread:
+        """Run :meth:`warm` in a daemon thread so process start-up isn't held up."""
+        thread = threading.Thread(target=self.warm, name="tectonic-warmup", daemon=True)
+        thread.start()
+        return thread
+
+    def stats(self) -> Dict[str, int]:
+        """Get pool size, running compiles and number of queued callers."""
+        with self._lock:
+            return {
+                "pool_size": self.pool_size,
+                "in_flight": self._in_flight,
+                "queue_depth": self._waiting,
+            }
+
+    def close(self) -> None:
+        """Remove all workspaces."""
+        shutil.rmtree(self._root, ignore_errors=True)
+
+
+_engine: CompileEngine | None = None
+_engine_lock = threading.Lock()
+
+
+def get_compile_engine() -> CompileEngine:
+    """Get the per-process compile engine, creating it on first use."""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = CompileEngine(
+                    pool_size=settings.LATEX_COMPILE_POOL_SIZE,
+                    cache_dir=settings.TECTONIC_CACHE_DIR or None,
+                    timeout=settings.LATEX_COMPILE_TIMEOUT,
+                    class_files=sorted(TEMPLATES_ROOT.glob("*/*.cls")),
+                )
+    return _engine
+
+
+def close_compile_engine() -> None:
+    """Remove the per-process engine's workspaces, if it was created."""
+    global _engine
+    with _engine_lock:
+        if _engine is not None:
+            _engine.close()
+            _engine = None
+
+
+def init_compile_process() -> None:
+    """
+    Process pool initializer: build and warm the engine, and close it at exit.
+
+    Pool processes don't get Celery's worker process signals, so without this
+    each one would build a cold engine on its first compile and leave its
+    workspaces behind.
+    """
+    engine = get_compile_engine()
+    atexit.register(close_compile_engine)
+    if settings.LATEX_WARM_ON_START:
+        engine.warm()
+
+
+def compile_pdf(latex_content: str) -> bytes:
+    """
+    Compile LaTeX content to PDF using Tectonic.
+
+    Args:
+        latex_content: LaTeX source code
+
+    Returns:
+        PDF file bytes
+
+    Raises:
+        RuntimeError: If compilation fails
+    """
+    return get_compile_engine().compile(latex_content)
@@ -1,18 +1,87 @@
 """LaTeX template rendering."""
 
-import os
-from typing import Dict
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
 
+from app.core.config import settings
 from shared.app.utils.latex import escape_latex
 
+# templates/ directory at the repository root
+TEMPLATES_ROOT = Path(__file__).resolve().parent.parent.parent.parent / "templates"
+TEMPLATE_FILE = "template.tex.jinja2"
+DEFAULT_TEMPLATE = "jakes-resume"
+
+# resume_template names (as stored in the database) mapped to template directories
+TEMPLATE_ALIASES = {
+    "JakesResumeATS": "jakes-resume",
+    "jakes-resume-ats": "jakes-resume",
+}
+
+
+class TemplateRegistry:
+    """
+    Per-process registry of compiled LaTeX templates.
+
+    Each template is loaded and compiled once and then reused for every
+    render. Templates are keyed by (name, version), and each new key reads
+    the template file from disk again, so bumping the resume_template
+    version picks up an edited template without a restart.
+    """
+
+    def __init__(self, templates_root: Path, bytecode_cache_dir: Optional[str] = None):
+        """Initialize registry for templates under ``templates_root``."""
+        bytecode_cache = None
+        if bytecode_cache_dir:
+            Path(bytecode_cache_dir).mkdir(parents=True, exist_ok=True)
+            bytecode_cache = FileSystemBytecodeCache(bytecode_cache_dir)
+
+        self.env = Environment(
+            loader=FileSystemLoader(str(templates_root)),
+            autoescape=False,  # LaTeX has its own escaping
+            auto_reload=False,  # Templates are immutable for the life of the worker
+            bytecode_cache=bytecode_cache,
+        )
+        self._templates: Dict[Tuple[str, Optional[str]], Template] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str = DEFAULT_TEMPLATE, version: Optional[str] = None) -> Template:
+        """Get the compiled template for a template name and version."""
+        key = (name, version)
+        template = self._templates.get(key)
+        if template is None:
+            with self._lock:
+                template = self._templates.get(key)
+                if template is None:
+                    directory = TEMPLATE_ALIASES.get(name, name)
+                    # loader.load bypasses the environment's by-path template cache
+                    template = self.env.loader.load(self.env, f"{directory}/{TEMPLATE_FILE}")
+                    self._templates[key] = template
+        return template
+
+
+_registry: TemplateRegistry | None = None
+
+
+def get_template_registry() -> TemplateRegistry:
+    """Get the process-wide template registry."""
+    global _registry
+    if _registry is None:
+        _registry = TemplateRegistry(
+            TEMPLATES_ROOT, bytecode_cache_dir=settings.TEMPLATE_BYTECODE_CACHE_DIR or None
+        )
+    return _registry
+
 
 def render_latex(
     profile_data: Dict,
     ai_output: Dict,
     include_projects: bool,
     include_skills: bool,
+    template_name: str = DEFAULT_TEMPLATE,
+    template_version: Optional[str] = None,
 ) -> str:
     """
     Render LaTeX template with profile and AI output data.
@@ -22,22 +91,13 @@ def render_latex(
         ai_output: AI-selected content
         include_projects: Whether to include projects section
         include_skills: Whether to include skills section
+        template_name: resume_template name or template directory
+        template_version: resume_template version (cache key only)
 
     Returns:
         Rendered LaTeX content
     """
-    # Get template directory
-    template_dir = os.path.join(
-        os.path.dirname(__file__), "../../../templates/jakes-resume"
-    )
-
-    # Setup Jinja2 environment
-    env = Environment(
-        loader=FileSystemLoader(template_dir),
-        autoescape=False,  # LaTeX has its own escaping
-    )
-
-    template = env.get_template("template.tex.jinja2")
+    template = get_template_registry().get(template_name, template_version)
 
     # Extract contact info from profile
     profile = profile_data.get("profile", {})
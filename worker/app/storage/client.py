@@ -1,10 +1,59 @@
 """Supabase Storage client."""
 
+import asyncio
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, NamedTuple, Optional
+
 from supabase import Client, create_client
 
+from app.core.aio import get_async_supabase_client
 from app.core.config import settings
 
+BUCKET = "generated-resumes"
+
 _supabase_client: Client | None = None
+_upload_executor: ThreadPoolExecutor | None = None
+_upload_executor_lock = threading.Lock()
+
+
+class Artifact(NamedTuple):
+    """A generated file to upload, with its size and SHA-256 computed once."""
+
+    type: str
+    storage_key: str
+    data: bytes
+    mime_type: str
+    sha256: str
+
+    @classmethod
+    def from_bytes(
+        cls,
+        file_type: str,
+        storage_key: str,
+        data: bytes,
+        mime_type: str,
+        sha256: Optional[str] = None,
+    ) -> "Artifact":
+        """Build an artifact, hashing ``data`` unless its SHA-256 is already known."""
+        sha256 = sha256 or hashlib.sha256(data).hexdigest()
+        return cls(file_type, storage_key, data, mime_type, sha256)
+
+    @property
+    def size_bytes(self) -> int:
+        """Size of the file in bytes."""
+        return len(self.data)
+
+    def file_record(self) -> Dict:
+        """Fields of the ``generated_file`` row describing this artifact."""
+        return {
+            "type": self.type,
+            "storage_key": self.storage_key,
+            "mime_type": self.mime_type,
+            "size_bytes": self.size_bytes,
+            "sha256": self.sha256,
+        }
 
 
 def get_storage_client() -> Client:
@@ -17,6 +66,19 @@ def get_storage_client() -> Client:
     return _supabase_client
 
 
+def _get_upload_executor() -> ThreadPoolExecutor:
+    """Get the per-process thread pool used for concurrent uploads."""
+    global _upload_executor
+    if _upload_executor is None:
+        with _upload_executor_lock:
+            if _upload_executor is None:
+                _upload_executor = ThreadPoolExecutor(
+                    max_workers=max(1, settings.STORAGE_UPLOAD_CONCURRENCY),
+                    thread_name_prefix="storage-upload",
+                )
+    return _upload_executor
+
+
 def upload_file(storage_key: str, file_bytes: bytes, mime_type: str) -> None:
     """
     Upload file to Supabase Storage.
@@ -27,7 +89,69 @@ def upload_file(storage_key: str, file_bytes: bytes, mime_type: str) -> None:
         mime_type: MIME type of the file
     """
     client = get_storage_client()
-    client.storage.from_("generated-resumes").upload(
+    client.storage.from_(BUCKET).upload(
         storage_key, file_bytes, file_options={"content-type": mime_type}
     )
 
+
+def upload_files(artifacts: List[Artifact]) -> None:
+    """
+    Upload several artifacts concurrently.
+
+    Uploads share the storage client's connection pool and run on a
+    per-process thread pool of ``STORAGE_UPLOAD_CONCURRENCY`` threads.
+
+    Args:
+        artifacts: Files to upload
+
+    Raises:
+        Exception: The first upload error, after all uploads have finished
+    """
+    if len(artifacts) == 1:
+        artifact = artifacts[0]
+        upload_file(artifact.storage_key, artifact.data, artifact.mime_type)
+        return
+
+    executor = _get_upload_executor()
+    futures = [
+        executor.submit(upload_file, artifact.storage_key, artifact.data, artifact.mime_type)
+        for artifact in artifacts
+    ]
+    errors = [future.exception() for future in futures]
+    for error in errors:
+        if error is not None:
+            raise error
+
+
+async def aupload_files(artifacts: List[Artifact]) -> None:
+    """
+    Upload several artifacts concurrently with the async Storage client (asyncio mode).
+
+    Args:
+        artifacts: Files to upload
+    """
+    bucket = (await get_async_supabase_client()).storage.from_(BUCKET)
+    await asyncio.gather(
+        *(
+            bucket.upload(
+                artifact.storage_key,
+                artifact.data,
+                file_options={"content-type": artifact.mime_type},
+            )
+            for artifact in artifacts
+        )
+    )
+
+
+def download_file(storage_key: str) -> bytes:
+    """
+    Download file from Supabase Storage.
+
+    Args:
+        storage_key: Storage key/path
+
+    Returns:
+        File content as bytes
+    """
+    client = get_storage_client()
+    return client.storage.from_(BUCKET).download(storage_key)
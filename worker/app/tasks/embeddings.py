@@ -1,11 +1,217 @@
 """Embedding generation tasks."""
 
+import logging
+from itertools import chain
+from typing import Dict, List, Optional
+
+from supabase import Client, create_client
+
+from app.ai.embeddings import EmbeddingProvider, get_embedding_provider
 from app.celery_app import celery_app
+from app.core.config import settings
+from app.core.redis import get_redis_client
+
+# Tables with an embedding column, mapped to the column holding the source text
+EMBEDDING_SOURCES: Dict[str, str] = {
+    "job_description": "raw_text",
+    "experience_bullet": "bullet",
+    "project_bullet": "bullet",
+}
+
+logger = logging.getLogger(__name__)
+
+# Pending rows per table: Redis hash of row id -> enqueue counter
+PENDING_KEY = "embeddings:pending-versions:{table}"
+FLUSH_SCHEDULED_KEY = "embeddings:flush-scheduled"
+
+# Drop pending ids (ARGV: id, counter, ...) whose counter is unchanged, so an
+# id re-enqueued while its old text was being embedded stays pending.
+# Returns the number of ids still pending.
+RELEASE_PENDING_SCRIPT = """
+for i = 1, #ARGV, 2 do
+  if redis.call('HGET', KEYS[1], ARGV[i]) == ARGV[i + 1] then
+    redis.call('HDEL', KEYS[1], ARGV[i])
+  end
+end
+return redis.call('HLEN', KEYS[1])
+"""
+
+# Initialize Supabase client
+supabase: Client = create_client(settings.SUPABASE_URL, settings.SUPABASE_SERVICE_KEY)
+
+
+def vector_literal(embedding: List[float]) -> str:
+    """Format an embedding as a pgvector text literal."""
+    return "[" + ",".join(repr(float(x)) for x in embedding) + "]"
+
+
+def embed_rows(supabase: Client, table: str, rows: List[Dict], provider: EmbeddingProvider) -> int:
+    """
+    Embed rows whose text changed since their last embedding and write them back.
+
+    Rows are embedded in batches of ``EMBEDDING_BATCH_SIZE`` texts per
+    provider call and written with one ``set_embeddings`` call per batch.
+
+    Args:
+        supabase: Supabase client
+        table: Table name (key of EMBEDDING_SOURCES)
+        rows: Rows with ``id``, the source text column and ``embedding_text_hash``
+        provider: Embedding provider
+
+    Returns:
+        Number of rows embedded
+    """
+    text_column = EMBEDDING_SOURCES[table]
+
+    stale = []
+    for row in rows:
+        text = row.get(text_column) or ""
+        text_hash = provider.text_hash(text)
+        if row.get("embedding_text_hash") != text_hash:
+            stale.append((row["id"], text, text_hash))
+
+    batch_size = max(1, settings.EMBEDDING_BATCH_SIZE)
+    for start in range(0, len(stale), batch_size):
+        batch = stale[start : start + batch_size]
+        embeddings = provider.embed_batch([text for _, text, _ in batch])
+        supabase.rpc(
+            "set_embeddings",
+            {
+                "p_table": table,
+                "p_ids": [row_id for row_id, _, _ in batch],
+                "p_embeddings": [vector_literal(embedding) for embedding in embeddings],
+                "p_text_hashes": [text_hash for _, _, text_hash in batch],
+            },
+        ).execute()
+
+    return len(stale)
+
+
+def fetch_rows(table: str, ids: List[str]) -> List[Dict]:
+    """Fetch the fields needed for embedding for a set of row ids."""
+    result = (
+        supabase.table(table)
+        .select(f"id, {EMBEDDING_SOURCES[table]}, embedding_text_hash")
+        .in_("id", ids)
+        .execute()
+    )
+    return result.data or []
+
+
+def enqueue_embedding(table: str, row_id: str) -> None:
+    """
+    Mark a row as needing an embedding.
+
+    Pending rows are coalesced in Redis and embedded together by
+    ``flush_pending_embeddings``, which runs at most once per
+    ``EMBEDDING_FLUSH_INTERVAL`` seconds.
+    """
+    if table not in EMBEDDING_SOURCES:
+        raise ValueError(f"Table has no embedding column: {table}")
+
+    redis_client = get_redis_client()
+    redis_client.hincrby(PENDING_KEY.format(table=table), row_id, 1)
+    if redis_client.set(
+        FLUSH_SCHEDULED_KEY, 1, nx=True, ex=max(1, int(settings.EMBEDDING_FLUSH_INTERVAL * 2))
+    ):
+        flush_pending_embeddings.apply_async(countdown=settings.EMBEDDING_FLUSH_INTERVAL)
+
+
+@celery_app.task(
+    bind=True,
+    name="worker.app.tasks.embeddings.flush_pending_embeddings",
+    max_retries=settings.EMBEDDING_FLUSH_MAX_RETRIES,
+)
+def flush_pending_embeddings(self) -> Dict[str, int]:
+    """
+    Embed up to one batch of pending rows per table.
+
+    Ids are only removed from the pending set after their embeddings are
+    written, so a provider or database error leaves them queued and the
+    task is retried. An id enqueued again while it was being embedded
+    (its text was edited meanwhile) is kept for the next flush.
+    """
+    redis_client = get_redis_client()
+    redis_client.delete(FLUSH_SCHEDULED_KEY)
+    provider = get_embedding_provider()
+
+    embedded: Dict[str, int] = {}
+    remaining = False
+    error: Optional[Exception] = None
+    for table in EMBEDDING_SOURCES:
+        key = PENDING_KEY.format(table=table)
+        # Flat [id, counter, id, counter, ...] reply
+        pending = redis_client.hrandfield(key, settings.EMBEDDING_BATCH_SIZE, withvalues=True) or []
+        versions = {
+            (row_id.decode("utf-8") if isinstance(row_id, bytes) else row_id): counter
+            for row_id, counter in zip(pending[::2], pending[1::2])
+        }
+        if not versions:
+            continue
+
+        ids = list(versions)
+        try:
+            embedded[table] = embed_rows(supabase, table, fetch_rows(table, ids), provider)
+        except Exception as e:
+            logger.warning("Embedding %d pending %s rows failed: %s", len(ids), table, e)
+            error = e
+            continue
+        still_pending = redis_client.eval(
+            RELEASE_PENDING_SCRIPT, 1, key, *chain.from_iterable(versions.items())
+        )
+        remaining = remaining or still_pending > 0
+
+    if error is not None:
+        raise self.retry(exc=error, countdown=settings.EMBEDDING_FLUSH_INTERVAL)
+
+    if remaining and redis_client.set(FLUSH_SCHEDULED_KEY, 1, nx=True):
+        flush_pending_embeddings.delay()
+
+    return embedded
+
+
+@celery_app.task(name="worker.app.tasks.embeddings.backfill_embeddings")
+def backfill_embeddings(table: Optional[str] = None) -> Dict[str, int]:
+    """
+    Embed every row whose embedding is missing or stale, one keyset page at a time.
+
+    All rows are scanned: a stored ``embedding_text_hash`` that no longer
+    matches the row's text (edited outside the API, or a model change) can
+    only be detected by hashing the current text, which ``embed_rows`` does
+    before calling the provider.
+    """
+    provider = get_embedding_provider()
+    tables = [table] if table else list(EMBEDDING_SOURCES)
+
+    embedded: Dict[str, int] = {}
+    for name in tables:
+        embedded[name] = 0
+        last_id: Optional[str] = None
+        while True:
+            query = (
+                supabase.table(name)
+                .select(f"id, {EMBEDDING_SOURCES[name]}, embedding_text_hash")
+                .order("id")
+                .limit(settings.EMBEDDING_BATCH_SIZE)
+            )
+            if last_id is not None:
+                query = query.gt("id", last_id)
+            rows = query.execute().data or []
+            if not rows:
+                break
+            embedded[name] += embed_rows(supabase, name, rows, provider)
+            last_id = rows[-1]["id"]
+
+    return embedded
+
+
+@celery_app.task(name="worker.app.tasks.embeddings.enqueue_row_embedding")
+def enqueue_row_embedding(table: str, row_id: str) -> None:
+    """Mark a row as needing an embedding (sent by the API through the broker)."""
+    enqueue_embedding(table, row_id)
 
 
 @celery_app.task(name="worker.app.tasks.embeddings.generate_embedding_for_jd")
 def generate_embedding_for_jd(jd_id: str) -> None:
     """Generate embedding for job description."""
-    # TODO: Implement embedding generation
-    pass
-
+    enqueue_embedding("job_description", jd_id)
@@ -1,55 +1,305 @@
-"""Main resume generation task."""
+"""Resume generation pipeline.
 
-import json
-import os
-from typing import Dict
+``generate_resume`` is replaced by a chain of stage tasks, each routed to the
+queue that suits its workload (see ``app.celery_app``):
 
-from celery import Task
-from supabase import Client, create_client
+1. ``generate_content`` (I/O queue): load the request and call the AI provider
+2. ``compile_resume`` (CPU queue): render LaTeX and compile the PDF
+3. ``publish_resume`` (I/O queue): upload files and mark the resume DONE
+
+Any stage that fails marks the resume FAILED, which stops the chain. The
+compile stage parks the LaTeX and PDF in a short-lived Redis hash and hands
+over only its key, so file bytes never travel through the broker, and
+intermediate stages ignore their results so nothing lands in the result
+backend. Storage uploads stay on the I/O queue.
 
+With ``WORKER_ASYNC_MODE`` the same steps instead run as one coroutine,
+``generate_resume_async``, on the process-wide event loop (see ``app.core.aio``).
+"""
+
+import asyncio
+import json
+import logging
 import os
-from typing import Dict
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
-from celery import Task
+from celery import Task, chain
 from supabase import Client, create_client
 
-from app.ai.provider import get_ai_provider
+from app.ai.cache import agenerate_content_cached, generate_content_cached, get_ai_response_cache
+from app.ai.embeddings import get_embedding_provider
+from app.ai.provider import AIProvider, get_ai_provider
+from app.ai.selection import parse_embedding, preselect_content
 from app.celery_app import celery_app
+from app.core.aio import get_async_runner, get_async_supabase_client
 from app.core.config import settings
+from app.core.events import publish_status
+from app.core.redis import get_redis_client
+from app.latex.cache import PDFCache, latex_sha256
 from app.latex.compiler import compile_pdf
-from app.latex.renderer import render_latex
-from app.storage.client import upload_file
-from shared.app.constants import GenerationStatus
+from app.latex.renderer import DEFAULT_TEMPLATE, render_latex
+from app.storage.client import Artifact, aupload_files, upload_files
+from shared.app.constants import GenerationStage, GenerationStatus
+
+logger = logging.getLogger(__name__)
+
+GENERATED_RESUME_SELECT = "*, resume_template(name, version)"
+ARTIFACT_SPOOL_KEY = "resume-artifacts:{generated_resume_id}"
+CANCELLED_REASON = "Generation cancelled: time limit exceeded or worker shut down"
 
 # Initialize Supabase client
 supabase: Client = create_client(
     settings.SUPABASE_URL, settings.SUPABASE_SERVICE_KEY
 )
 
+# Compiled PDFs keyed on rendered LaTeX hash
+pdf_cache = PDFCache(
+    supabase,
+    cache_dir=Path(settings.PDF_CACHE_DIR or Path(tempfile.gettempdir()) / "resume-pdf-cache"),
+)
+
+
+def fetch_jd_embedding(job_description_id: Optional[str]) -> Optional[List[float]]:
+    """Fetch the stored embedding of a saved job description, if any."""
+    if not job_description_id:
+        return None
+    result = (
+        supabase.table("job_description")
+        .select("embedding")
+        .eq("id", job_description_id)
+        .execute()
+    )
+    if not result.data:
+        return None
+    return parse_embedding(result.data[0].get("embedding"))
+
+
+def embed_job_description(jd_text: str) -> Optional[List[float]]:
+    """
+    Embed job description text on demand for pre-selection.
+
+    Used for pasted JDs and for saved JDs whose embedding hasn't been
+    written yet. Returns None if the provider fails, so generation goes on
+    without pre-selection.
+    """
+    if not jd_text:
+        return None
+    try:
+        return get_embedding_provider().embed_batch([jd_text])[0]
+    except Exception as e:
+        logger.warning("Could not embed job description for pre-selection: %s", e)
+        return None
+
+
+def mark_failed(generated_resume_id: str, error: Exception) -> None:
+    """Set a generated resume to FAILED with the error as reason."""
+    supabase.table("generated_resume").update(
+        {"status": GenerationStatus.FAILED, "failure_reason": str(error)}
+    ).eq("id", generated_resume_id).execute()
+    publish_status(generated_resume_id, GenerationStatus.FAILED, failure_reason=str(error))
+
+
+async def amark_failed(db, generated_resume_id: str, reason: str) -> None:
+    """Set a generated resume to FAILED with the async client (asyncio mode)."""
+    await db.table("generated_resume").update(
+        {"status": GenerationStatus.FAILED, "failure_reason": reason}
+    ).eq("id", generated_resume_id).execute()
+    await asyncio.to_thread(
+        publish_status, generated_resume_id, GenerationStatus.FAILED, failure_reason=reason
+    )
+
+
+def prepare_generation(
+    gen_resume: Dict, jd_embedding: Optional[List[float]]
+) -> Tuple[Dict, Dict]:
+    """
+    Build the AI provider inputs and the LaTeX render inputs of a request.
+
+    Args:
+        gen_resume: ``generated_resume`` row with its ``resume_template``
+        jd_embedding: Job description embedding for pre-selection, if any
+
+    Returns:
+        Tuple of (AI provider keyword arguments, ``render_latex`` keyword arguments)
+    """
+    profile_snapshot = json.loads(gen_resume["profile_snapshot"])
+
+    # Send only the bullets most relevant to the JD
+    ai_snapshot = profile_snapshot
+    if settings.AI_PRESELECT_ENABLED:
+        ai_snapshot = preselect_content(
+            profile_snapshot,
+            jd_embedding,
+            gen_resume["page_count"],
+            candidate_factor=settings.AI_PRESELECT_CANDIDATE_FACTOR,
+        )
+
+    ai_inputs = {
+        "profile_snapshot": ai_snapshot,
+        "job_description": gen_resume["jd_snapshot"],
+        "page_count": gen_resume["page_count"],
+        "include_projects": gen_resume["include_projects"],
+        "include_skills": gen_resume["include_skills"],
+    }
+    template = gen_resume.get("resume_template") or {}
+    render = {
+        "profile_data": profile_snapshot,
+        "include_projects": gen_resume["include_projects"],
+        "include_skills": gen_resume["include_skills"],
+        "template_name": template.get("name") or DEFAULT_TEMPLATE,
+        "template_version": template.get("version"),
+    }
+    return ai_inputs, render
+
+
+def content_payload(
+    generated_resume_id: str,
+    user_id: str,
+    ai_output: Dict,
+    ai_provider: AIProvider,
+    render: Dict,
+) -> Dict:
+    """Build the payload handed from content generation to compilation."""
+    return {
+        "generated_resume_id": generated_resume_id,
+        "user_id": user_id,
+        "ai_output": ai_output,
+        "provider": ai_provider.get_provider_name(),
+        "model_name": ai_provider.get_model_name(),
+        "prompt_version": ai_provider.get_prompt_version(),
+        "render": render,
+    }
+
+
+def render_resume(payload: Dict) -> Tuple[str, bytes, str]:
+    """Render the LaTeX of a content payload; returns (latex, UTF-8 bytes, SHA-256)."""
+    latex_content = render_latex(ai_output=payload["ai_output"], **payload["render"])
+    latex_bytes = latex_content.encode("utf-8")
+    return latex_content, latex_bytes, latex_sha256(latex_bytes)
+
+
+def build_artifacts(
+    payload: Dict, latex_bytes: bytes, latex_hash: str, pdf_bytes: bytes
+) -> List[Artifact]:
+    """Files to publish for a compiled payload; sizes and hashes come from the same buffers."""
+    prefix = f"{payload['user_id']}/{payload['generated_resume_id']}"
+    return [
+        Artifact.from_bytes(
+            "LATEX", f"{prefix}/resume.tex", latex_bytes, "text/x-latex", sha256=latex_hash
+        ),
+        Artifact.from_bytes("PDF", f"{prefix}/resume.pdf", pdf_bytes, "application/pdf"),
+    ]
+
+
+def compiled_payload(payload: Dict, artifacts: List[Artifact]) -> Dict:
+    """Replace render inputs with the ``generated_file`` records of uploaded artifacts."""
+    published = {key: value for key, value in payload.items() if key != "render"}
+    return {**published, "files": [artifact.file_record() for artifact in artifacts]}
+
+
+def spool_artifacts(payload: Dict, latex_bytes: bytes, latex_hash: str, pdf_bytes: bytes) -> Dict:
+    """
+    Park compiled files in Redis for the publish stage.
+
+    Returns:
+        Payload for ``publish_resume`` with the spool key instead of the bytes
+    """
+    key = ARTIFACT_SPOOL_KEY.format(generated_resume_id=payload["generated_resume_id"])
+    pipe = get_redis_client().pipeline()
+    pipe.hset(key, mapping={"latex": latex_bytes, "pdf": pdf_bytes})
+    pipe.expire(key, settings.ARTIFACT_SPOOL_TTL)
+    pipe.execute()
+
+    published = {name: value for name, value in payload.items() if name != "render"}
+    return {**published, "artifacts_key": key, "latex_sha256": latex_hash}
+
+
+def unspool_artifacts(payload: Dict) -> List[Artifact]:
+    """
+    Read the files parked by ``spool_artifacts``.
+
+    Raises:
+        RuntimeError: If the spooled files expired before publishing
+    """
+    files = get_redis_client().hgetall(payload["artifacts_key"])
+    if not files.get(b"latex") or not files.get(b"pdf"):
+        raise RuntimeError("Compiled files expired before they were published")
+    return build_artifacts(payload, files[b"latex"], payload["latex_sha256"], files[b"pdf"])
+
+
+def completion_params(payload: Dict) -> Dict:
+    """Parameters of ``complete_generated_resume`` (file rows plus DONE in one transaction)."""
+    return {
+        "p_generated_resume_id": payload["generated_resume_id"],
+        "p_files": payload["files"],
+        "p_ai_output_json": json.dumps(payload["ai_output"]),
+        "p_provider": payload["provider"],
+        "p_model_name": payload["model_name"],
+        "p_prompt_version": payload["prompt_version"],
+    }
+
+
+def generation_pipeline(generated_resume_id: str, bypass_ai_cache: bool = False) -> chain:
+    """Build the stage chain for one generated resume."""
+    return chain(
+        generate_content.si(generated_resume_id, bypass_ai_cache),
+        compile_resume.s(),
+        publish_resume.s(),
+    )
+
 
 @celery_app.task(bind=True, name="worker.app.tasks.generate_resume.generate_resume")
-def generate_resume(self: Task, generated_resume_id: str) -> Dict:
+def generate_resume(
+    self: Task, generated_resume_id: str, bypass_ai_cache: bool = False
+) -> Dict:
     """
     Generate resume task.
 
+    Set ``bypass_ai_cache`` to force a fresh AI response even when an
+    identical request was answered before.
+
+    The task replaces itself with ``generation_pipeline``, so its result
+    (and its place in a batch group) is that of the final stage.
+
+    In asyncio mode it schedules ``generate_resume_async`` instead and
+    returns ``{"status": "accepted"}`` before any work is done. The task's
+    success, and the completion of a batch group containing it, then only
+    mean the generation was accepted: track it through the
+    ``generated_resume`` status. The message is acknowledged on return, so a
+    generation lost to a hard crash stays RUNNING and is not redelivered;
+    on warm shutdown in-flight generations are drained or marked FAILED.
+    """
+    if settings.WORKER_ASYNC_MODE:
+        get_async_runner().submit(generate_resume_async, generated_resume_id, bypass_ai_cache)
+        return {"status": "accepted", "generated_resume_id": generated_resume_id}
+    return self.replace(generation_pipeline(generated_resume_id, bypass_ai_cache))
+
+
+@celery_app.task(
+    bind=True, name="worker.app.tasks.generate_resume.generate_content", ignore_result=True
+)
+def generate_content(
+    self: Task, generated_resume_id: str, bypass_ai_cache: bool = False
+) -> Dict:
+    """
+    Generation stage 1: fetch the request and generate content with the AI provider.
+
     Steps:
     1. Fetch generated_resume record
     2. Update status to RUNNING
-    3. Generate JD embedding if needed
-    4. Vector search for relevant content
-    5. Call AI provider
-    6. Validate and repair AI output
-    7. Render LaTeX
-    8. Compile PDF
-    9. Generate DOCX (if requested)
-    10. Upload files to Supabase Storage
-    11. Update status to DONE or FAILED
+    3. Select the content most relevant to the JD (embedding the JD if needed)
+    4. Generate the sections with the AI provider (cached per request fingerprint)
+
+    Returns:
+        Payload for ``compile_resume``
     """
     try:
         # Fetch record
         result = (
             supabase.table("generated_resume")
-            .select("*")
+            .select(GENERATED_RESUME_SELECT)
             .eq("id", generated_resume_id)
             .execute()
         )
@@ -63,79 +313,194 @@ def generate_resume(self: Task, generated_resume_id: str) -> Dict:
         supabase.table("generated_resume").update({"status": GenerationStatus.RUNNING}).eq(
             "id", generated_resume_id
         ).execute()
+        publish_status(generated_resume_id, GenerationStatus.RUNNING, GenerationStage.AI)
 
-        # Load profile snapshot
-        profile_snapshot = json.loads(gen_resume["profile_snapshot"])
-        jd_text = gen_resume["jd_snapshot"]
+        jd_embedding = None
+        if settings.AI_PRESELECT_ENABLED:
+            jd_embedding = fetch_jd_embedding(gen_resume.get("job_description_id"))
+            if not jd_embedding:
+                jd_embedding = embed_job_description(gen_resume["jd_snapshot"])
+        ai_inputs, render = prepare_generation(gen_resume, jd_embedding)
 
         # Get AI provider
         ai_provider = get_ai_provider()
 
-        # Generate content with AI
-        ai_output = ai_provider.generate_content(
-            profile_snapshot=profile_snapshot,
-            job_description=jd_text,
-            page_count=gen_resume["page_count"],
-            include_projects=gen_resume["include_projects"],
-            include_skills=gen_resume["include_skills"],
+        completed_sections = []
+
+        def report_section(section: str, value) -> None:
+            completed_sections.append(section)
+            self.update_state(
+                state="PROGRESS",
+                meta={"stage": GenerationStage.AI, "completed_sections": list(completed_sections)},
+            )
+            publish_status(
+                generated_resume_id,
+                GenerationStatus.RUNNING,
+                GenerationStage.AI,
+                completed_sections=list(completed_sections),
+            )
+
+        # Generate content with AI (memoized on the request fingerprint)
+        ai_output = generate_content_cached(
+            ai_provider,
+            get_ai_response_cache(),
+            bypass=bypass_ai_cache or not settings.AI_CACHE_ENABLED,
+            on_section=report_section if settings.AI_STREAMING else None,
+            **ai_inputs,
         )
 
-        # Render LaTeX
-        latex_content = render_latex(
-            profile_data=profile_snapshot,
-            ai_output=ai_output,
-            include_projects=gen_resume["include_projects"],
-            include_skills=gen_resume["include_skills"],
+        return content_payload(
+            generated_resume_id, gen_resume["user_id"], ai_output, ai_provider, render
         )
 
-        # Compile PDF
-        pdf_bytes = compile_pdf(latex_content)
-
-        # Upload files
-        user_id = gen_resume["user_id"]
-        storage_key_latex = f"{user_id}/{generated_resume_id}/resume.tex"
-        storage_key_pdf = f"{user_id}/{generated_resume_id}/resume.pdf"
-
-        upload_file(storage_key_latex, latex_content.encode("utf-8"), "text/x-latex")
-        upload_file(storage_key_pdf, pdf_bytes, "application/pdf")
-
-        # Store file records
-        supabase.table("generated_file").insert(
-            [
-                {
-                    "generated_resume_id": generated_resume_id,
-                    "user_id": user_id,
-                    "type": "LATEX",
-                    "storage_key": storage_key_latex,
-                    "mime_type": "text/x-latex",
-                    "size_bytes": len(latex_content.encode("utf-8")),
-                },
-                {
-                    "generated_resume_id": generated_resume_id,
-                    "user_id": user_id,
-                    "type": "PDF",
-                    "storage_key": storage_key_pdf,
-                    "mime_type": "application/pdf",
-                    "size_bytes": len(pdf_bytes),
-                },
-            ]
-        ).execute()
+    except Exception as e:
+        mark_failed(generated_resume_id, e)
+        raise
+
+
+@celery_app.task(name="worker.app.tasks.generate_resume.compile_resume", ignore_result=True)
+def compile_resume(payload: Dict) -> Dict:
+    """
+    Generation stage 2: render LaTeX and compile the PDF.
+
+    Args:
+        payload: Output of ``generate_content``
+
+    Returns:
+        Payload for ``publish_resume`` with ``artifacts_key`` and ``latex_sha256``
+    """
+    generated_resume_id = payload["generated_resume_id"]
+    try:
+        publish_status(generated_resume_id, GenerationStatus.RUNNING, GenerationStage.COMPILE)
+        latex_content, latex_bytes, latex_hash = render_resume(payload)
 
-        # Update status to DONE
-        supabase.table("generated_resume").update(
-            {
-                "status": GenerationStatus.DONE,
-                "ai_output_json": json.dumps(ai_output),
-                "provider": ai_provider.get_provider_name(),
-            }
-        ).eq("id", generated_resume_id).execute()
+        # Compile PDF (skipped when identical LaTeX was compiled before)
+        pdf_bytes = (
+            pdf_cache.get(latex_hash, payload["user_id"]) if settings.PDF_CACHE_ENABLED else None
+        )
+        if pdf_bytes is None:
+            pdf_bytes = compile_pdf(latex_content)
+            pdf_cache.put(latex_hash, pdf_bytes)
+
+        return spool_artifacts(payload, latex_bytes, latex_hash, pdf_bytes)
+
+    except Exception as e:
+        mark_failed(generated_resume_id, e)
+        raise
+
+
+@celery_app.task(name="worker.app.tasks.generate_resume.publish_resume")
+def publish_resume(payload: Dict) -> Dict:
+    """
+    Generation stage 3: upload files and mark the resume DONE.
+
+    Args:
+        payload: Output of ``compile_resume``
+
+    Returns:
+        Final task result
+    """
+    generated_resume_id = payload["generated_resume_id"]
+    try:
+        publish_status(generated_resume_id, GenerationStatus.RUNNING, GenerationStage.PUBLISH)
+
+        # Upload files concurrently
+        artifacts = unspool_artifacts(payload)
+        upload_files(artifacts)
+
+        # Store file records and mark DONE in one transaction
+        payload = compiled_payload(payload, artifacts)
+        supabase.rpc("complete_generated_resume", completion_params(payload)).execute()
+        get_redis_client().delete(payload["artifacts_key"])
+        publish_status(generated_resume_id, GenerationStatus.DONE)
 
         return {"status": "success", "generated_resume_id": generated_resume_id}
 
     except Exception as e:
-        # Update status to FAILED
-        supabase.table("generated_resume").update(
-            {"status": GenerationStatus.FAILED, "failure_reason": str(e)}
-        ).eq("id", generated_resume_id).execute()
+        mark_failed(generated_resume_id, e)
         raise
 
+
+async def generate_resume_async(generated_resume_id: str, bypass_ai_cache: bool = False) -> Dict:
+    """
+    Run the whole generation pipeline as one coroutine (asyncio mode).
+
+    Database, AI and Storage calls use async clients, so one process drives
+    many generations at once; compilation runs in the runner's process pool.
+    A cancelled generation (time limit or worker shutdown) is marked FAILED.
+    """
+    db = await get_async_supabase_client()
+    try:
+        result = await (
+            db.table("generated_resume")
+            .select(GENERATED_RESUME_SELECT)
+            .eq("id", generated_resume_id)
+            .execute()
+        )
+        if not result.data:
+            raise ValueError(f"Generated resume {generated_resume_id} not found")
+
+        gen_resume = result.data[0]
+
+        await db.table("generated_resume").update({"status": GenerationStatus.RUNNING}).eq(
+            "id", generated_resume_id
+        ).execute()
+        await asyncio.to_thread(
+            publish_status, generated_resume_id, GenerationStatus.RUNNING, GenerationStage.AI
+        )
+
+        jd_embedding = None
+        if settings.AI_PRESELECT_ENABLED and gen_resume.get("job_description_id"):
+            jd_result = await (
+                db.table("job_description")
+                .select("embedding")
+                .eq("id", gen_resume["job_description_id"])
+                .execute()
+            )
+            if jd_result.data:
+                jd_embedding = parse_embedding(jd_result.data[0].get("embedding"))
+        if settings.AI_PRESELECT_ENABLED and not jd_embedding:
+            jd_embedding = await asyncio.to_thread(embed_job_description, gen_resume["jd_snapshot"])
+        ai_inputs, render = prepare_generation(gen_resume, jd_embedding)
+
+        ai_provider = get_ai_provider()
+        ai_output = await agenerate_content_cached(
+            ai_provider,
+            get_ai_response_cache(),
+            bypass=bypass_ai_cache or not settings.AI_CACHE_ENABLED,
+            **ai_inputs,
+        )
+        payload = content_payload(
+            generated_resume_id, gen_resume["user_id"], ai_output, ai_provider, render
+        )
+
+        await asyncio.to_thread(
+            publish_status, generated_resume_id, GenerationStatus.RUNNING, GenerationStage.COMPILE
+        )
+        latex_content, latex_bytes, latex_hash = await asyncio.to_thread(render_resume, payload)
+        pdf_bytes = None
+        if settings.PDF_CACHE_ENABLED:
+            pdf_bytes = await asyncio.to_thread(pdf_cache.get, latex_hash, payload["user_id"])
+        if pdf_bytes is None:
+            pdf_bytes = await get_async_runner().run_cpu(compile_pdf, latex_content)
+            await asyncio.to_thread(pdf_cache.put, latex_hash, pdf_bytes)
+
+        await asyncio.to_thread(
+            publish_status, generated_resume_id, GenerationStatus.RUNNING, GenerationStage.PUBLISH
+        )
+        artifacts = build_artifacts(payload, latex_bytes, latex_hash, pdf_bytes)
+        await aupload_files(artifacts)
+        payload = compiled_payload(payload, artifacts)
+        await db.rpc("complete_generated_resume", completion_params(payload)).execute()
+        await asyncio.to_thread(publish_status, generated_resume_id, GenerationStatus.DONE)
+
+        return {"status": "success", "generated_resume_id": generated_resume_id}
+
+    except asyncio.CancelledError:
+        # Timed out or the worker is shutting down: the message is already
+        # acknowledged, so record the failure instead of leaving it RUNNING
+        await amark_failed(db, generated_resume_id, CANCELLED_REASON)
+        raise
+    except Exception as e:
+        await amark_failed(db, generated_resume_id, str(e))
+        raise
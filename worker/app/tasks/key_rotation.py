@@ -0,0 +1,159 @@
+"""Re-encryption of contact fields after an encryption key rotation."""
+
+import logging
+import time
+from typing import Dict, List, Optional, Tuple
+
+from celery.exceptions import SoftTimeLimitExceeded
+from supabase import Client, create_client
+
+from app.celery_app import celery_app
+from app.core.config import settings
+from app.core.redis import get_redis_client
+from shared.app.utils.encryption import KeyRing, decode_encrypted_columns, encode_bytea, get_keyring
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_KEY = "key-rotation:profile_contact:{version}"
+CONTACT_COLUMNS = "id, ciphertext, nonce, auth_tag, key_version"
+
+# Initialize Supabase client
+supabase: Client = create_client(settings.SUPABASE_URL, settings.SUPABASE_SERVICE_KEY)
+
+
+def reencrypt_batch(supabase: Client, keyring: KeyRing, rows: List[Dict]) -> Tuple[int, int]:
+    """
+    Re-encrypt a batch of contacts with the current key and write them back in one call.
+
+    Rows are decrypted with the key version they were stored with. Rows that
+    fail to decrypt (e.g. their key is no longer configured) are left as they
+    are. A row changed since it was read is skipped by the database function
+    and picked up again on the next run.
+
+    Args:
+        supabase: Supabase client
+        keyring: Key ring holding the old and current keys
+        rows: ``profile_contact`` rows with ``CONTACT_COLUMNS``
+
+    Returns:
+        Tuple of (rows updated, rows that failed to decrypt)
+    """
+    records = [
+        (
+            *decode_encrypted_columns(row["ciphertext"], row["nonce"], row["auth_tag"]),
+            row["key_version"],
+        )
+        for row in rows
+    ]
+    plaintexts = keyring.decrypt_many(records)
+
+    ok_rows = [row for row, plaintext in zip(rows, plaintexts) if plaintext is not None]
+    encrypted = keyring.encrypt_many(plaintext for plaintext in plaintexts if plaintext is not None)
+    failed = len(rows) - len(ok_rows)
+    if not ok_rows:
+        return 0, failed
+
+    result = supabase.rpc(
+        "reencrypt_profile_contacts",
+        {
+            "p_ids": [row["id"] for row in ok_rows],
+            "p_old_nonces": [row["nonce"] for row in ok_rows],
+            "p_ciphertexts": [encode_bytea(ciphertext) for ciphertext, _, _, _ in encrypted],
+            "p_nonces": [encode_bytea(nonce) for _, nonce, _, _ in encrypted],
+            "p_auth_tags": [encode_bytea(auth_tag) for _, _, auth_tag, _ in encrypted],
+            "p_key_version": keyring.current_version,
+        },
+    ).execute()
+    return int(result.data or 0), failed
+
+
+@celery_app.task(bind=True, name="worker.app.tasks.key_rotation.reencrypt_contacts")
+def reencrypt_contacts(self, batch_size: Optional[int] = None, restart: bool = False) -> Dict:
+    """
+    Re-encrypt every contact not yet on the current key version.
+
+    Contacts are streamed one keyset page (ordered by id) at a time, so the
+    table is never loaded whole and each write only touches one batch. The
+    last processed id is checkpointed in Redis after every batch; a rerun
+    (or the continuation queued when the soft time limit is hit) resumes
+    from there.
+
+    Args:
+        batch_size: Rows per batch (default: ``KEY_ROTATION_BATCH_SIZE``)
+        restart: Ignore any saved checkpoint and start from the first row
+
+    Returns:
+        Dict with the target key version, rows scanned/updated/failed and rows_per_sec
+    """
+    keyring = get_keyring()
+    target_version = keyring.current_version
+    batch_size = max(1, batch_size or settings.KEY_ROTATION_BATCH_SIZE)
+
+    redis_client = get_redis_client()
+    checkpoint_key = CHECKPOINT_KEY.format(version=target_version)
+    if restart:
+        redis_client.delete(checkpoint_key)
+    checkpoint = redis_client.get(checkpoint_key)
+    last_id = checkpoint.decode("utf-8") if isinstance(checkpoint, bytes) else checkpoint
+
+    scanned = updated = failed = 0
+    started = time.perf_counter()
+
+    def totals() -> Dict:
+        elapsed = time.perf_counter() - started
+        return {
+            "key_version": target_version,
+            "scanned": scanned,
+            "updated": updated,
+            "failed": failed,
+            "rows_per_sec": round(scanned / elapsed, 1) if elapsed > 0 else 0.0,
+        }
+
+    try:
+        while True:
+            query = (
+                supabase.table("profile_contact")
+                .select(CONTACT_COLUMNS)
+                .neq("key_version", target_version)
+                .order("id")
+                .limit(batch_size)
+            )
+            if last_id is not None:
+                query = query.gt("id", last_id)
+            rows = query.execute().data or []
+            if not rows:
+                break
+
+            batch_updated, batch_failed = reencrypt_batch(supabase, keyring, rows)
+            scanned += len(rows)
+            updated += batch_updated
+            failed += batch_failed
+            last_id = rows[-1]["id"]
+            redis_client.set(checkpoint_key, last_id)
+
+            progress = totals()
+            self.update_state(state="PROGRESS", meta=progress)
+            logger.info(
+                "Key rotation to v%s: %s rows re-encrypted (%s rows/sec)",
+                target_version,
+                updated,
+                progress["rows_per_sec"],
+            )
+    except SoftTimeLimitExceeded:
+        logger.info(
+            "Key rotation to v%s paused after %s, continuing in a new task", target_version, last_id
+        )
+        reencrypt_contacts.delay(batch_size=batch_size)
+        return totals()
+
+    redis_client.delete(checkpoint_key)
+    result = totals()
+    logger.info(
+        "Key rotation to v%s complete: %s scanned, %s updated, %s failed (%s rows/sec)",
+        target_version,
+        scanned,
+        updated,
+        failed,
+        result["rows_per_sec"],
+    )
+    return result
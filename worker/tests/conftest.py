@@ -1,22 +1,69 @@
 """Pytest fixtures for worker tests."""
 
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
+
+from shared.app.utils.encryption import encode_bytea
+
+# Query builder methods that return the builder, so calls can be chained
+QUERY_METHODS = (
+    "table",
+    "select",
+    "insert",
+    "upsert",
+    "update",
+    "delete",
+    "eq",
+    "neq",
+    "gt",
+    "in_",
+    "is_",
+    "order",
+    "limit",
+    "rpc",
+)
+
+
+def _query_mock():
+    mock = MagicMock()
+    for method in QUERY_METHODS:
+        getattr(mock, method).return_value = mock
+    return mock
 
 
 @pytest.fixture
 def mock_supabase():
     """Mock Supabase client."""
-    mock = MagicMock()
-    mock.table.return_value = mock
-    mock.select.return_value = mock
-    mock.insert.return_value = mock
-    mock.update.return_value = mock
-    mock.eq.return_value = mock
+    mock = _query_mock()
     mock.execute.return_value = MagicMock(data=[])
     return mock
 
 
+@pytest.fixture
+def mock_async_supabase():
+    """Mock async Supabase client (``await query.execute()``)."""
+    mock = _query_mock()
+    mock.execute = AsyncMock(return_value=MagicMock(data=[]))
+    return mock
+
+
+@pytest.fixture
+def contact_row():
+    """Factory for profile_contact rows encrypted with a given key ring."""
+
+    def make(keyring, row_id, plaintext, key_version=1):
+        ciphertext, nonce, auth_tag, version = keyring.encrypt(plaintext, key_version)
+        return {
+            "id": row_id,
+            "ciphertext": encode_bytea(ciphertext),
+            "nonce": encode_bytea(nonce),
+            "auth_tag": encode_bytea(auth_tag),
+            "key_version": version,
+        }
+
+    return make
+
+
 @pytest.fixture
 def profile_snapshot():
     """Sample profile snapshot."""
@@ -0,0 +1,58 @@
+"""Tests for AI response memoization."""
+
+from unittest.mock import MagicMock
+
+from worker.app.ai.cache import AIResponseCache, fingerprint, generate_content_cached
+from worker.app.ai.mock_adapter import MockAdapter
+
+
+def _inputs(profile_snapshot, job_description="Backend engineer"):
+    return {
+        "profile_snapshot": profile_snapshot,
+        "job_description": job_description,
+        "page_count": 1,
+        "include_projects": True,
+        "include_skills": True,
+    }
+
+
+def test_fingerprint_is_canonical(profile_snapshot):
+    """Test key order does not change the fingerprint but inputs do."""
+    adapter = MockAdapter()
+    reordered = dict(reversed(list(profile_snapshot.items())))
+
+    assert fingerprint(adapter, **_inputs(profile_snapshot)) == fingerprint(
+        adapter, **_inputs(reordered)
+    )
+    assert fingerprint(adapter, **_inputs(profile_snapshot)) != fingerprint(
+        adapter, **_inputs(profile_snapshot, "Frontend engineer")
+    )
+
+
+def test_generate_content_cached_hits_and_bypass(profile_snapshot):
+    """Test duplicate requests skip the provider unless bypassed."""
+    adapter = MagicMock(wraps=MockAdapter())
+    adapter.get_provider_name.return_value = "mock"
+    adapter.get_model_name.return_value = ""
+    adapter.get_prompt_version.return_value = "1"
+    cache = AIResponseCache(None, ttl_seconds=60, local_max_size=10)
+
+    first = generate_content_cached(adapter, cache, **_inputs(profile_snapshot))
+    second = generate_content_cached(adapter, cache, **_inputs(profile_snapshot))
+    assert first == second
+    assert adapter.generate_content.call_count == 1
+
+    generate_content_cached(adapter, cache, bypass=True, **_inputs(profile_snapshot))
+    assert adapter.generate_content.call_count == 2
+
+
+def test_ai_response_cache_reads_through_redis():
+    """Test Redis hits populate the local LRU."""
+    redis_client = MagicMock()
+    redis_client.get.return_value = b'{"education": []}'
+    redis_client.ttl.return_value = 30
+    cache = AIResponseCache(redis_client, ttl_seconds=60, local_max_size=10)
+
+    assert cache.get("key") == {"education": []}
+    assert cache.get("key") == {"education": []}
+    assert redis_client.get.call_count == 1
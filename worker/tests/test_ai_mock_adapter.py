@@ -29,3 +29,16 @@ def test_mock_adapter_generate_content():
     assert "experience" in result
     assert adapter.get_provider_name() == "mock"
 
+
+def test_get_ai_provider_reuses_instance(monkeypatch):
+    """Test providers are created once per process and closed on shutdown."""
+    from worker.app.ai.provider import close_ai_providers, get_ai_provider
+
+    monkeypatch.setenv("AI_PROVIDER", "mock")
+    close_ai_providers()
+
+    provider = get_ai_provider()
+    assert get_ai_provider() is provider
+
+    close_ai_providers()
+    assert get_ai_provider() is not provider
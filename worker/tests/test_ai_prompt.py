@@ -0,0 +1,58 @@
+"""Tests for compact prompt serialization."""
+
+import json
+
+from worker.app.ai.prompt import build_compact_profile, estimate_tokens, restore_ids
+
+SNAPSHOT = {
+    "profile": {"id": "profile-uuid", "name": "John Doe"},
+    "experience": [
+        {
+            "id": "exp-uuid",
+            "user_id": "user-uuid",
+            "profile_id": "profile-uuid",
+            "company": "Test Corp",
+            "role": "Engineer",
+            "location": None,
+            "is_current": False,
+            "created_at": "2024-01-01T00:00:00Z",
+            "experience_bullet": [
+                {"id": "b2-uuid", "bullet": "Second", "sort_order": 2, "embedding": None},
+                {"id": "b1-uuid", "bullet": "First", "sort_order": 1, "embedding": None},
+            ],
+        }
+    ],
+    "skills": [{"id": "cat-uuid", "name": "Languages", "skill_item": [{"item": "Python"}]}],
+}
+
+
+def test_build_compact_profile_projects_fields():
+    """Test only schema fields survive, with short ids and sorted bullets."""
+    compact = build_compact_profile(SNAPSHOT)
+
+    assert compact.data["experience"] == [
+        {
+            "id": "ex1",
+            "company": "Test Corp",
+            "role": "Engineer",
+            "bullets": [{"id": "ex1b1", "text": "First"}, {"id": "ex1b2", "text": "Second"}],
+        }
+    ]
+    assert compact.data["skills"] == [{"name": "Languages", "items": ["Python"]}]
+    assert compact.id_map == {"ex1": "exp-uuid", "ex1b1": "b1-uuid", "ex1b2": "b2-uuid"}
+    assert estimate_tokens(compact.to_json()) < estimate_tokens(json.dumps(SNAPSHOT, indent=2))
+
+
+def test_restore_ids_maps_back_to_database_ids():
+    """Test short ids in AI output are mapped back."""
+    compact = build_compact_profile(SNAPSHOT)
+    ai_output = {
+        "experience": [
+            {"id": "ex1", "bullets": [{"original_id": "ex1b2", "bullet": "Rewritten"}]}
+        ],
+        "skills": [],
+    }
+
+    restored = restore_ids(ai_output, compact.id_map)
+    assert restored["experience"][0]["id"] == "exp-uuid"
+    assert restored["experience"][0]["bullets"][0]["original_id"] == "b2-uuid"
@@ -0,0 +1,53 @@
+"""Tests for embedding-based content pre-selection."""
+
+from worker.app.ai.selection import preselect_content
+
+
+def _bullet(bullet_id, embedding):
+    return {"id": bullet_id, "bullet": bullet_id, "embedding": embedding}
+
+
+def test_preselect_keeps_most_relevant_bullets():
+    """Test bullets are trimmed to the most similar candidates in original order."""
+    snapshot = {
+        "experience": [
+            {
+                "id": "exp-1",
+                "experience_bullet": [
+                    _bullet("far", "[0.0, 1.0]"),
+                    _bullet("close", "[1.0, 0.0]"),
+                    _bullet("closer", [0.9, 0.1]),
+                    _bullet("missing", None),
+                ],
+            }
+        ],
+        "projects": [],
+    }
+
+    # Page count 1 allows 3 bullets; factor 0.5 sends 2 candidates
+    selected = preselect_content(snapshot, [1.0, 0.0], page_count=1, candidate_factor=0.5)
+
+    bullets = [b["id"] for b in selected["experience"][0]["experience_bullet"]]
+    assert bullets == ["close", "closer"]
+    assert len(snapshot["experience"][0]["experience_bullet"]) == 4
+
+
+def test_preselect_limits_projects_by_best_bullet():
+    """Test only the most relevant projects are kept."""
+    snapshot = {
+        "experience": [],
+        "projects": [
+            {"id": "p1", "project_bullet": [_bullet("a", [0.0, 1.0])]},
+            {"id": "p2", "project_bullet": [_bullet("b", [1.0, 0.0])]},
+            {"id": "p3", "project_bullet": [_bullet("c", [0.7, 0.7])]},
+        ],
+    }
+
+    # Page count 1 allows 2 projects
+    selected = preselect_content(snapshot, [1.0, 0.0], page_count=1, candidate_factor=1.0)
+    assert [p["id"] for p in selected["projects"]] == ["p2", "p3"]
+
+
+def test_preselect_without_jd_embedding_is_noop(profile_snapshot):
+    """Test snapshots pass through unchanged when the JD has no embedding."""
+    assert preselect_content(profile_snapshot, None, page_count=1) is profile_snapshot
@@ -0,0 +1,45 @@
+"""Tests for incremental parsing of streamed AI output."""
+
+import pytest
+
+from worker.app.ai.streaming import SectionStreamParser, parse_section_stream
+
+
+def test_sections_emitted_as_they_complete():
+    """Test each top-level section is returned once its value closes."""
+    parser = SectionStreamParser()
+
+    assert parser.feed('{"education": [{"school": "A, \\"B\\" }"}') == []
+    assert parser.feed('], "experi') == [("education", [{"school": 'A, "B" }'}])]
+    assert parser.feed('ence": [], "skills": null}') == [
+        ("experience", []),
+        ("skills", None),
+    ]
+    assert parser.done
+
+
+def test_parse_section_stream_from_small_chunks():
+    """Test parsing is independent of chunk boundaries."""
+    text = '{"education": [], "projects": [{"name": "p", "bullets": ["x"]}]}'
+    sections = dict(parse_section_stream(iter(text)))
+    assert sections == {"education": [], "projects": [{"name": "p", "bullets": ["x"]}]}
+
+
+def test_malformed_output_aborts_early():
+    """Test malformed sections raise before the stream finishes."""
+    consumed = []
+
+    def chunks():
+        for chunk in ['{"education": [}', ', "experience": []}']:
+            consumed.append(chunk)
+            yield chunk
+
+    with pytest.raises(ValueError, match="Malformed"):
+        list(parse_section_stream(chunks()))
+    assert len(consumed) == 1
+
+
+def test_truncated_stream_raises():
+    """Test a stream ending mid-object is rejected."""
+    with pytest.raises(ValueError, match="ended"):
+        list(parse_section_stream(['{"education": []']))
@@ -0,0 +1,163 @@
+"""Tests for the asyncio execution mode."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from worker.app.ai.cache import AIResponseCache, agenerate_content_cached
+from worker.app.ai.mock_adapter import MockAdapter
+from worker.app.core.aio import AsyncRunner
+from worker.app.tasks.generate_resume import CANCELLED_REASON, generate_resume_async
+
+
+def test_runner_limits_in_flight_coroutines():
+    """Test submit blocks once max_in_flight coroutines are running."""
+    runner = AsyncRunner(max_in_flight=2, compile_processes=1)
+    release = asyncio.Event()
+    started = []
+
+    async def job(name):
+        started.append(name)
+        await release.wait()
+        return name
+
+    try:
+        first = runner.submit(job, "a")
+        second = runner.submit(job, "b")
+        third_submitted = threading.Event()
+
+        def submit_third():
+            runner.submit(job, "c")
+            third_submitted.set()
+
+        threading.Thread(target=submit_third, daemon=True).start()
+        time.sleep(0.1)
+        assert not third_submitted.is_set()
+
+        runner.loop.call_soon_threadsafe(release.set)
+        assert {first.result(timeout=5), second.result(timeout=5)} == {"a", "b"}
+        assert third_submitted.wait(timeout=5)
+    finally:
+        runner.shutdown()
+    assert sorted(started) == ["a", "b", "c"]
+
+
+def test_runner_runs_cpu_work_in_process_pool():
+    """Test CPU-bound work is offloaded to the process pool."""
+    runner = AsyncRunner(max_in_flight=1, compile_processes=1)
+
+    async def job():
+        return await runner.run_cpu(pow, 2, 10)
+
+    try:
+        assert runner.submit(job).result(timeout=60) == 1024
+    finally:
+        runner.shutdown()
+
+
+def test_runner_initializes_pool_processes():
+    """Test each pool process runs the initializer before taking CPU work."""
+    initializer = MagicMock()
+    runner = AsyncRunner(max_in_flight=1, compile_processes=1, process_initializer=initializer)
+
+    try:
+        with patch("worker.app.core.aio.ProcessPoolExecutor") as mock_pool:
+            runner._get_process_pool()
+        assert mock_pool.call_args.kwargs["initializer"] is initializer
+    finally:
+        runner.shutdown()
+
+
+def test_runner_cancels_coroutines_after_timeout():
+    """Test a hung coroutine is cancelled after the runner timeout and frees its slot."""
+    runner = AsyncRunner(max_in_flight=1, compile_processes=1, timeout=0.05)
+
+    try:
+        future = runner.submit(asyncio.sleep, 10)
+        with pytest.raises(asyncio.TimeoutError):
+            future.result(timeout=5)
+        assert runner.submit(asyncio.sleep, 0, "ok").result(timeout=5) == "ok"
+    finally:
+        runner.shutdown(timeout=1)
+
+
+def test_runner_shutdown_drains_then_cancels_in_flight_work():
+    """Test shutdown lets short work finish, cancels the rest and refuses new work."""
+    runner = AsyncRunner(max_in_flight=2, compile_processes=1)
+    cancelled = []
+
+    async def hung():
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            await asyncio.sleep(0)  # failure handling may still await
+            cancelled.append(True)
+            raise
+
+    short = runner.submit(asyncio.sleep, 0.05, "done")
+    long = runner.submit(hung)
+
+    runner.shutdown(timeout=0.5)
+
+    assert short.result(timeout=1) == "done"
+    assert long.cancelled() or isinstance(long.exception(timeout=1), asyncio.CancelledError)
+    assert cancelled == [True]
+    with pytest.raises(RuntimeError):
+        runner.submit(asyncio.sleep, 0)
+
+
+@patch("worker.app.tasks.generate_resume.publish_status")
+@patch("worker.app.tasks.generate_resume.get_async_supabase_client")
+def test_shutdown_marks_in_flight_generation_failed(mock_get_db, mock_publish, mock_async_supabase):
+    """Test a generation still running at shutdown is marked FAILED, not left RUNNING."""
+    db = mock_async_supabase
+    started = threading.Event()
+
+    async def execute():
+        if not started.is_set():
+            started.set()
+            await asyncio.sleep(60)  # hung first query
+        return MagicMock(data=[])
+
+    db.execute = AsyncMock(side_effect=execute)
+    mock_get_db.return_value = db
+    runner = AsyncRunner(max_in_flight=1, compile_processes=1)
+
+    runner.submit(generate_resume_async, "resume-1")
+    assert started.wait(timeout=5)
+    runner.shutdown(timeout=0.1)
+
+    db.update.assert_called_with({"status": "FAILED", "failure_reason": CANCELLED_REASON})
+    assert mock_publish.call_args.kwargs["failure_reason"] == CANCELLED_REASON
+
+
+class CountingProvider(MockAdapter):
+    """Mock provider counting async calls."""
+
+    calls = 0
+
+    async def agenerate_content(self, **inputs):
+        CountingProvider.calls += 1
+        return {"summary": "async"}
+
+
+def test_agenerate_content_cached_reuses_response():
+    """Test the async path reads and fills the same response cache."""
+    provider = CountingProvider()
+    cache = AIResponseCache(None, ttl_seconds=60, local_max_size=8)
+    inputs = {
+        "profile_snapshot": {},
+        "job_description": "Engineer",
+        "page_count": 1,
+        "include_projects": True,
+        "include_skills": True,
+    }
+
+    first = asyncio.run(agenerate_content_cached(provider, cache, **inputs))
+    second = asyncio.run(agenerate_content_cached(provider, cache, **inputs))
+
+    assert first == second == {"summary": "async"}
+    assert CountingProvider.calls == 1
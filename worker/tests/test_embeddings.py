@@ -0,0 +1,120 @@
+"""Tests for the embedding pipeline."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from worker.app.ai.embeddings import LocalEmbeddingProvider
+from worker.app.tasks.embeddings import (
+    RELEASE_PENDING_SCRIPT,
+    backfill_embeddings,
+    embed_rows,
+    flush_pending_embeddings,
+)
+
+
+def test_local_embeddings_are_deterministic_and_normalized():
+    """Test the offline backend is stable and unit length."""
+    provider = LocalEmbeddingProvider(dimension=64)
+    first, second, other = provider.embed_batch(["Built APIs", "Built APIs", "Painted"])
+
+    assert first == second
+    assert first != other
+    assert abs(sum(x * x for x in first) - 1.0) < 1e-9
+
+
+@patch("worker.app.tasks.embeddings.settings")
+def test_embed_rows_batches_and_skips_unchanged(mock_settings, mock_supabase):
+    """Test unchanged rows are skipped and the rest written in batches."""
+    mock_settings.EMBEDDING_BATCH_SIZE = 2
+    provider = LocalEmbeddingProvider(dimension=8)
+    rows = [
+        {"id": "b1", "bullet": "Unchanged", "embedding_text_hash": provider.text_hash("Unchanged")},
+        {"id": "b2", "bullet": "New one", "embedding_text_hash": None},
+        {"id": "b3", "bullet": "Edited", "embedding_text_hash": "stale"},
+        {"id": "b4", "bullet": "Another", "embedding_text_hash": None},
+    ]
+
+    assert embed_rows(mock_supabase, "experience_bullet", rows, provider) == 3
+
+    calls = mock_supabase.rpc.call_args_list
+    assert [call.args[0] for call in calls] == ["set_embeddings", "set_embeddings"]
+    assert calls[0].args[1]["p_ids"] == ["b2", "b3"]
+    assert calls[1].args[1]["p_ids"] == ["b4"]
+    assert calls[0].args[1]["p_embeddings"][0].startswith("[")
+
+
+def _pending(versions):
+    """hrandfield reply with ``versions`` pending for experience bullets only."""
+
+    def hrandfield(key, count, withvalues):
+        if key != "embeddings:pending-versions:experience_bullet":
+            return []
+        return [item for row_id, counter in versions.items() for item in (row_id.encode(), counter)]
+
+    return hrandfield
+
+
+@patch("worker.app.tasks.embeddings.fetch_rows")
+@patch("worker.app.tasks.embeddings.get_embedding_provider")
+@patch("worker.app.tasks.embeddings.get_redis_client")
+def test_flush_keeps_pending_ids_when_provider_fails(mock_redis, mock_provider, mock_fetch):
+    """Test ids stay in the pending set when embedding them raises."""
+    redis_client = mock_redis.return_value
+    redis_client.hrandfield.side_effect = _pending({"b1": b"1", "b2": b"1"})
+    mock_fetch.return_value = [{"id": "b1", "bullet": "Built APIs", "embedding_text_hash": None}]
+    mock_provider.return_value.text_hash.return_value = "hash"
+    mock_provider.return_value.embed_batch.side_effect = RuntimeError("provider down")
+
+    with pytest.raises(RuntimeError, match="provider down"):
+        flush_pending_embeddings()
+
+    redis_client.eval.assert_not_called()
+
+
+@patch("worker.app.tasks.embeddings.embed_rows", return_value=2)
+@patch("worker.app.tasks.embeddings.fetch_rows")
+@patch("worker.app.tasks.embeddings.get_embedding_provider")
+@patch("worker.app.tasks.embeddings.get_redis_client")
+def test_flush_removes_ids_after_embedding(mock_redis, mock_provider, mock_fetch, mock_embed):
+    """Test ids are released with the counters read, so re-enqueued ids stay pending."""
+    redis_client = mock_redis.return_value
+    redis_client.hrandfield.side_effect = _pending({"b1": b"1", "b2": b"3"})
+    redis_client.eval.return_value = 0
+
+    assert flush_pending_embeddings() == {"experience_bullet": 2}
+
+    redis_client.eval.assert_called_once_with(
+        RELEASE_PENDING_SCRIPT,
+        1,
+        "embeddings:pending-versions:experience_bullet",
+        "b1",
+        b"1",
+        "b2",
+        b"3",
+    )
+
+
+@patch("worker.app.tasks.embeddings.settings")
+@patch("worker.app.tasks.embeddings.get_embedding_provider")
+def test_backfill_reembeds_rows_with_stale_hashes(mock_provider, mock_settings, mock_supabase):
+    """Test backfill scans every row so edited text is embedded again."""
+    mock_settings.EMBEDDING_BATCH_SIZE = 2
+    provider = LocalEmbeddingProvider(dimension=8)
+    mock_provider.return_value = provider
+    mock_supabase.execute.side_effect = [
+        MagicMock(
+            data=[
+                {"id": "b1", "bullet": "Same", "embedding_text_hash": provider.text_hash("Same")},
+                {"id": "b2", "bullet": "Edited", "embedding_text_hash": provider.text_hash("Old")},
+            ]
+        ),
+        MagicMock(data=None),  # set_embeddings
+        MagicMock(data=[]),
+    ]
+
+    with patch("worker.app.tasks.embeddings.supabase", mock_supabase):
+        assert backfill_embeddings("experience_bullet") == {"experience_bullet": 1}
+
+    mock_supabase.is_.assert_not_called()
+    assert mock_supabase.rpc.call_args.args[1]["p_ids"] == ["b2"]
@@ -0,0 +1,211 @@
+"""Tests for the staged resume generation pipeline."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+import redis
+
+from shared.app.constants import GenerationStage, GenerationStatus
+from worker.app.ai.embeddings import LocalEmbeddingProvider
+from worker.app.celery_app import CPU_QUEUE, IO_QUEUE, celery_app
+from worker.app.core.events import publish_status
+from worker.app.tasks.generate_resume import (
+    compile_resume,
+    generate_content,
+    generation_pipeline,
+    publish_resume,
+)
+
+
+@pytest.fixture(autouse=True)
+def no_status_events():
+    """Keep stage tests from publishing to Redis."""
+    with patch("worker.app.tasks.generate_resume.publish_status") as mock_publish:
+        yield mock_publish
+
+
+def _queue(task_name):
+    return celery_app.amqp.router.route({}, task_name)["queue"].name
+
+
+def test_pipeline_stages_and_routes():
+    """Test the chain order and that only compilation goes to the CPU queue."""
+    pipeline = generation_pipeline("resume-1", bypass_ai_cache=True)
+    names = [task.task for task in pipeline.tasks]
+
+    assert names == [
+        "worker.app.tasks.generate_resume.generate_content",
+        "worker.app.tasks.generate_resume.compile_resume",
+        "worker.app.tasks.generate_resume.publish_resume",
+    ]
+    assert pipeline.tasks[0].args == ("resume-1", True)
+    assert [_queue(name) for name in names] == [IO_QUEUE, CPU_QUEUE, IO_QUEUE]
+    assert _queue("worker.app.tasks.generate_resume.generate_resume") == IO_QUEUE
+    # Only the final stage's result is stored
+    assert [celery_app.tasks[name].ignore_result for name in names] == [True, True, False]
+
+
+@patch("worker.app.tasks.generate_resume.get_redis_client")
+@patch("worker.app.tasks.generate_resume.upload_files")
+@patch("worker.app.tasks.generate_resume.pdf_cache")
+@patch("worker.app.tasks.generate_resume.compile_pdf", return_value=b"%PDF")
+@patch("worker.app.tasks.generate_resume.render_latex", return_value="\\documentclass{article}")
+def test_compile_resume_spools_artifacts(
+    mock_render, mock_compile, mock_cache, mock_upload, mock_redis
+):
+    """Test the compile stage parks the files in Redis and hands off only their key."""
+    mock_cache.get.return_value = None
+    payload = {
+        "generated_resume_id": "resume-1",
+        "user_id": "user-1",
+        "ai_output": {"summary": "x"},
+        "provider": "mock",
+        "model_name": "mock",
+        "prompt_version": "1",
+        "render": {"profile_data": {}, "include_projects": True, "include_skills": True},
+    }
+
+    result = compile_resume(payload)
+
+    assert "render" not in result
+    assert result["artifacts_key"] == "resume-artifacts:resume-1"
+    assert len(result["latex_sha256"]) == 64
+    assert not any(isinstance(value, bytes) for value in result.values())
+    pipe = mock_redis.return_value.pipeline.return_value
+    pipe.hset.assert_called_once_with(
+        "resume-artifacts:resume-1",
+        mapping={"latex": b"\\documentclass{article}", "pdf": b"%PDF"},
+    )
+    pipe.execute.assert_called_once()
+    mock_render.assert_called_once_with(
+        ai_output={"summary": "x"}, profile_data={}, include_projects=True, include_skills=True
+    )
+    mock_cache.put.assert_called_once_with(result["latex_sha256"], b"%PDF")
+    # Uploading is I/O and belongs to the publish stage
+    mock_upload.assert_not_called()
+
+
+@patch("worker.app.tasks.generate_resume.mark_failed")
+@patch("worker.app.tasks.generate_resume.compile_pdf", side_effect=RuntimeError("boom"))
+@patch("worker.app.tasks.generate_resume.render_latex", return_value="latex")
+@patch("worker.app.tasks.generate_resume.pdf_cache")
+def test_compile_resume_failure_marks_failed(mock_cache, mock_render, mock_compile, mock_failed):
+    """Test a failing stage marks the resume FAILED and re-raises."""
+    mock_cache.get.return_value = None
+
+    with pytest.raises(RuntimeError):
+        compile_resume(
+            {"generated_resume_id": "resume-1", "user_id": "u", "ai_output": {}, "render": {}}
+        )
+
+    assert mock_failed.call_args.args[0] == "resume-1"
+
+
+PUBLISH_PAYLOAD = {
+    "generated_resume_id": "resume-1",
+    "user_id": "user-1",
+    "ai_output": {},
+    "provider": "mock",
+    "model_name": "mock",
+    "prompt_version": "1",
+    "artifacts_key": "resume-artifacts:resume-1",
+    "latex_sha256": "hash",
+}
+
+
+@patch("worker.app.tasks.generate_resume.get_redis_client")
+@patch("worker.app.tasks.generate_resume.upload_files")
+@patch("worker.app.tasks.generate_resume.publish_status")
+def test_publish_resume_uploads_spooled_files(mock_publish, mock_upload, mock_redis, mock_supabase):
+    """Test the publish stage uploads the spooled files, records them and reports DONE."""
+    mock_redis.return_value.hgetall.return_value = {b"latex": b"tex", b"pdf": b"%PDF"}
+
+    with patch("worker.app.tasks.generate_resume.supabase", mock_supabase):
+        assert publish_resume(dict(PUBLISH_PAYLOAD))["status"] == "success"
+
+    assert [artifact.data for artifact in mock_upload.call_args.args[0]] == [b"tex", b"%PDF"]
+    name, params = mock_supabase.rpc.call_args.args
+    assert name == "complete_generated_resume"
+    assert [record["storage_key"] for record in params["p_files"]] == [
+        "user-1/resume-1/resume.tex",
+        "user-1/resume-1/resume.pdf",
+    ]
+    mock_redis.return_value.delete.assert_called_once_with("resume-artifacts:resume-1")
+    assert [call.args for call in mock_publish.call_args_list] == [
+        ("resume-1", GenerationStatus.RUNNING, GenerationStage.PUBLISH),
+        ("resume-1", GenerationStatus.DONE),
+    ]
+
+
+@patch("worker.app.tasks.generate_resume.mark_failed")
+@patch("worker.app.tasks.generate_resume.get_redis_client")
+@patch("worker.app.tasks.generate_resume.upload_files")
+def test_publish_resume_fails_when_spool_expired(mock_upload, mock_redis, mock_failed):
+    """Test expired spooled files fail the resume instead of publishing nothing."""
+    mock_redis.return_value.hgetall.return_value = {}
+
+    with pytest.raises(RuntimeError, match="expired"):
+        publish_resume(dict(PUBLISH_PAYLOAD))
+
+    mock_upload.assert_not_called()
+    assert mock_failed.call_args.args[0] == "resume-1"
+
+
+@patch("worker.app.core.events.get_redis_client")
+def test_publish_status_ignores_redis_errors(mock_get_redis):
+    """Test events are best effort and never fail a generation."""
+    mock_get_redis.return_value.publish.side_effect = redis.ConnectionError("down")
+
+    publish_status("resume-1", GenerationStatus.FAILED, failure_reason="boom")
+
+    channel, data = mock_get_redis.return_value.publish.call_args.args
+    assert channel == "resume-events:resume-1"
+    assert '"status":"FAILED"' in data
+
+
+@patch("worker.app.tasks.generate_resume.get_ai_response_cache")
+@patch("worker.app.tasks.generate_resume.get_ai_provider")
+@patch("worker.app.tasks.generate_resume.generate_content_cached", return_value={})
+@patch("worker.app.tasks.generate_resume.get_embedding_provider")
+def test_generate_content_preselects_for_pasted_jd(
+    mock_embeddings, mock_generate, mock_provider, mock_cache, mock_supabase
+):
+    """Test a raw-text JD is embedded on demand and the prompt trimmed to its bullets."""
+    provider = LocalEmbeddingProvider(dimension=64)
+    mock_embeddings.return_value = provider
+    texts = [f"Bullet number {i}" for i in range(10)]
+    snapshot = {
+        "profile": {"name": "Jane"},
+        "experience": [
+            {
+                "id": "exp-1",
+                "experience_bullet": [
+                    {"id": f"b{i}", "bullet": text, "embedding": embedding}
+                    for i, (text, embedding) in enumerate(zip(texts, provider.embed_batch(texts)))
+                ],
+            }
+        ],
+        "projects": [],
+    }
+    mock_supabase.execute.return_value = MagicMock(
+        data=[
+            {
+                "user_id": "user-1",
+                "job_description_id": None,
+                "jd_snapshot": "Bullet number 7",
+                "profile_snapshot": json.dumps(snapshot),
+                "page_count": 1,
+                "include_projects": True,
+                "include_skills": True,
+            }
+        ]
+    )
+
+    with patch("worker.app.tasks.generate_resume.supabase", mock_supabase):
+        generate_content("resume-1")
+
+    sent = mock_generate.call_args.kwargs["profile_snapshot"]["experience"][0]["experience_bullet"]
+    # Page count 1 keeps 3 bullets per experience; the default factor sends twice that
+    assert len(sent) == 6
+    assert "b7" in [bullet["id"] for bullet in sent]
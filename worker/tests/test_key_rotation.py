@@ -0,0 +1,74 @@
+"""Tests for contact re-encryption after a key rotation."""
+
+from unittest.mock import MagicMock, patch
+
+from shared.app.utils.encryption import KeyRing, decode_bytea
+from worker.app.tasks.key_rotation import reencrypt_batch, reencrypt_contacts
+
+OLD_KEY = bytes.fromhex("a" * 64)
+NEW_KEY = bytes.fromhex("b" * 64)
+
+
+def test_reencrypt_batch_writes_current_version_in_one_call(mock_supabase, contact_row):
+    """Test a batch is re-encrypted with the current key and written with one rpc."""
+    keyring = KeyRing({1: OLD_KEY, 2: NEW_KEY})
+    rows = [
+        contact_row(keyring, "c1", "john@example.com"),
+        contact_row(keyring, "c2", "555-0100"),
+        {**contact_row(keyring, "c3", "lost"), "key_version": 9},
+    ]
+    mock_supabase.execute.return_value = MagicMock(data=2)
+
+    assert reencrypt_batch(mock_supabase, keyring, rows) == (2, 1)
+
+    mock_supabase.rpc.assert_called_once()
+    name, params = mock_supabase.rpc.call_args.args
+    assert name == "reencrypt_profile_contacts"
+    assert params["p_ids"] == ["c1", "c2"]
+    assert params["p_old_nonces"] == [rows[0]["nonce"], rows[1]["nonce"]]
+    assert params["p_key_version"] == 2
+    decrypted = [
+        KeyRing({2: NEW_KEY}).decrypt(
+            decode_bytea(ciphertext), decode_bytea(nonce), decode_bytea(auth_tag), 2
+        )
+        for ciphertext, nonce, auth_tag in zip(
+            params["p_ciphertexts"], params["p_nonces"], params["p_auth_tags"]
+        )
+    ]
+    assert decrypted == ["john@example.com", "555-0100"]
+
+
+@patch("worker.app.tasks.key_rotation.get_redis_client")
+@patch("worker.app.tasks.key_rotation.get_keyring")
+def test_reencrypt_contacts_resumes_from_checkpoint(
+    mock_get_keyring, mock_get_redis, mock_supabase, contact_row
+):
+    """Test pages are read after the saved checkpoint and the checkpoint cleared at the end."""
+    keyring = KeyRing({1: OLD_KEY, 2: NEW_KEY})
+    mock_get_keyring.return_value = keyring
+    redis_client = MagicMock()
+    redis_client.get.return_value = b"c0"
+    mock_get_redis.return_value = redis_client
+
+    page = [contact_row(keyring, "c1", "a@b.co"), contact_row(keyring, "c2", "c@d.co")]
+    mock_supabase.execute.side_effect = [
+        MagicMock(data=page),
+        MagicMock(data=2),
+        MagicMock(data=[]),
+    ]
+
+    with patch("worker.app.tasks.key_rotation.supabase", mock_supabase), patch.object(
+        reencrypt_contacts, "update_state"
+    ) as update_state:
+        result = reencrypt_contacts(batch_size=2)
+
+    assert result["scanned"] == 2
+    assert result["updated"] == 2
+    assert result["failed"] == 0
+    assert result["key_version"] == 2
+    assert "rows_per_sec" in result
+    mock_supabase.neq.assert_called_with("key_version", 2)
+    assert [call.args for call in mock_supabase.gt.call_args_list] == [("id", "c0"), ("id", "c2")]
+    redis_client.set.assert_called_once_with("key-rotation:profile_contact:2", "c2")
+    redis_client.delete.assert_called_once_with("key-rotation:profile_contact:2")
+    assert update_state.call_args.kwargs["state"] == "PROGRESS"
@@ -18,3 +18,31 @@ def test_render_latex_basic():
     assert "\\documentclass{resume}" in result
     assert "John Doe" in result
 
+
+def test_template_registry_compiles_once(tmp_path):
+    """Test templates are compiled once per (name, version)."""
+    from worker.app.latex.renderer import TEMPLATE_FILE, TemplateRegistry
+
+    (tmp_path / "simple").mkdir()
+    (tmp_path / "simple" / TEMPLATE_FILE).write_text("Hello {{ name }}")
+    registry = TemplateRegistry(tmp_path)
+
+    first = registry.get("simple", "1.0.0")
+    assert registry.get("simple", "1.0.0") is first
+    assert first.render(name="Jane") == "Hello Jane"
+
+
+def test_template_registry_recompiles_on_version_bump(tmp_path):
+    """Test a new version picks up an edited template file."""
+    from worker.app.latex.renderer import TEMPLATE_FILE, TemplateRegistry
+
+    template_file = tmp_path / "simple" / TEMPLATE_FILE
+    template_file.parent.mkdir()
+    template_file.write_text("Hello {{ name }}")
+    registry = TemplateRegistry(tmp_path)
+    assert registry.get("simple", "1.0.0").render(name="Jane") == "Hello Jane"
+
+    template_file.write_text("Goodbye {{ name }}")
+
+    assert registry.get("simple", "1.1.0").render(name="Jane") == "Goodbye Jane"
+    assert registry.get("simple", "1.0.0").render(name="Jane") == "Hello Jane"
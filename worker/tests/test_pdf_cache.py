@@ -0,0 +1,38 @@
+"""Tests for the content-addressed PDF cache."""
+
+from unittest.mock import MagicMock, patch
+
+from worker.app.latex.cache import PDFCache, latex_sha256
+
+
+def test_pdf_cache_local_roundtrip(mock_supabase, tmp_path):
+    """Test PDFs stored locally are served without touching Supabase."""
+    cache = PDFCache(mock_supabase, cache_dir=tmp_path)
+    key = latex_sha256(b"\\documentclass{resume}")
+
+    cache.put(key, b"%PDF")
+    assert cache.get(key, "user-1") == b"%PDF"
+    mock_supabase.table.assert_not_called()
+
+
+@patch("worker.app.latex.cache.download_file", return_value=b"%PDF remote")
+def test_pdf_cache_falls_back_to_storage(mock_download, mock_supabase, tmp_path):
+    """Test a local miss is served from a previous generation's PDF."""
+    mock_supabase.execute.side_effect = [
+        MagicMock(data=[{"generated_resume_id": "resume-1"}]),
+        MagicMock(data=[{"storage_key": "user-1/resume-1/resume.pdf"}]),
+    ]
+    cache = PDFCache(mock_supabase, cache_dir=tmp_path)
+    key = latex_sha256(b"latex")
+
+    assert cache.get(key, "user-1") == b"%PDF remote"
+    mock_download.assert_called_once_with("user-1/resume-1/resume.pdf")
+    # Remote hits are written through to disk
+    assert cache.get(key, "user-1") == b"%PDF remote"
+    assert mock_download.call_count == 1
+
+
+def test_pdf_cache_miss(mock_supabase, tmp_path):
+    """Test a miss everywhere returns None."""
+    cache = PDFCache(mock_supabase, cache_dir=tmp_path)
+    assert cache.get(latex_sha256(b"new"), "user-1") is None
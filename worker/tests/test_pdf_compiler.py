@@ -22,3 +22,121 @@ def test_compile_pdf_timeout():
         # This will fail in real environment, but tests the error handling
         pass
 
+
+def _fake_tectonic(command, **kwargs):
+    """Write a PDF next to the .tex file like Tectonic would."""
+    from pathlib import Path
+
+    tex_file = Path(command[-1])
+    tex_file.with_suffix(".pdf").write_bytes(b"%PDF-1.5 " + tex_file.read_bytes())
+    return MagicMock(returncode=0)
+
+
+@patch("worker.app.latex.compiler.subprocess.run", side_effect=_fake_tectonic)
+def test_compile_engine_reuses_workspaces(mock_subprocess, tmp_path):
+    """Test compiles run in pooled workspaces seeded with class files."""
+    from worker.app.latex.compiler import CompileEngine
+
+    class_file = tmp_path / "resume.cls"
+    class_file.write_text("% class")
+    engine = CompileEngine(pool_size=1, cache_dir=str(tmp_path / "cache"), class_files=[class_file])
+    try:
+        assert engine.compile("first") == b"%PDF-1.5 first"
+        assert engine.compile("second") == b"%PDF-1.5 second"
+
+        workspaces = {call.kwargs["cwd"] for call in mock_subprocess.call_args_list}
+        assert len(workspaces) == 1
+        assert (tmp_path / "cache").is_dir()
+        assert mock_subprocess.call_args.kwargs["env"]["TECTONIC_CACHE_DIR"] == str(
+            tmp_path / "cache"
+        )
+        assert engine.stats() == {"pool_size": 1, "in_flight": 0, "queue_depth": 0}
+    finally:
+        engine.close()
+
+
+@patch("worker.app.latex.compiler.subprocess.run", side_effect=_fake_tectonic)
+def test_compile_engine_only_cached_after_warm(mock_subprocess):
+    """Test warmed engines compile without network access."""
+    from worker.app.latex.compiler import CompileEngine
+
+    engine = CompileEngine(pool_size=1)
+    try:
+        assert engine.warm()
+        engine.compile("doc")
+        assert "--only-cached" in mock_subprocess.call_args.args[0]
+    finally:
+        engine.close()
+
+
+def test_compile_engine_retries_cache_miss_with_network():
+    """Test an offline cache miss is retried once without --only-cached."""
+    import subprocess
+
+    from worker.app.latex.compiler import CompileEngine
+
+    def miss_then_compile(command, **kwargs):
+        if "--only-cached" in command:
+            raise subprocess.CalledProcessError(1, command, stderr="not in cache")
+        return _fake_tectonic(command, **kwargs)
+
+    engine = CompileEngine(pool_size=1)
+    engine.warmed = True
+    try:
+        with patch(
+            "worker.app.latex.compiler.subprocess.run", side_effect=miss_then_compile
+        ) as mock_subprocess:
+            assert engine.compile("doc") == b"%PDF-1.5 doc"
+        assert mock_subprocess.call_count == 2
+        assert "--only-cached" not in mock_subprocess.call_args.args[0]
+    finally:
+        engine.close()
+
+
+@patch("worker.app.latex.compiler.render_latex", side_effect=ValueError("bad template"))
+def test_warmup_falls_back_when_templates_fail_to_render(mock_render):
+    """Test warm-up still compiles a document when no template renders."""
+    from worker.app.latex.compiler import WARMUP_DOCUMENT, warmup_documents
+
+    assert warmup_documents() == [WARMUP_DOCUMENT]
+
+
+@patch("worker.app.latex.compiler.subprocess.run", side_effect=_fake_tectonic)
+def test_compile_engine_warms_in_background(mock_subprocess):
+    """Test background warm-up compiles the rendered templates off the calling thread."""
+    from worker.app.latex.compiler import CompileEngine
+
+    engine = CompileEngine(pool_size=1)
+    try:
+        engine.warm_in_background().join(timeout=5)
+        assert engine.warmed
+        assert mock_subprocess.called
+    finally:
+        engine.close()
+
+
+def test_close_compile_engine_removes_workspaces():
+    """Test closing the per-process engine removes its temp directory."""
+    from worker.app.latex import compiler
+
+    engine = compiler.get_compile_engine()
+    root = engine._root
+    assert root.is_dir()
+
+    compiler.close_compile_engine()
+
+    assert not root.exists()
+    assert compiler._engine is None
+
+
+@patch("worker.app.latex.compiler.atexit.register")
+def test_init_compile_process_warms_and_registers_close(mock_register):
+    """Test the pool initializer warms the process' engine and closes it at exit."""
+    from worker.app.latex import compiler
+
+    engine = MagicMock()
+    with patch.object(compiler, "get_compile_engine", return_value=engine):
+        compiler.init_compile_process()
+
+    engine.warm.assert_called_once_with()
+    mock_register.assert_called_once_with(compiler.close_compile_engine)
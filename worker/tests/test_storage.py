@@ -0,0 +1,59 @@
+"""Tests for artifact uploads."""
+
+import hashlib
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from worker.app.storage.client import Artifact, upload_files
+
+
+def test_artifact_record_uses_known_hash():
+    """Test sizes come from the buffer and a known SHA-256 is not recomputed."""
+    pdf = Artifact.from_bytes("PDF", "u/r/resume.pdf", b"%PDF", "application/pdf")
+    latex = Artifact.from_bytes("LATEX", "u/r/resume.tex", b"tex", "text/x-latex", sha256="known")
+
+    assert pdf.file_record() == {
+        "type": "PDF",
+        "storage_key": "u/r/resume.pdf",
+        "mime_type": "application/pdf",
+        "size_bytes": 4,
+        "sha256": hashlib.sha256(b"%PDF").hexdigest(),
+    }
+    assert latex.file_record()["sha256"] == "known"
+
+
+@patch("worker.app.storage.client.get_storage_client")
+def test_upload_files_runs_concurrently(mock_get_client):
+    """Test both uploads are in flight at the same time."""
+    barrier = threading.Barrier(2, timeout=5)
+    bucket = MagicMock()
+    bucket.upload.side_effect = lambda *args, **kwargs: barrier.wait()
+    mock_get_client.return_value.storage.from_.return_value = bucket
+
+    upload_files(
+        [
+            Artifact.from_bytes("LATEX", "a.tex", b"tex", "text/x-latex"),
+            Artifact.from_bytes("PDF", "a.pdf", b"%PDF", "application/pdf"),
+        ]
+    )
+
+    assert sorted(call.args[0] for call in bucket.upload.call_args_list) == ["a.pdf", "a.tex"]
+
+
+@patch("worker.app.storage.client.get_storage_client")
+def test_upload_files_raises_upload_error(mock_get_client):
+    """Test a failed upload is re-raised after the others finish."""
+    bucket = MagicMock()
+    bucket.upload.side_effect = [None, RuntimeError("storage down")]
+    mock_get_client.return_value.storage.from_.return_value = bucket
+
+    with pytest.raises(RuntimeError, match="storage down"):
+        upload_files(
+            [
+                Artifact.from_bytes("LATEX", "a.tex", b"tex", "text/x-latex"),
+                Artifact.from_bytes("PDF", "a.pdf", b"%PDF", "application/pdf"),
+            ]
+        )
+    assert bucket.upload.call_count == 2